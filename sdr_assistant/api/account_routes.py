@@ -1,15 +1,28 @@
 """
 API routes for account management functionality.
 """
-from flask import Blueprint, jsonify, request
-from typing import Dict, Any
+import json
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from typing import Dict, Any, Iterator, List
 
 from ..core.auth import auth_manager
 from ..core.accounts import account_manager
+from ..models.account import Account
 
 
 accounts_bp = Blueprint("accounts", __name__)
 
+# Typeahead result limits for /accounts/search
+DEFAULT_SEARCH_RESULTS = 10
+MAX_SEARCH_RESULTS = 50
+
+# Page size limits for /accounts/details
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Accounts serialized per chunk of a streamed response
+STREAM_CHUNK_SIZE = 100
+
 
 @accounts_bp.route("/accounts", methods=["GET"])
 @accounts_bp.route("/accounts/list", methods=["GET"])
@@ -17,17 +30,13 @@ def get_accounts():
     """
     API Route: Retrieve accounts
     
-    Fetches accounts from Airtable or returns mock account data.
+    Fetches account names from Airtable or returns mock account data. Only the
+    name field is requested from Airtable unless the full list is already cached.
     
     Returns:
         JSON array of accounts with 'id' and 'name' properties
     """
-    accounts = account_manager.get_accounts()
-    
-    # Convert to simple format with just id and name
-    account_list = [{"id": account.id, "name": account.name} for account in accounts]
-    
-    return jsonify(account_list)
+    return jsonify(account_manager.get_account_names())
 
 
 @accounts_bp.route("/accounts/details", methods=["GET"])
@@ -36,13 +45,101 @@ def get_account_details():
     API Route: Get detailed account information
     
     Returns accounts with additional details like industry, employees, and location.
+    The response is streamed, so memory use does not grow with the number of accounts.
+    
+    Query parameters:
+        limit: Page size (default 100, at most 1000); returns one page instead of every account
+        cursor: "nextCursor" of the previous page
+        format: "ndjson" to stream one account per line (also selected by Accept: application/x-ndjson)
+    
+    Returns:
+        JSON array of account objects with detailed information; with limit or cursor, a JSON
+        object with 'accounts' and 'nextCursor' (null on the last page). In NDJSON mode the
+        next cursor of a page is sent in the X-Next-Cursor header instead.
+    """
+    ndjson = (request.args.get("format") == "ndjson"
+              or "application/x-ndjson" in request.headers.get("Accept", ""))
+    headers = {}
+    
+    if "limit" in request.args or "cursor" in request.args:
+        try:
+            limit = min(MAX_PAGE_SIZE, max(1, int(request.args.get("limit", DEFAULT_PAGE_SIZE))))
+        except ValueError:
+            return jsonify({"success": False, "message": "limit must be an integer"}), 400
+        
+        try:
+            accounts, next_cursor = account_manager.get_accounts_page(request.args.get("cursor"), limit)
+        except ValueError:
+            return jsonify({"success": False, "message": "Invalid cursor"}), 400
+        
+        if not ndjson:
+            return jsonify({"accounts": [account.to_dict() for account in accounts], "nextCursor": next_cursor})
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+    else:
+        accounts = account_manager.get_accounts()
+    
+    if ndjson:
+        return Response(stream_with_context(_stream_ndjson(accounts)), mimetype="application/x-ndjson",
+                        headers=headers)
+    return Response(stream_with_context(_stream_json_array(accounts)), mimetype="application/json")
+
+
+def _stream_json_array(accounts: List[Account]) -> Iterator[str]:
+    """Serialize accounts as a JSON array, a chunk of accounts at a time."""
+    yield "["
+    for start in range(0, len(accounts), STREAM_CHUNK_SIZE):
+        chunk = ",".join(json.dumps(account.to_dict()) for account in accounts[start:start + STREAM_CHUNK_SIZE])
+        yield chunk if start == 0 else "," + chunk
+    yield "]"
+
+
+def _stream_ndjson(accounts: List[Account]) -> Iterator[str]:
+    """Serialize accounts as newline-delimited JSON, a chunk of accounts at a time."""
+    for start in range(0, len(accounts), STREAM_CHUNK_SIZE):
+        yield "".join(json.dumps(account.to_dict()) + "\n" for account in accounts[start:start + STREAM_CHUNK_SIZE])
+
+
+@accounts_bp.route("/accounts/search", methods=["GET"])
+def search_accounts():
+    """
+    API Route: Search accounts
+    
+    Typeahead search over account names, name variants and domains. Takes the
+    partial name as "q" and an optional "limit" (default 10, at most 50).
+    
+    Returns:
+        JSON array of the best matching accounts with 'id', 'name', 'industry' and 'website' properties
+    """
+    query = request.args.get("q", "")
+    try:
+        limit = min(MAX_SEARCH_RESULTS, max(1, int(request.args.get("limit", DEFAULT_SEARCH_RESULTS))))
+    except ValueError:
+        return jsonify({"success": False, "message": "limit must be an integer"}), 400
+    
+    accounts = account_manager.search_accounts(query, limit)
+    
+    return jsonify([
+        {"id": account.id, "name": account.name, "industry": account.industry, "website": account.website}
+        for account in accounts
+    ])
+
+
+@accounts_bp.route("/accounts/refresh", methods=["POST"])
+def refresh_accounts():
+    """
+    API Route: Refresh accounts
+    
+    Drops the cached account list, e.g. after accounts were edited in Airtable,
+    and fetches it again. Requires a signed-in user, and concurrent refreshes
+    share one fetch.
     
     Returns:
-        JSON array of account objects with detailed information
+        JSON with success status and the number of accounts, or 401 without a valid token
     """
-    accounts = account_manager.get_accounts()
+    if not auth_manager.get_current_user(request.headers):
+        return jsonify({"success": False, "message": "Unauthorized"}), 401
     
-    # Convert to detailed format
-    account_details = [account.to_dict() for account in accounts]
+    accounts = account_manager.refresh_accounts()
     
-    return jsonify(account_details)
+    return jsonify({"success": True, "count": len(accounts)})
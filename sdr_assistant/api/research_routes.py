@@ -1,15 +1,27 @@
 """
 API routes for research generation and management.
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from typing import Dict, Any
+import json
 
+from ..config.settings import settings
 from ..core.auth import auth_manager
+from ..core.job_queue import get_job_queue
 from ..core.research import research_manager
+from ..core.batch import batch_research_manager
+from ..utils.deadline import from_budget
 
 
 research_bp = Blueprint("research", __name__)
 
+# Fields each saved research entry must include
+REQUIRED_RESEARCH_FIELDS = ["accountId", "accountName", "industryInsights",
+                            "companyInsights", "visionInsights", "recommendedTalkTrack"]
+
+# Most research entries one /research/save-batch request may save
+MAX_SAVE_BATCH = 500
+
 
 @research_bp.route("/generate-research", methods=["POST"])
 def generate_research():
@@ -17,10 +29,16 @@ def generate_research():
     API Route: Generate Research
     
     Accepts a POST request with an account name and generates insights and a talk track.
+    Cached research is returned when available unless "forceRefresh" is set.
+    
+    Generation must finish within RESEARCH_DEADLINE seconds. If it does not, the
+    sections that finished are returned with "partial": true and the others listed
+    in "incompleteSections".
     
     Returns:
         JSON with industry insights, company insights, vision insights, and recommended talk track
     """
+    deadline = from_budget(settings.RESEARCH_DEADLINE)
     data = request.json
     
     if not data:
@@ -31,7 +49,21 @@ def generate_research():
     if not account_name:
         return jsonify({"success": False, "message": "Account name is required"}), 400
     
-    result = research_manager.generate_research(account_name)
+    force_refresh = bool(data.get("forceRefresh", False))
+    
+    if settings.RESEARCH_QUEUE_ENABLED:
+        # Run generation on a worker and wait briefly; slow jobs are polled via their job ID
+        job = research_manager.enqueue_research(account_name, force_refresh=force_refresh)
+        job = get_job_queue().wait(job.id, settings.RESEARCH_QUEUE_WAIT)
+        
+        if job.status != "completed":
+            if job.status == "failed":
+                return jsonify({"success": False, "message": job.error, "jobId": job.id}), 500
+            return jsonify(dict(job.to_dict(), success=True)), 202
+        
+        result = job.result
+    else:
+        result = research_manager.generate_research(account_name, force_refresh=force_refresh, deadline=deadline)
     
     if not result["success"]:
         return jsonify(result), 400
@@ -39,6 +71,43 @@ def generate_research():
     return jsonify(result)
 
 
+@research_bp.route("/generate-research/stream", methods=["GET", "POST"])
+def generate_research_stream():
+    """
+    API Route: Generate Research (streaming)
+    
+    Streams research as Server-Sent Events. Accepts the account name either as
+    "accountName" in a JSON body (POST) or as a query parameter (GET, for EventSource).
+    
+    Events:
+        section: {"section": "industry" | "company" | "vision", "content": markdown}
+        talk_track: {"delta": next fragment of the talk track}
+        done: the same JSON document /generate-research returns
+        error: {"success": false, "message": ...}
+    
+    Returns:
+        text/event-stream response
+    """
+    data = request.get_json(silent=True) or {}
+    
+    account_name = data.get("accountName") or request.args.get("accountName")
+    
+    if not account_name:
+        return jsonify({"success": False, "message": "Account name is required"}), 400
+    
+    force_refresh = bool(data.get("forceRefresh", False)) or request.args.get("forceRefresh", "").lower() in ("true", "1")
+    
+    def generate():
+        for event, payload in research_manager.stream_research(account_name, force_refresh=force_refresh):
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @research_bp.route("/save-to-airtable", methods=["POST"])
 def save_research():
     """
@@ -54,10 +123,7 @@ def save_research():
     if not data:
         return jsonify({"success": False, "message": "No data provided"}), 400
     
-    required_fields = ["accountId", "accountName", "industryInsights", 
-                      "companyInsights", "visionInsights", "recommendedTalkTrack"]
-    
-    for field in required_fields:
+    for field in REQUIRED_RESEARCH_FIELDS:
         if field not in data:
             return jsonify({"success": False, "message": f"Field '{field}' is required"}), 400
     
@@ -68,3 +134,137 @@ def save_research():
     result = research_manager.save_research(data, user_id)
     
     return jsonify(result)
+
+
+@research_bp.route("/research/save-batch", methods=["POST"])
+def save_research_batch():
+    """
+    API Route: Save research for many accounts to Airtable
+    
+    Accepts a "research" list whose entries have the fields /save-to-airtable takes.
+    Entries are upserted on Account ID, 10 records per Airtable request.
+    
+    Returns:
+        JSON with success status, message and the number of records created and updated
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get("research")
+    
+    if not isinstance(items, list) or not items:
+        return jsonify({"success": False, "message": "A non-empty 'research' list is required"}), 400
+    
+    if len(items) > MAX_SAVE_BATCH:
+        return jsonify({"success": False, "message": f"At most {MAX_SAVE_BATCH} research entries per batch"}), 400
+    
+    for index, item in enumerate(items):
+        missing = [field for field in REQUIRED_RESEARCH_FIELDS if not isinstance(item, dict) or field not in item]
+        if missing:
+            return jsonify({"success": False, "message": f"Entry {index}: field '{missing[0]}' is required"}), 400
+    
+    # Get current user if authenticated
+    user = auth_manager.get_current_user(request.headers)
+    user_id = user["id"] if user else None
+    
+    result = research_manager.save_research_batch(items, user_id)
+    
+    return jsonify(result)
+
+
+@research_bp.route("/research/batch", methods=["POST"])
+def start_batch_research():
+    """
+    API Route: Start a batch research job
+    
+    Accepts "accountNames" and/or "accountIds" lists, plus optional "concurrency"
+    and "forceRefresh". Research runs in the background on a bounded worker pool.
+    
+    Returns:
+        JSON with the job ID and initial job status (202 Accepted)
+    """
+    data = request.json
+    
+    if not data:
+        return jsonify({"success": False, "message": "No data provided"}), 400
+    
+    account_names = data.get("accountNames") or []
+    account_ids = data.get("accountIds") or []
+    
+    if not isinstance(account_names, list) or not isinstance(account_ids, list):
+        return jsonify({"success": False, "message": "accountNames and accountIds must be lists"}), 400
+    
+    concurrency = data.get("concurrency")
+    if concurrency is not None and not isinstance(concurrency, int):
+        return jsonify({"success": False, "message": "concurrency must be an integer"}), 400
+    
+    user = auth_manager.get_current_user(request.headers)
+    
+    try:
+        job = batch_research_manager.submit(
+            account_names=account_names,
+            account_ids=account_ids,
+            concurrency=concurrency,
+            force_refresh=bool(data.get("forceRefresh", False)),
+            user_id=user["id"] if user else None
+        )
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    return jsonify(dict(job.to_dict(include_results=False), success=True)), 202
+
+
+@research_bp.route("/research/batch/<job_id>", methods=["GET"])
+def get_batch_research(job_id):
+    """
+    API Route: Get batch research job status
+    
+    Returns:
+        JSON with overall job status and per-account status and results
+    """
+    job = batch_research_manager.get_job(job_id)
+    
+    if not job:
+        return jsonify({"success": False, "message": f"Batch job '{job_id}' not found"}), 404
+    
+    return jsonify(dict(job.to_dict(), success=True))
+
+
+@research_bp.route("/research/jobs", methods=["POST"])
+def enqueue_research_job():
+    """
+    API Route: Queue research generation
+    
+    Accepts a POST request with an account name and queues research generation
+    for a worker process. Requests for an account that is already queued share its job.
+    
+    Returns:
+        JSON with the job ID and status (HTTP 202)
+    """
+    data = request.json
+    
+    if not data:
+        return jsonify({"success": False, "message": "No data provided"}), 400
+    
+    account_name = data.get("accountName")
+    
+    if not account_name:
+        return jsonify({"success": False, "message": "Account name is required"}), 400
+    
+    job = research_manager.enqueue_research(account_name, force_refresh=bool(data.get("forceRefresh", False)))
+    
+    return jsonify(dict(job.to_dict(), success=True)), 202
+
+
+@research_bp.route("/research/jobs/<job_id>", methods=["GET"])
+def get_research_job(job_id):
+    """
+    API Route: Get queued research job status
+    
+    Returns:
+        JSON with the job status and, once completed, the research result
+    """
+    job = get_job_queue().get(job_id)
+    
+    if not job:
+        return jsonify({"success": False, "message": f"Job '{job_id}' not found"}), 404
+    
+    return jsonify(dict(job.to_dict(), success=True))
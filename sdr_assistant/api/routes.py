@@ -8,6 +8,10 @@ from .auth_routes import auth_bp
 from .account_routes import accounts_bp
 from .research_routes import research_bp
 from .library_routes import library_bp
+from ..services.airtable_service import airtable_circuit_breaker
+from ..services.http_client import get_pool_stats
+from ..services.openai_service import openai_circuit_breaker, openai_hedger, openai_rate_limiter
+from ..services.perplexity_service import perplexity_circuit_breaker, perplexity_hedger, perplexity_rate_limiter
 
 
 # Create main API blueprint
@@ -30,6 +34,39 @@ def api_root():
     })
 
 
+@api_bp.route("/status/http-pools", methods=["GET"])
+def http_pool_status():
+    """
+    API route for outbound HTTP connection pool utilisation.
+    """
+    return jsonify({"success": True, "pools": get_pool_stats()})
+
+
+@api_bp.route("/status/providers", methods=["GET"])
+def provider_status():
+    """
+    API route for provider circuit breaker state, remaining rate-limit budget and hedging.
+    """
+    return jsonify({
+        "success": True,
+        "providers": {
+            "perplexity": {
+                "circuit": perplexity_circuit_breaker.stats(),
+                "rateLimit": perplexity_rate_limiter.stats(),
+                "hedging": perplexity_hedger.stats()
+            },
+            "openai": {
+                "circuit": openai_circuit_breaker.stats(),
+                "rateLimit": openai_rate_limiter.stats(),
+                "hedging": openai_hedger.stats()
+            },
+            "airtable": {
+                "circuit": airtable_circuit_breaker.stats()
+            }
+        }
+    })
+
+
 def register_routes(app):
     """
     Register all routes with the Flask application.
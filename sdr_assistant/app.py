@@ -26,6 +26,7 @@ from sdr_assistant.config.settings import settings
 
 # Import route registrar
 from sdr_assistant.api.routes import register_routes
+from sdr_assistant.services.http_client import start_warm_up
 
 # Configure logging
 logging.basicConfig(
@@ -63,6 +64,10 @@ def create_app():
     logger.info(f"Perplexity API configured: {'Yes' if settings.PERPLEXITY_API_KEY else 'No'}")
     logger.info(f"OpenAI API configured: {'Yes' if settings.OPENAI_API_KEY else 'No'}")
     
+    # Open provider connections in the background so the first calls skip the handshake
+    if settings.HTTP_CLIENT_WARMUP:
+        start_warm_up()
+    
     return app
 
 
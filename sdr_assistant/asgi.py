@@ -0,0 +1,255 @@
+"""
+ASGI entry point for the SDR Research Assistant.
+
+Research generation is served natively on the event loop with the async
+provider services, so one process can hold hundreds of concurrent generations
+without a thread per request. Every other route is served by the existing
+Flask blueprints on a pool of ASGI_WSGI_THREADS threads.
+
+Run with:
+    uvicorn sdr_assistant.asgi:app --port 5005
+"""
+import asyncio
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sdr_assistant.app import app as flask_app
+from sdr_assistant.config.settings import settings
+from sdr_assistant.core.async_research import async_research_manager
+from sdr_assistant.core.job_queue import get_job_queue
+from sdr_assistant.core.research import research_manager
+from sdr_assistant.models.job import Job
+from sdr_assistant.services.http_client import close_async_client
+from sdr_assistant.utils.deadline import from_budget
+
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+
+class WsgiBridge:
+    """
+    Serve a WSGI application from ASGI, one request per pool thread.
+
+    Unlike asgiref's WsgiToAsgi, requests do not share a single thread, so
+    concurrent and keep-alive requests are served in parallel. Response chunks
+    are sent as the application yields them, so streamed routes stay streamed.
+    """
+
+    def __init__(self, wsgi_app: Callable, threads: int):
+        """
+        Initialize the bridge.
+
+        Args:
+            wsgi_app: WSGI application to serve
+            threads: Most requests served at once
+        """
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="wsgi")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive)
+        if body is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self._run, self._environ(scope, body), loop, send)
+
+    def _run(self, environ: Dict[str, Any], loop: asyncio.AbstractEventLoop, send: Send) -> None:
+        """Run the WSGI application on a pool thread, sending its response through the event loop."""
+        status_and_headers: List[Any] = []
+        started = False
+
+        def send_sync(message: Dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info: Any = None) -> Callable:
+            if exc_info and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            status_and_headers[:] = [status, headers]
+            return write
+
+        def start() -> None:
+            nonlocal started
+            if not started:
+                status, headers = status_and_headers
+                send_sync({
+                    "type": "http.response.start",
+                    "status": int(status.split(" ", 1)[0]),
+                    "headers": [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+                })
+                started = True
+
+        def write(chunk: bytes) -> None:
+            start()
+            send_sync({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        result: Iterable[bytes] = self.wsgi_app(environ, start_response)
+        try:
+            for chunk in result:
+                if chunk:
+                    write(chunk)
+            start()
+            send_sync({"type": "http.response.body", "body": b""})
+        finally:
+            close = getattr(result, "close", None)
+            if callable(close):
+                close()
+
+    @staticmethod
+    def _environ(scope: Scope, body: bytes) -> Dict[str, Any]:
+        """Build the WSGI environ of a request."""
+        server = scope.get("server") or ("localhost", 80)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode('utf-8').decode('latin-1'),
+            "PATH_INFO": scope["path"].encode('utf-8').decode('latin-1'),
+            "QUERY_STRING": scope.get("query_string", b"").decode('latin-1'),
+            "SERVER_NAME": str(server[0]),
+            "SERVER_PORT": str(server[1] or 80),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False
+        }
+
+        if scope.get("client"):
+            environ["REMOTE_ADDR"], environ["REMOTE_PORT"] = scope["client"][0], str(scope["client"][1])
+
+        for name, value in scope.get("headers", []):
+            key = name.decode('latin-1').upper().replace("-", "_")
+            value = value.decode('latin-1')
+            if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                key = f"HTTP_{key}"
+                if key in environ:
+                    value = f"{environ[key]},{value}"
+            environ[key] = value
+
+        return environ
+
+
+wsgi_app = WsgiBridge(flask_app, settings.ASGI_WSGI_THREADS)
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    """
+    ASGI application.
+
+    Args:
+        scope: Connection scope
+        receive: Callable returning the next ASGI event
+        send: Callable sending an ASGI event
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] == "/api/generate-research":
+        await _generate_research(receive, send)
+        return
+
+    await wsgi_app(scope, receive, send)
+
+
+async def _lifespan(receive: Receive, send: Send) -> None:
+    """Handle startup and shutdown, closing pooled connections on shutdown."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await close_async_client()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def _generate_research(receive: Receive, send: Send) -> None:
+    """Async equivalent of the /api/generate-research Flask route."""
+    deadline = from_budget(settings.RESEARCH_DEADLINE)
+    body = await _read_body(receive)
+    if body is None:
+        return
+
+    try:
+        data = json.loads(body) if body else None
+    except ValueError:
+        data = None
+
+    if not data:
+        await _send_json(send, 400, {"success": False, "message": "No data provided"})
+        return
+
+    account_name = data.get("accountName")
+
+    if not account_name:
+        await _send_json(send, 400, {"success": False, "message": "Account name is required"})
+        return
+
+    force_refresh = bool(data.get("forceRefresh", False))
+
+    if settings.RESEARCH_QUEUE_ENABLED:
+        # Run generation on a worker and wait briefly; slow jobs are polled via their job ID
+        job = await asyncio.to_thread(research_manager.enqueue_research, account_name, force_refresh)
+        job = await _wait_for_job(job.id, settings.RESEARCH_QUEUE_WAIT)
+
+        if job.status != "completed":
+            if job.status == "failed":
+                await _send_json(send, 500, {"success": False, "message": job.error, "jobId": job.id})
+            else:
+                await _send_json(send, 202, dict(job.to_dict(), success=True))
+            return
+
+        result = job.result
+    else:
+        result = await async_research_manager.generate_research(account_name, force_refresh=force_refresh, deadline=deadline)
+
+    await _send_json(send, 200 if result["success"] else 400, result)
+
+
+async def _read_body(receive: Receive) -> Optional[bytes]:
+    """Read the full request body, or return None if the client disconnected first."""
+    body = b""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def _wait_for_job(job_id: str, timeout: float, poll_interval: float = 0.25) -> Optional[Job]:
+    """Async equivalent of JobQueue.wait: poll a job until it finishes without blocking the event loop."""
+    queue = get_job_queue()
+    deadline = time.monotonic() + timeout
+    job = await asyncio.to_thread(queue.get, job_id)
+    while job and not job.finished and time.monotonic() < deadline:
+        await asyncio.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+        job = await asyncio.to_thread(queue.get, job_id)
+    return job
+
+
+async def _send_json(send: Send, status: int, payload: Dict[str, Any]) -> None:
+    """Send a JSON response with the same CORS header Flask-CORS adds."""
+    body = json.dumps(payload).encode('utf-8')
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode('ascii')),
+            (b"access-control-allow-origin", b"*")
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,342 @@
+"""
+HTTP load test for the API endpoints.
+
+Starts the fake providers and an app server wired to them (or targets a running
+instance), drives each scenario with a fixed number of concurrent clients, and
+reports throughput, latency percentiles and error rate. Results are written as
+JSON so runs can be compared across versions.
+
+Run with:
+    python -m sdr_assistant.benchmarks.loadtest --concurrency 16 --duration 30 --output results.json
+    python -m sdr_assistant.benchmarks.loadtest --compare baseline.json results.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from sdr_assistant.config.settings import settings
+
+
+LOGIN_EMAIL = "demo@codeium.com"
+LOGIN_PASSWORD = "password123"
+
+# Each scenario builds the (method, path, JSON body) of its next request
+Scenario = Callable[[random.Random, List[str]], Tuple[str, str, Optional[Dict[str, Any]]]]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "research": lambda rng, names: ("POST", "/api/generate-research", {"accountName": rng.choice(names)}),
+    "research-cold": lambda rng, names: (
+        "POST", "/api/generate-research", {"accountName": rng.choice(names), "forceRefresh": True}
+    ),
+    "accounts": lambda rng, names: ("GET", "/api/accounts", None),
+    "account-details": lambda rng, names: ("GET", "/api/accounts/details", None),
+    "login": lambda rng, names: ("POST", "/api/login", {"email": LOGIN_EMAIL, "password": LOGIN_PASSWORD}),
+    "library": lambda rng, names: ("GET", "/api/library", None)
+}
+
+DEFAULT_SCENARIOS = ["research", "accounts", "account-details", "login", "library"]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Values to rank
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The percentile, or 0.0 for no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    """
+    Summarize one scenario run.
+
+    Args:
+        latencies: Latency of every completed request, in seconds
+        errors: Requests that failed or returned a non-2xx status
+        elapsed: Wall-clock duration of the run, in seconds
+
+    Returns:
+        Dictionary with request count, throughput, error rate and latency percentiles in milliseconds
+    """
+    requests_sent = len(latencies)
+    return {
+        "requests": requests_sent,
+        "errors": errors,
+        "errorRate": errors / requests_sent if requests_sent else 0.0,
+        "throughput": requests_sent / elapsed if elapsed > 0 else 0.0,
+        "latencyMs": {
+            "mean": 1000 * sum(latencies) / requests_sent if requests_sent else 0.0,
+            "p50": 1000 * percentile(latencies, 0.50),
+            "p95": 1000 * percentile(latencies, 0.95),
+            "p99": 1000 * percentile(latencies, 0.99),
+            "max": 1000 * max(latencies, default=0.0)
+        }
+    }
+
+
+def run_scenario(base_url: str, scenario: Scenario, concurrency: int, duration: float,
+                 account_names: Optional[List[str]] = None, timeout: float = 120.0,
+                 seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Drive one scenario with a closed loop of concurrent clients.
+
+    Each client sends its next request as soon as the previous one finishes,
+    over its own keep-alive connection, until the duration has passed.
+
+    Args:
+        base_url: Base URL of the app
+        scenario: Builder for the scenario's requests
+        concurrency: Number of concurrent clients
+        duration: How long to send requests for, in seconds
+        account_names: Account names research requests pick from
+        timeout: Per-request timeout, in seconds
+        seed: Seed for the account choices
+
+    Returns:
+        Summary from summarize()
+    """
+    names = account_names or ["Acme Corporation"]
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)
+        session = requests.Session()
+        while time.monotonic() < stop_at:
+            method, path, body = scenario(rng, names)
+            start = time.monotonic()
+            try:
+                response = session.request(method, f"{base_url}{path}", json=body, timeout=timeout)
+                failed = not response.ok
+            except requests.RequestException:
+                failed = True
+            latency = time.monotonic() - start
+            with lock:
+                latencies.append(latency)
+                errors[0] += failed
+        session.close()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=client, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return summarize(latencies, errors[0], time.monotonic() - started)
+
+
+def _free_port() -> int:
+    """Pick an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(server: str, environment: Dict[str, str], port: int) -> subprocess.Popen:
+    """
+    Start the app in a separate process so the load generator does not share its interpreter.
+
+    Args:
+        server: "wsgi" for the threaded Flask server or "asgi" for uvicorn
+        environment: Extra environment variables, e.g. the fake provider URLs
+        port: Port to listen on
+
+    Returns:
+        The server process, once it accepts connections
+
+    Raises:
+        RuntimeError: If the server does not come up
+    """
+    if server == "asgi":
+        command = [sys.executable, "-m", "uvicorn", "sdr_assistant.asgi:app", "--port", str(port), "--log-level", "warning"]
+    else:
+        command = [sys.executable, "-m", "flask", "--app", "sdr_assistant.app", "run", "--port", str(port),
+                   "--no-reload", "--no-debugger", "--with-threads"]
+
+    env = dict(os.environ, **environment, HTTP_CLIENT_WARMUP="False")
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App server exited with status {process.returncode}")
+        try:
+            requests.get(f"http://127.0.0.1:{port}/api/", timeout=1)
+            return process
+        except requests.RequestException:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("App server did not start within 30 seconds")
+
+
+def run(base_url: str, scenarios: List[str], concurrency: int, duration: float,
+        account_names: List[str], seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run every scenario in turn and collect the results.
+
+    Args:
+        base_url: Base URL of the app
+        scenarios: Names of the scenarios to run, from SCENARIOS
+        concurrency: Number of concurrent clients
+        duration: Seconds each scenario runs for
+        account_names: Account names research requests pick from
+        seed: Seed for the account choices
+
+    Returns:
+        Results document with run metadata and a summary per scenario
+    """
+    results = {
+        "version": settings.VERSION,
+        "commit": _git_commit(),
+        "startedAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "baseUrl": base_url,
+        "concurrency": concurrency,
+        "duration": duration,
+        "scenarios": {}
+    }
+
+    for name in scenarios:
+        print(f"▶️ {name}: {concurrency} clients for {duration:g}s")
+        summary = run_scenario(base_url, SCENARIOS[name], concurrency, duration, account_names, seed=seed)
+        results["scenarios"][name] = summary
+        print(format_summary(name, summary))
+
+    return results
+
+
+def format_summary(name: str, summary: Dict[str, Any]) -> str:
+    """One-line report of a scenario summary."""
+    latency = summary["latencyMs"]
+    return (f"{name:<16} {summary['throughput']:8.1f} req/s  p50 {latency['p50']:8.1f}ms  "
+            f"p95 {latency['p95']:8.1f}ms  p99 {latency['p99']:8.1f}ms  errors {100 * summary['errorRate']:5.1f}%")
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Compare two results documents.
+
+    Args:
+        baseline: Earlier results
+        current: Later results
+
+    Returns:
+        One line per scenario present in both, with the change in throughput, p95 and error rate
+    """
+    lines = []
+    for name, summary in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+
+        def change(old: float, new: float) -> str:
+            return f"{100 * (new - old) / old:+.1f}%" if old else "n/a"
+
+        lines.append(
+            f"{name:<16} throughput {change(before['throughput'], summary['throughput']):>8}  "
+            f"p95 {change(before['latencyMs']['p95'], summary['latencyMs']['p95']):>8}  "
+            f"errors {100 * before['errorRate']:.1f}% -> {100 * summary['errorRate']:.1f}%"
+        )
+    return lines
+
+
+def _git_commit() -> Optional[str]:
+    """Commit of the working tree, if it is a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description="Load-test the SDR Assistant API")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=DEFAULT_SCENARIOS)
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients per scenario")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds each scenario runs for")
+    parser.add_argument("--target", default=None, help="Base URL of a running instance; omit to start one on fakes")
+    parser.add_argument("--server", choices=["wsgi", "asgi"], default="wsgi", help="App server to start")
+    parser.add_argument("--latency", default="lognormal:1.5:0.5", help="Fake completion latency (see fake_providers)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake provider 5xx rate")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fake provider 429 rate")
+    parser.add_argument("--accounts", type=int, default=250, help="Accounts in the fake Airtable table")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for fake latencies and account choices")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), default=None,
+                        help="Compare two results files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as baseline, open(args.compare[1]) as current:
+            print("\n".join(compare(json.load(baseline), json.load(current))))
+        return
+
+    providers = None
+    process = None
+    base_url = args.target
+    account_names = [f"Account {index:05d}" for index in range(1, args.accounts + 1)]
+
+    if base_url is None:
+        from sdr_assistant.fake_providers import FakeProviders, FaultProfile, LatencyModel
+
+        rng = random.Random(args.seed)
+        completion = FaultProfile(LatencyModel.parse(args.latency, rng), args.error_rate, args.rate_limit_rate, rng=rng)
+        providers = FakeProviders(
+            perplexity=completion, openai=completion,
+            airtable=FaultProfile(LatencyModel.parse("lognormal:0.15:0.3", rng), rng=rng),
+            accounts=args.accounts
+        ).start()
+        port = _free_port()
+        process = start_app(args.server, providers.environment(), port)
+        base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        results = run(base_url, args.scenarios, args.concurrency, args.duration, account_names, args.seed)
+        results["server"] = args.server if process else "external"
+        if providers:
+            results["fakes"] = {
+                "latency": args.latency, "errorRate": args.error_rate, "rateLimitRate": args.rate_limit_rate,
+                "accounts": args.accounts,
+                "requests": {name: dict(server.counters) for name, server in providers.servers.items()}
+            }
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+        if providers:
+            providers.stop()
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
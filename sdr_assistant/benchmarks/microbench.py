@@ -0,0 +1,255 @@
+"""
+Microbenchmarks for per-request code paths, with stored baselines.
+
+Each benchmark times a hot function over a realistic workload for several
+rounds. Results are compared with the stored baselines and any benchmark whose
+median is slower than the baseline by more than the threshold is reported as a
+regression (non-zero exit status, for CI).
+
+Run with:
+    python -m sdr_assistant.benchmarks.microbench                  # compare with baselines
+    python -m sdr_assistant.benchmarks.microbench --save-baseline  # record new baselines
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sdr_assistant.fake_providers import fake_accounts, fake_insights
+from sdr_assistant.models.account import Account
+from sdr_assistant.models.research import Research
+
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Records per workload for the model benchmarks
+RECORDS = 10_000
+
+# A benchmark is a setup function returning the zero-argument callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark setup function under a name."""
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("account_from_airtable_10k")
+def _account_from_airtable():
+    """Account.from_airtable over 10k Airtable records."""
+    records = fake_accounts(RECORDS)
+    return lambda: [Account.from_airtable(record) for record in records]
+
+
+@benchmark("account_to_dict_10k")
+def _account_to_dict():
+    """Account.to_dict over 10k accounts."""
+    accounts = [Account.from_airtable(record) for record in fake_accounts(RECORDS)]
+    return lambda: [account.to_dict() for account in accounts]
+
+
+@benchmark("research_from_airtable_10k")
+def _research_from_airtable():
+    """Research.from_airtable over 10k Airtable records."""
+    insights = fake_insights("SECTION 1", words=40)
+    records = [{
+        "id": f"rec{index:014d}",
+        "fields": {
+            "Account ID": f"rec{index:014d}",
+            "Account Name": f"Account {index:05d}",
+            "Industry Insights": insights,
+            "Company Insights": insights,
+            "Vision Insights": insights,
+            "Recommended Talk Track": insights,
+            "Created At": "2024-01-01T00:00:00.000Z",
+            "Updated At": "2024-01-02T00:00:00.000Z"
+        }
+    } for index in range(RECORDS)]
+    return lambda: [Research.from_airtable(record) for record in records]
+
+
+@benchmark("split_combined_insights_large")
+def _split_combined_insights():
+    """Splitting a large combined Perplexity response into its three sections."""
+    from sdr_assistant.services.perplexity_service import PerplexityService
+
+    service = PerplexityService()
+    # Roughly 250KB of markdown with many lines per section
+    response = "\n".join(fake_insights("SECTION 1", words=12_000).replace(". ", ".\n").splitlines())
+    return lambda: service._split_combined_response("Account 00001", response)
+
+
+@benchmark("verify_token_1k")
+def _verify_token():
+    """AuthManager.verify_token, 1000 calls."""
+    from sdr_assistant.core.auth import auth_manager
+
+    token = auth_manager.generate_token("user1")
+    return lambda: [auth_manager.verify_token(token) for _ in range(1000)]
+
+
+@benchmark("account_details_json_10k")
+def _account_details_json():
+    """JSON serialization of the /api/accounts/details response for 10k accounts."""
+    from flask import Flask, jsonify
+
+    app = Flask(__name__)
+    accounts = [Account.from_airtable(record) for record in fake_accounts(RECORDS)]
+
+    def serialize():
+        with app.app_context():
+            return jsonify([account.to_dict() for account in accounts]).get_data()
+
+    return serialize
+
+
+def measure(fn: Callable[[], Any], rounds: int = 7, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Time a callable over several rounds.
+
+    Args:
+        fn: Callable to time
+        rounds: Timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Dictionary with min, median, mean and standard deviation in milliseconds, and the round count
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append(1000 * (time.perf_counter() - start))
+
+    return {
+        "minMs": min(timings),
+        "medianMs": statistics.median(timings),
+        "meanMs": statistics.mean(timings),
+        "stdevMs": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": rounds
+    }
+
+
+def run(names: Optional[List[str]] = None, rounds: int = 7) -> Dict[str, Dict[str, Any]]:
+    """
+    Run benchmarks.
+
+    Args:
+        names: Benchmarks to run; all of them if omitted
+        rounds: Timed calls per benchmark
+
+    Returns:
+        Dictionary mapping each benchmark name to its measurement
+    """
+    results = {}
+    for name in names or list(BENCHMARKS):
+        results[name] = measure(BENCHMARKS[name](), rounds=rounds)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baselines: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare results with baselines.
+
+    Args:
+        results: Measurements from run()
+        baselines: Stored measurements, by benchmark name
+        threshold: Allowed slowdown of the median as a fraction, e.g. 0.15 for 15%
+
+    Returns:
+        One entry per benchmark with its median, the baseline median, the ratio and whether it regressed
+    """
+    report = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        ratio = result["medianMs"] / baseline["medianMs"] if baseline and baseline["medianMs"] else None
+        report.append({
+            "name": name,
+            "medianMs": result["medianMs"],
+            "baselineMs": baseline["medianMs"] if baseline else None,
+            "ratio": ratio,
+            "regressed": ratio is not None and ratio > 1 + threshold
+        })
+    return report
+
+
+def load_baselines(path: str = BASELINES_PATH) -> Dict[str, Any]:
+    """Load the stored baselines document, or an empty one if there is none."""
+    if not os.path.exists(path):
+        return {"machine": None, "benchmarks": {}}
+    with open(path) as baselines:
+        return json.load(baselines)
+
+
+def save_baselines(results: Dict[str, Dict[str, Any]], path: str = BASELINES_PATH) -> None:
+    """Store results as the new baselines, keeping baselines of benchmarks that were not run."""
+    document = load_baselines(path)
+    document["machine"] = _machine()
+    document["benchmarks"].update(results)
+    with open(path, "w") as baselines:
+        json.dump(document, baselines, indent=2, sort_keys=True)
+        baselines.write("\n")
+
+
+def _machine() -> str:
+    """Short description of the machine, since baselines only compare on the same one."""
+    return f"{platform.system()} {platform.machine()} / Python {platform.python_version()}"
+
+
+def main() -> None:
+    """Run the microbenchmarks and report regressions against the baselines."""
+    parser = argparse.ArgumentParser(description="Run microbenchmarks for hot code paths")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run; all by default")
+    parser.add_argument("--rounds", type=int, default=7, help="Timed calls per benchmark")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed median slowdown against the baseline, as a fraction")
+    parser.add_argument("--baselines", default=BASELINES_PATH, help="Baselines file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baselines")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(args.names, rounds=args.rounds)
+
+    if args.save_baseline:
+        save_baselines(results, args.baselines)
+        for name, result in results.items():
+            print(f"{name:<32} {result['medianMs']:10.2f}ms")
+        print(f"Baselines written to {args.baselines}")
+        return
+
+    baselines = load_baselines(args.baselines)
+    if baselines["machine"] and baselines["machine"] != _machine():
+        print(f"⚠️ Baselines were recorded on {baselines['machine']}; ratios may not be meaningful")
+
+    report = compare(results, baselines["benchmarks"], args.threshold)
+    for entry in report:
+        baseline = f"{entry['baselineMs']:10.2f}ms" if entry["baselineMs"] is not None else "         -  "
+        ratio = f"{entry['ratio']:6.2f}x" if entry["ratio"] is not None else "     - "
+        flag = "  ❌ REGRESSION" if entry["regressed"] else ""
+        print(f"{entry['name']:<32} {entry['medianMs']:10.2f}ms  baseline {baseline}  {ratio}{flag}")
+
+    if any(entry["regressed"] for entry in report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
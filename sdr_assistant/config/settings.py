@@ -41,9 +41,112 @@ class Settings:
         self.JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'default-secret-key-replace-in-production')
         self.JWT_EXPIRATION = int(os.getenv('JWT_EXPIRATION', '86400'))  # Default: 24 hours
         
+        # Account list cache: served for the TTL, then refreshed in the background while the stale list is still served
+        self.ACCOUNTS_CACHE_TTL = int(os.getenv('ACCOUNTS_CACHE_TTL', '300'))  # Seconds; 0 fetches on every call
+        self.ACCOUNTS_CACHE_MAX_STALE = int(os.getenv('ACCOUNTS_CACHE_MAX_STALE', '3600'))  # Seconds past the TTL a stale list may be served
+        
+        # Incremental account sync: refreshes fetch only records modified since the last sync
+        self.ACCOUNTS_DELTA_SYNC = os.getenv('ACCOUNTS_DELTA_SYNC', 'True').lower() in ('true', '1', 't')
+        self.ACCOUNTS_RECONCILE_INTERVAL = int(os.getenv('ACCOUNTS_RECONCILE_INTERVAL', '300'))  # Seconds between ID-only scans that drop deleted accounts
+        
+        # Research cache settings
+        self.RESEARCH_CACHE_ENABLED = os.getenv('RESEARCH_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+        self.RESEARCH_CACHE_TTL = int(os.getenv('RESEARCH_CACHE_TTL', '21600'))  # Default: 6 hours
+        self.RESEARCH_CACHE_MAX_BYTES = int(os.getenv('RESEARCH_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))  # Default: 64MB
+        self.RESEARCH_CACHE_DIR = os.getenv('RESEARCH_CACHE_DIR')  # Optional on-disk tier
+        # Per-section refresh policy: a cached section is regenerated once it is older than its TTL
+        self.RESEARCH_INDUSTRY_TTL = int(os.getenv('RESEARCH_INDUSTRY_TTL', '2592000'))  # Default: 30 days
+        self.RESEARCH_COMPANY_TTL = int(os.getenv('RESEARCH_COMPANY_TTL', '604800'))  # Default: 7 days
+        self.RESEARCH_VISION_TTL = int(os.getenv('RESEARCH_VISION_TTL', '1209600'))  # Default: 14 days
+        self.RESEARCH_SINGLEFLIGHT_TIMEOUT = float(os.getenv('RESEARCH_SINGLEFLIGHT_TIMEOUT', '120'))  # Seconds a duplicate request waits
+        
+        # Batch research settings
+        self.RESEARCH_BATCH_CONCURRENCY = int(os.getenv('RESEARCH_BATCH_CONCURRENCY', '4'))  # Default per-job concurrency
+        self.RESEARCH_BATCH_MAX_CONCURRENCY = int(os.getenv('RESEARCH_BATCH_MAX_CONCURRENCY', '16'))  # Cap across all jobs
+        self.RESEARCH_BATCH_MAX_ACCOUNTS = int(os.getenv('RESEARCH_BATCH_MAX_ACCOUNTS', '500'))
+        self.RESEARCH_BATCH_MAX_JOBS = int(os.getenv('RESEARCH_BATCH_MAX_JOBS', '100'))  # Finished jobs kept for polling
+        
+        # Off-peak research pre-warming (python -m sdr_assistant.prewarm)
+        self.PREWARM_START_HOUR = int(os.getenv('PREWARM_START_HOUR', '2'))  # Local hour the window opens
+        self.PREWARM_END_HOUR = int(os.getenv('PREWARM_END_HOUR', '6'))  # Local hour after which no new accounts start
+        self.PREWARM_CONCURRENCY = int(os.getenv('PREWARM_CONCURRENCY', '2'))
+        self.PREWARM_BUDGET = float(os.getenv('PREWARM_BUDGET', '5'))  # Estimated provider spend per run, in USD; 0 disables the cap
+        self.PREWARM_SECTION_COST = float(os.getenv('PREWARM_SECTION_COST', '0.005'))  # Estimated cost of one insights section
+        self.PREWARM_TALK_TRACK_COST = float(os.getenv('PREWARM_TALK_TRACK_COST', '0.01'))  # Estimated cost of one talk track
+        
+        # Durable research job queue settings
+        self.RESEARCH_QUEUE_ENABLED = os.getenv('RESEARCH_QUEUE_ENABLED', 'False').lower() in ('true', '1', 't')
+        self.RESEARCH_QUEUE_PATH = os.getenv(
+            'RESEARCH_QUEUE_PATH',
+            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'research_jobs.sqlite3')
+        )
+        self.RESEARCH_QUEUE_WAIT = float(os.getenv('RESEARCH_QUEUE_WAIT', '30'))  # Seconds a request waits for its job
+        self.RESEARCH_QUEUE_LEASE = float(os.getenv('RESEARCH_QUEUE_LEASE', '120'))  # Seconds before an abandoned job is retried
+        self.RESEARCH_QUEUE_MAX_ATTEMPTS = int(os.getenv('RESEARCH_QUEUE_MAX_ATTEMPTS', '3'))
+        self.RESEARCH_QUEUE_RETENTION = float(os.getenv('RESEARCH_QUEUE_RETENTION', '86400'))  # Seconds finished jobs are kept
+        self.RESEARCH_WORKER_PROCESSES = int(os.getenv('RESEARCH_WORKER_PROCESSES', '2'))
+        
+        # Local SQLite read replica of the Airtable accounts and research tables (python -m sdr_assistant.replica_sync)
+        self.AIRTABLE_REPLICA_ENABLED = os.getenv('AIRTABLE_REPLICA_ENABLED', 'False').lower() in ('true', '1', 't')
+        self.AIRTABLE_REPLICA_PATH = os.getenv(
+            'AIRTABLE_REPLICA_PATH',
+            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'airtable_replica.sqlite3')
+        )
+        self.AIRTABLE_REPLICA_SYNC_INTERVAL = float(os.getenv('AIRTABLE_REPLICA_SYNC_INTERVAL', '5'))  # Seconds between syncs
+        
+        # Provider base URLs; point these at the local stand-ins (python -m sdr_assistant.fake_providers) to test without credits
+        self.PERPLEXITY_URL = os.getenv('PERPLEXITY_URL', 'https://api.perplexity.ai').rstrip('/')
+        self.OPENAI_URL = os.getenv('OPENAI_URL', 'https://api.openai.com').rstrip('/')
+        self.AIRTABLE_URL = os.getenv('AIRTABLE_URL', 'https://api.airtable.com').rstrip('/')
+        
+        # Outbound HTTP client settings
+        self.PERPLEXITY_POOL_SIZE = int(os.getenv('PERPLEXITY_POOL_SIZE', '32'))  # Keep-alive connections per host
+        self.OPENAI_POOL_SIZE = int(os.getenv('OPENAI_POOL_SIZE', '32'))
+        self.AIRTABLE_POOL_SIZE = int(os.getenv('AIRTABLE_POOL_SIZE', '8'))
+        self.HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))  # Any other host
+        self.HTTP_CLIENT_HTTP2 = os.getenv('HTTP_CLIENT_HTTP2', 'False').lower() in ('true', '1', 't')  # Needs the h2 package
+        self.HTTP_CLIENT_WARMUP = os.getenv('HTTP_CLIENT_WARMUP', 'True').lower() in ('true', '1', 't')
+        
+        # Provider timeouts and the interactive research deadline
+        self.PROVIDER_CONNECT_TIMEOUT = float(os.getenv('PROVIDER_CONNECT_TIMEOUT', '10'))
+        self.PROVIDER_TIMEOUT = float(os.getenv('PROVIDER_TIMEOUT', '90'))  # Read timeout when a call has no deadline
+        self.RESEARCH_DEADLINE = float(os.getenv('RESEARCH_DEADLINE', '45'))  # Seconds for /api/generate-research; 0 disables
+        
+        # Insights generation mode: "combined" (one prompt) or "parallel" (one prompt per section)
+        self.PERPLEXITY_INSIGHTS_MODE = os.getenv('PERPLEXITY_INSIGHTS_MODE', 'combined').lower()
+        
+        # Provider rate limits (0 disables a budget)
+        self.PERPLEXITY_RPM = int(os.getenv('PERPLEXITY_RPM', '50'))
+        self.PERPLEXITY_TPM = int(os.getenv('PERPLEXITY_TPM', '0'))
+        self.OPENAI_RPM = int(os.getenv('OPENAI_RPM', '500'))
+        self.OPENAI_TPM = int(os.getenv('OPENAI_TPM', '200000'))
+        self.RATE_LIMIT_MAX_WAIT = float(os.getenv('RATE_LIMIT_MAX_WAIT', '10'))  # Seconds a call may queue for budget
+        self.RATE_LIMIT_MAX_RETRIES = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '3'))  # Retries after a 429
+        self.RATE_LIMIT_BACKOFF_BASE = float(os.getenv('RATE_LIMIT_BACKOFF_BASE', '0.5'))
+        self.RATE_LIMIT_BACKOFF_MAX = float(os.getenv('RATE_LIMIT_BACKOFF_MAX', '10'))
+        
+        # Provider circuit breaker settings
+        self.CIRCUIT_FAILURE_RATE = float(os.getenv('CIRCUIT_FAILURE_RATE', '0.5'))  # Share of failed calls that opens the circuit
+        self.CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv('CIRCUIT_SLOW_CALL_SECONDS', '30'))
+        self.CIRCUIT_SLOW_CALL_RATE = float(os.getenv('CIRCUIT_SLOW_CALL_RATE', '0.8'))  # Share of slow calls that opens the circuit
+        self.CIRCUIT_WINDOW_SIZE = int(os.getenv('CIRCUIT_WINDOW_SIZE', '20'))  # Recent calls the rates are computed over
+        self.CIRCUIT_MINIMUM_CALLS = int(os.getenv('CIRCUIT_MINIMUM_CALLS', '10'))
+        self.CIRCUIT_OPEN_SECONDS = float(os.getenv('CIRCUIT_OPEN_SECONDS', '30'))  # Time before half-open probes
+        self.CIRCUIT_HALF_OPEN_CALLS = int(os.getenv('CIRCUIT_HALF_OPEN_CALLS', '2'))  # Successful probes that close it
+        
+        # Hedged provider requests: send a duplicate when a call is slower than a percentile of recent latency
+        self.HEDGE_ENABLED = os.getenv('HEDGE_ENABLED', 'False').lower() in ('true', '1', 't')
+        self.HEDGE_PERCENTILE = float(os.getenv('HEDGE_PERCENTILE', '0.95'))
+        self.HEDGE_MIN_DELAY = float(os.getenv('HEDGE_MIN_DELAY', '2'))  # Shortest wait before hedging, in seconds
+        self.HEDGE_MAX_EXTRA_LOAD = float(os.getenv('HEDGE_MAX_EXTRA_LOAD', '0.05'))  # Most hedges as a share of recent calls
+        self.HEDGE_WINDOW_SIZE = int(os.getenv('HEDGE_WINDOW_SIZE', '200'))  # Recent calls latency is computed over
+        self.HEDGE_MINIMUM_SAMPLES = int(os.getenv('HEDGE_MINIMUM_SAMPLES', '20'))
+        self.HEDGE_MAX_CONCURRENT_CALLS = int(os.getenv('HEDGE_MAX_CONCURRENT_CALLS', '128'))  # Threads for hedged calls per provider
+        
         # App settings
         self.DEBUG = os.getenv('DEBUG', 'True').lower() in ('true', '1', 't')
         self.PORT = int(os.getenv('PORT', '5001'))
+        self.ASGI_WSGI_THREADS = int(os.getenv('ASGI_WSGI_THREADS', '32'))  # Threads serving Flask routes under uvicorn
         self.VERSION = '1.0.3'  # App version
 
     def is_airtable_configured(self):
@@ -0,0 +1,210 @@
+"""
+Account-name normalization, alias index and typeahead search.
+Maps the different ways an account is written ("NVIDIA", "Nvidia Corp", "nvidia.com")
+to one canonical account so lookups and cached research are shared between them,
+and ranks accounts for partial names typed into the account picker.
+"""
+import bisect
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from ..models.account import Account
+
+
+# Legal-entity suffixes dropped from the end of a name
+LEGAL_SUFFIXES = frozenset([
+    "ab", "ag", "as", "bv", "co", "company", "corp", "corporation", "gmbh", "inc", "incorporated",
+    "kk", "limited", "llc", "llp", "lp", "ltd", "nv", "oy", "plc", "pte", "pty", "sa", "sas", "spa", "srl"
+])
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_DOMAIN = re.compile(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$")
+
+
+def normalize_account_name(account_name: str) -> str:
+    """
+    Normalize an account name for lookups and cache keys.
+
+    Lowercases the name, removes punctuation and drops trailing legal suffixes,
+    so "NVIDIA", "Nvidia Corp." and "NVIDIA Corporation" all become "nvidia".
+
+    Args:
+        account_name: Name of the account as entered by the user
+
+    Returns:
+        Normalized name
+    """
+    words = _PUNCTUATION.sub(" ", (account_name or "").lower().replace("&", " and ")).split()
+
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+
+    return " ".join(words)
+
+
+def normalize_domain(value: Optional[str]) -> Optional[str]:
+    """
+    Extract the domain from a website or bare domain.
+
+    Args:
+        value: URL such as "https://www.nvidia.com/en-us" or a domain such as "nvidia.com"
+
+    Returns:
+        Lowercased domain without "www.", or None if the value is not a domain
+    """
+    value = (value or "").strip().lower()
+    if not value or " " in value:
+        return None
+
+    host = urlsplit(value if "//" in value else f"//{value}").hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+
+    return host if _DOMAIN.match(host) else None
+
+
+def _search_text(text: str) -> str:
+    """Lowercase a name or query and reduce it to words, keeping legal suffixes for prefix matching."""
+    return " ".join(_PUNCTUATION.sub(" ", (text or "").lower().replace("&", " and ")).split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Character trigrams of the text, padded so word starts and ends count."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AccountIndex:
+    """Immutable lookup table from IDs, normalized names and website domains to accounts, with typeahead search."""
+
+    def __init__(self, accounts: Iterable[Account]):
+        """
+        Build the index.
+
+        Args:
+            accounts: Accounts to index; when two share a key, the first one wins
+        """
+        self.accounts: List[Account] = list(accounts)
+        self._by_id: Dict[str, Account] = {}
+        self._by_name: Dict[str, Account] = {}
+        self._by_domain: Dict[str, Account] = {}
+        # Sorted (text, position) pairs for the full name and every word start, for prefix search
+        self._prefixes: List[Tuple[str, int]] = []
+        self._by_trigram: Dict[str, List[int]] = defaultdict(list)
+        self._trigram_counts: List[int] = []
+        self._positions: Dict[int, int] = {}
+
+        for position, account in enumerate(self.accounts):
+            self._positions[id(account)] = position
+            self._by_id.setdefault(account.id, account)
+            self._by_name.setdefault(normalize_account_name(account.name), account)
+            domain = normalize_domain(account.website)
+            if domain:
+                self._by_domain.setdefault(domain, account)
+
+            text = _search_text(account.name)
+            words = text.split(" ")
+            for start in range(len(words)):
+                self._prefixes.append((" ".join(words[start:]), position))
+
+            trigrams = _trigrams(text)
+            for trigram in trigrams:
+                self._by_trigram[trigram].append(position)
+            self._trigram_counts.append(len(trigrams))
+
+        self._prefixes.sort()
+
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        """
+        Find an account by its Airtable record ID.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            Account if found, None otherwise
+        """
+        return self._by_id.get(account_id)
+
+    def position(self, account_id: str) -> Optional[int]:
+        """
+        Find where an account is in the indexed list.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            Index of the account in the list, or None if there is no such account
+        """
+        account = self._by_id.get(account_id)
+        return self._positions[id(account)] if account is not None else None
+
+    def lookup(self, query: str) -> Optional[Account]:
+        """
+        Find the canonical account for a name, name variant, website or domain.
+
+        Args:
+            query: Account name, name variant, URL or domain
+
+        Returns:
+            Account if found, None otherwise
+        """
+        account = self._by_name.get(normalize_account_name(query))
+        if account is not None:
+            return account
+
+        domain = normalize_domain(query)
+        if domain:
+            return self._by_domain.get(domain)
+
+        return None
+
+    def search(self, query: str, limit: int = 10) -> List[Account]:
+        """
+        Rank accounts for a partial name, as typed into a typeahead.
+
+        Exact name, alias or domain matches come first, then accounts whose name
+        starts with the query, then accounts with a word starting with it, then
+        accounts whose names share the most trigrams with it (which tolerates typos).
+
+        Args:
+            query: Partial account name, domain or misspelling
+            limit: Maximum number of accounts to return
+
+        Returns:
+            Up to limit accounts, best match first
+        """
+        text = _search_text(query)
+        if not text or limit <= 0:
+            return []
+
+        scores: Dict[int, float] = {}
+
+        exact = self.lookup(query)
+        if exact is not None:
+            scores[self._positions[id(exact)]] = 3.0
+
+        start = bisect.bisect_left(self._prefixes, (text, -1))
+        for key, position in self._prefixes[start:]:
+            if not key.startswith(text):
+                break
+            # Whole-name prefixes rank above word prefixes; shorter names rank above longer ones
+            whole_name = len(key) == len(_search_text(self.accounts[position].name))
+            score = (2.0 if whole_name else 1.0) + 1 / (1 + len(key))
+            scores[position] = max(scores.get(position, 0.0), score)
+
+        if len(scores) < limit and len(text) >= 3:
+            query_trigrams = _trigrams(text)
+            shared: Dict[int, int] = defaultdict(int)
+            for trigram in query_trigrams:
+                for position in self._by_trigram.get(trigram, ()):
+                    shared[position] += 1
+            for position, count in shared.items():
+                similarity = count / (len(query_trigrams) + self._trigram_counts[position] - count)
+                if similarity >= 0.3 and position not in scores:
+                    scores[position] = similarity
+
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        return [self.accounts[position] for position in ranked[:limit]]
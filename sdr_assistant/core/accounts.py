@@ -2,8 +2,13 @@
 Core functionality for account management.
 Handles operations related to retrieving and managing accounts.
 """
-from typing import List, Dict, Any, Optional
+import base64
+import binascii
+import json
+import threading
+from typing import List, Dict, Any, Hashable, Optional, Tuple
 
+from ..core.account_index import AccountIndex
 from ..models.account import Account
 from ..services.airtable_service import AirtableService
 
@@ -14,6 +19,9 @@ class AccountManager:
     def __init__(self):
         """Initialize the account manager."""
         self.airtable_service = AirtableService()
+        self._index = AccountIndex([])
+        self._index_version: Optional[Hashable] = None
+        self._index_lock = threading.Lock()
     
     def get_accounts(self) -> List[Account]:
         """
@@ -24,6 +32,28 @@ class AccountManager:
         """
         return self.airtable_service.get_accounts()
     
+    def get_account_names(self) -> List[Dict[str, str]]:
+        """
+        Retrieve the ID and name of every account, without fetching full records.
+        
+        Returns:
+            List of dictionaries with 'id' and 'name'
+        """
+        return self.airtable_service.get_account_names()
+    
+    def invalidate_accounts(self) -> None:
+        """Drop the cached account list so the next lookup fetches it from Airtable."""
+        self.airtable_service.invalidate_accounts()
+    
+    def refresh_accounts(self) -> List[Account]:
+        """
+        Drop the cached account list and fetch it again, sharing the fetch with concurrent refreshes.
+        
+        Returns:
+            List of Account objects
+        """
+        return self.airtable_service.refresh_accounts()
+    
     def get_account_by_id(self, account_id: str) -> Optional[Account]:
         """
         Retrieve an account by ID.
@@ -34,27 +64,96 @@ class AccountManager:
         Returns:
             Account object if found, None otherwise
         """
-        accounts = self.get_accounts()
-        for account in accounts:
-            if account.id == account_id:
-                return account
-        return None
+        return self._get_index().get_by_id(account_id)
     
     def get_account_by_name(self, account_name: str) -> Optional[Account]:
         """
         Retrieve an account by name.
         
+        Name variants ("Nvidia Corp.", "NVIDIA Corporation") and the account's
+        website or domain ("nvidia.com") resolve to the same account.
+        
         Args:
-            account_name: Name of the account
+            account_name: Name, name variant, website or domain of the account
             
         Returns:
             Account object if found, None otherwise
         """
+        return self._get_index().lookup(account_name)
+    
+    def search_accounts(self, query: str, limit: int = 10) -> List[Account]:
+        """
+        Find the accounts best matching a partial name, for typeahead.
+        
+        Args:
+            query: Partial account name, domain or misspelling
+            limit: Maximum number of accounts to return
+            
+        Returns:
+            Up to limit accounts, best match first
+        """
+        return self._get_index().search(query, limit)
+    
+    def get_accounts_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Account], Optional[str]]:
+        """
+        Retrieve one page of accounts.
+        
+        The cursor names the last account of the previous page, so pages stay
+        consistent when accounts are added or removed between requests. If that
+        account was deleted, the page resumes at its old position.
+        
+        Args:
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of accounts in the page
+            
+        Returns:
+            Tuple of (accounts, cursor of the next page or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        index = self._get_index()
+        accounts = index.accounts
+        start = 0
+        if cursor:
+            after_id, offset = self._decode_cursor(cursor)
+            position = index.position(after_id)
+            start = position + 1 if position is not None else min(offset, len(accounts))
+        
+        page = accounts[start:start + limit]
+        end = start + len(page)
+        next_cursor = self._encode_cursor(page[-1].id, end) if page and end < len(accounts) else None
+        
+        return page, next_cursor
+    
+    @staticmethod
+    def _encode_cursor(after_id: str, offset: int) -> str:
+        """Encode the last account ID and the offset after it as an opaque cursor."""
+        payload = json.dumps([after_id, offset], separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, int]:
+        """Decode a cursor from _encode_cursor, raising ValueError if it is malformed."""
+        try:
+            after_id, offset = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        if not isinstance(after_id, str) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("Invalid cursor")
+        return after_id, offset
+    
+    def _get_index(self) -> AccountIndex:
+        """Get the alias index, rebuilding it when the account list version changes."""
+        # The list may change while it is fetched; it is then indexed now and again on the next call
+        version = self.airtable_service.accounts_version()
         accounts = self.get_accounts()
-        for account in accounts:
-            if account.name.lower() == account_name.lower():
-                return account
-        return None
+        changed = self.airtable_service.accounts_version() != version
+        with self._index_lock:
+            if changed or version != self._index_version:
+                self._index = AccountIndex(accounts)
+                self._index_version = version
+            return self._index
 
 
 # Singleton instance for easy import
@@ -0,0 +1,163 @@
+"""
+Asynchronous research generation for the ASGI serving mode.
+Mirrors ResearchManager.generate_research on top of the async provider services.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from ..config.settings import settings
+from ..core.account_index import normalize_account_name
+from ..core.accounts import account_manager
+from ..core.research import ResearchManager, research_manager
+from ..models.account import Account
+from ..services.async_openai_service import AsyncOpenAIService
+from ..services.async_perplexity_service import AsyncPerplexityService
+from ..utils.deadline import Deadline
+
+
+class AsyncResearchManager:
+    """Manager for non-blocking research generation."""
+
+    def __init__(self, manager: ResearchManager = research_manager):
+        """
+        Initialize the async research manager.
+
+        Args:
+            manager: Synchronous manager whose cache and result handling are shared
+        """
+        self.manager = manager
+        self.perplexity_service = AsyncPerplexityService()
+        self.openai_service = AsyncOpenAIService()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def generate_research(self, account_name: str, force_refresh: bool = False,
+                                deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Generate comprehensive research for an account without blocking the event loop.
+
+        Shares the research cache and section refresh policy with the synchronous
+        manager, and coalesces concurrent requests for the same account into one
+        generation. Deadlines and partial results work as in ResearchManager.generate_research.
+
+        Args:
+            account_name: Name of the account
+            force_refresh: Skip the cache and regenerate the research
+            deadline: Request deadline, if any
+
+        Returns:
+            Dictionary containing research results
+        """
+        cache = self.manager.cache
+        cache_key = self.manager._cache_key(account_name) if cache else None
+        cached, previous = self.manager._read_cache(cache_key, force_refresh)
+        if cached is not None:
+            return cached
+
+        flight_key = normalize_account_name(account_name)
+        future = self._in_flight.get(flight_key)
+        if future is not None:
+            try:
+                timeout = settings.RESEARCH_SINGLEFLIGHT_TIMEOUT
+                result = await asyncio.wait_for(asyncio.shield(future), deadline.cap(timeout) if deadline else timeout)
+            except asyncio.TimeoutError:
+                return {
+                    "success": False,
+                    "message": f"Timed out waiting for research generation for '{account_name}'"
+                }
+            return dict(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = future
+        try:
+            result = await self._generate_research(account_name, cache_key, previous, deadline, force_refresh)
+            future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._in_flight.pop(flight_key, None)
+            if future.done() and not future.cancelled():
+                # Mark the exception as retrieved when nobody else was waiting
+                future.exception()
+
+        return dict(result)
+
+    async def _generate_research(self, account_name: str, cache_key: Optional[str],
+                                 previous: Optional[Dict[str, Any]] = None,
+                                 deadline: Optional[Deadline] = None,
+                                 force_refresh: bool = False) -> Dict[str, Any]:
+        """Generate research for an account by calling the async providers."""
+        account = await self._get_account_by_name(account_name)
+
+        if not account:
+            return {
+                "success": False,
+                "message": f"Account '{account_name}' not found"
+            }
+
+        canonical_name = self.manager._canonical_name(account, account_name)
+        if canonical_name != account_name:
+            account_name = canonical_name
+            cache_key = self.manager._cache_key(account_name) if self.manager.cache else None
+            cached, previous = self.manager._read_cache(cache_key, force_refresh)
+            if cached is not None:
+                return cached
+
+        if previous is not None:
+            return await self._refresh_research(account_name, cache_key, previous, deadline)
+
+        try:
+            sections = await self.perplexity_service.generate_insights(account_name, deadline=deadline)
+        except Exception as e:
+            print(f"Error in generate_insights: {str(e)}")
+            sections = None
+
+        insights, degraded = self.manager._complete_insights(account_name, sections)
+
+        talk_track = None
+        if not (deadline and deadline.expired()):
+            talk_track = await self.openai_service.generate_talk_track(account_name, insights, deadline=deadline)
+
+        if deadline and deadline.expired() and (degraded or not talk_track):
+            incomplete = self.manager._incomplete_sections(sections, talk_track)
+            return self.manager._partial_research(insights, incomplete, talk_track)
+
+        return self.manager._finish_research(account_name, cache_key, insights, talk_track, degraded)
+
+    async def _refresh_research(self, account_name: str, cache_key: Optional[str], previous: Dict[str, Any],
+                                deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Regenerate the stale sections of cached research, and the talk track only if a section changed."""
+        stale = self.manager._stale_sections(previous)
+
+        try:
+            refreshed = await self.perplexity_service.generate_sections(account_name, stale, deadline=deadline)
+        except Exception as e:
+            print(f"Error in generate_sections: {str(e)}")
+            refreshed = {}
+
+        insights, section_updated_at, changed = self.manager._merge_sections(previous, refreshed)
+
+        if changed:
+            talk_track = await self.openai_service.generate_talk_track(account_name, insights, deadline=deadline)
+        else:
+            talk_track = previous["recommendedTalkTrack"]
+
+        return self.manager._finish_refresh(account_name, cache_key, previous, stale, refreshed, insights,
+                                            section_updated_at, talk_track, deadline)
+
+    async def _get_account_by_name(self, account_name: str) -> Optional[Account]:
+        """
+        Find an account by name, name variant, website or domain.
+
+        Uses the shared account manager, so lookups hit its cached (or replica-backed)
+        account list and index. It runs on a worker thread because a cache miss fetches
+        the list from Airtable synchronously.
+        """
+        return await asyncio.to_thread(account_manager.get_account_by_name, account_name)
+
+
+# Singleton instance for easy import
+async_research_manager = AsyncResearchManager()
@@ -0,0 +1,146 @@
+"""
+Core functionality for batch research generation.
+Runs research for many accounts on a bounded worker pool and tracks per-account progress.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from ..config.settings import settings
+from ..core.accounts import account_manager
+from ..core.research import research_manager
+from ..models.batch import BatchItem, BatchJob
+
+
+class BatchResearchManager:
+    """Manager for batch research jobs."""
+
+    def __init__(self):
+        """Initialize the batch research manager."""
+        self.default_concurrency = settings.RESEARCH_BATCH_CONCURRENCY
+        self.max_concurrency = settings.RESEARCH_BATCH_MAX_CONCURRENCY
+        self.max_accounts = settings.RESEARCH_BATCH_MAX_ACCOUNTS
+        self.max_jobs = settings.RESEARCH_BATCH_MAX_JOBS
+        self._jobs: "OrderedDict[str, BatchJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Caps provider calls across all running jobs, whatever each job asked for
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def submit(self, account_names: Optional[List[str]] = None, account_ids: Optional[List[str]] = None,
+               concurrency: Optional[int] = None, force_refresh: bool = False,
+               user_id: Optional[str] = None) -> BatchJob:
+        """
+        Start a batch research job.
+
+        Args:
+            account_names: Names of accounts to research
+            account_ids: IDs of accounts to research
+            concurrency: Number of accounts to research in parallel
+            force_refresh: Skip the research cache for every account
+            user_id: ID of the user starting the job
+
+        Returns:
+            The created BatchJob
+
+        Raises:
+            ValueError: If no accounts are given or the batch is too large
+        """
+        items = [BatchItem(account_name=name) for name in (account_names or [])]
+        items += [BatchItem(account_id=account_id) for account_id in (account_ids or [])]
+
+        if not items:
+            raise ValueError("At least one account name or ID is required")
+
+        if len(items) > self.max_accounts:
+            raise ValueError(f"A batch can contain at most {self.max_accounts} accounts")
+
+        concurrency = max(1, min(concurrency or self.default_concurrency, self.max_concurrency))
+
+        job = BatchJob(
+            id=str(uuid.uuid4()),
+            concurrency=concurrency,
+            items=items,
+            force_refresh=force_refresh,
+            created_by=user_id
+        )
+
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict_finished_jobs()
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"batch-{job.id[:8]}")
+        remaining = [len(items)]
+        remaining_lock = threading.Lock()
+
+        def run(item: BatchItem) -> None:
+            try:
+                self._run_item(job, item)
+            finally:
+                with remaining_lock:
+                    remaining[0] -= 1
+                    if remaining[0] == 0:
+                        job.finished_at = datetime.now()
+
+        for item in items:
+            executor.submit(run, item)
+        executor.shutdown(wait=False)
+
+        return job
+
+    def get_job(self, job_id: str) -> Optional[BatchJob]:
+        """
+        Retrieve a batch job by ID.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            BatchJob if found, None otherwise
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run_item(self, job: BatchJob, item: BatchItem) -> None:
+        """Generate research for a single account of a job."""
+        with self._slots:
+            item.status = "running"
+            item.started_at = datetime.now()
+
+            try:
+                if not item.account_name:
+                    account = account_manager.get_account_by_id(item.account_id)
+                    if not account:
+                        raise LookupError(f"Account with ID '{item.account_id}' not found")
+                    item.account_name = account.name
+
+                result = research_manager.generate_research(item.account_name, force_refresh=job.force_refresh)
+
+                item.result = result
+                if result.get("success"):
+                    item.status = "completed"
+                else:
+                    item.status = "failed"
+                    item.error = result.get("message")
+            except Exception as e:
+                print(f"Error generating research for batch {job.id}: {str(e)}")
+                item.status = "failed"
+                item.error = str(e)
+            finally:
+                item.finished_at = datetime.now()
+
+    def _evict_finished_jobs(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit. Caller holds the lock."""
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished_at is not None:
+                del self._jobs[job_id]
+                excess -= 1
+
+
+# Singleton instance for easy import
+batch_research_manager = BatchResearchManager()
@@ -0,0 +1,277 @@
+"""
+Durable job queue backed by SQLite on local disk.
+The web tier enqueues jobs and reads results; worker processes claim and run them.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from ..config.settings import settings
+from ..models.job import Job
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs (dedupe_key, status);
+"""
+
+
+class JobQueue:
+    """SQLite-backed job queue with leases, retries and de-duplication."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the job queue.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], dedupe_key: Optional[str] = None,
+                max_attempts: Optional[int] = None) -> Job:
+        """
+        Add a job to the queue.
+
+        If a queued or running job already has the same dedupe_key, that job is
+        returned instead of creating a duplicate.
+
+        Args:
+            kind: Job type, used by workers to pick a handler
+            payload: JSON-serializable job arguments
+            dedupe_key: Optional key identifying equivalent work
+            max_attempts: Number of times the job may be tried
+
+        Returns:
+            The new or existing Job
+        """
+        now = time.time()
+        conn = self._connect()
+
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if dedupe_key:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE dedupe_key = ? AND status IN ('queued', 'running') LIMIT 1",
+                    (dedupe_key,)
+                ).fetchone()
+                if row:
+                    return self._row_to_job(row)
+
+            job_id = str(uuid.uuid4())
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, dedupe_key, status, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), dedupe_key,
+                 max_attempts or settings.RESEARCH_QUEUE_MAX_ATTEMPTS, now, now)
+            )
+
+        return self.get(job_id)
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """
+        Claim the oldest runnable job.
+
+        Jobs whose worker died (lease expired) become runnable again until they
+        run out of attempts.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            lease_seconds: How long the claim is valid without a heartbeat
+
+        Returns:
+            The claimed Job, or None if the queue is empty
+        """
+        conn = self._connect()
+
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+
+            # Give up on jobs that were abandoned on their final attempt
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Worker lease expired', updated_at = ? "
+                "WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts",
+                (now, now)
+            )
+
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' "
+                "OR (status = 'running' AND lease_expires_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now,)
+            ).fetchone()
+
+            if not row:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_id = ?, "
+                "lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                (worker_id, now + lease_seconds, now, row["id"])
+            )
+
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease on a running job.
+
+        Returns:
+            True if the worker still owns the job
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (now + lease_seconds, now, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """
+        Mark a job as completed with its result.
+
+        Returns:
+            True if the worker still owned the job; False if its lease expired
+            and the job was reclaimed, in which case nothing is changed
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'completed', result = ?, error = NULL, "
+                "lease_expires_at = NULL, updated_at = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (json.dumps(result), time.time(), job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt, requeueing the job if it has attempts left.
+
+        Returns:
+            True if the worker still owned the job; False if its lease expired
+            and the job was reclaimed, in which case nothing is changed
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+                "error = ?, worker_id = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (error, time.time(), job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def purge_finished(self, older_than: float) -> int:
+        """
+        Delete completed and failed jobs that finished more than older_than seconds ago.
+
+        Returns:
+            Number of jobs deleted
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('completed', 'failed') AND updated_at < ?",
+                (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Retrieve a job by ID.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            Job if found, None otherwise
+        """
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def wait(self, job_id: str, timeout: float, poll_interval: float = 0.25) -> Optional[Job]:
+        """
+        Wait for a job to finish.
+
+        Args:
+            job_id: ID of the job
+            timeout: Maximum time to wait, in seconds
+            poll_interval: Time between checks, in seconds
+
+        Returns:
+            The job in its latest state, finished or not
+        """
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job and not job.finished and time.monotonic() < deadline:
+            time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+            job = self.get(job_id)
+        return job
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection to the queue database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        """Convert a database row to a Job."""
+        return Job(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            worker_id=row["worker_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the shared job queue, creating the database on first use."""
+    global _job_queue
+
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(settings.RESEARCH_QUEUE_PATH)
+        return _job_queue
@@ -0,0 +1,129 @@
+"""
+Core functionality for off-peak research pre-warming.
+Walks the account list, regenerates research that is missing or has stale sections,
+and leaves the results in the research cache so daytime requests are served from it.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import settings
+from ..core.accounts import account_manager
+from ..core.research import SECTION_RESULT_KEYS, ResearchManager, research_manager
+
+
+class ResearchPrewarmer:
+    """Regenerates missing and stale research within a concurrency limit and a spend budget."""
+
+    def __init__(self, manager: ResearchManager = research_manager, concurrency: Optional[int] = None,
+                 budget: Optional[float] = None):
+        """
+        Initialize the pre-warmer.
+
+        Args:
+            manager: Research manager whose cache is warmed
+            concurrency: Number of accounts researched in parallel
+            budget: Estimated provider spend allowed per run, in USD; 0 disables the cap
+        """
+        self.manager = manager
+        self.concurrency = max(1, concurrency or settings.PREWARM_CONCURRENCY)
+        self.budget = settings.PREWARM_BUDGET if budget is None else budget
+        self.section_cost = settings.PREWARM_SECTION_COST
+        self.talk_track_cost = settings.PREWARM_TALK_TRACK_COST
+
+    def has_shared_cache(self) -> bool:
+        """Check that results land in the on-disk cache tier, the only one web processes share with this one."""
+        return self.manager.cache is not None and self.manager.cache.cache_dir is not None
+
+    def plan(self) -> List[Tuple[str, List[str]]]:
+        """
+        Find the accounts whose research needs regenerating.
+
+        Returns:
+            List of (account name, stale sections); accounts with no research come
+            first, then those with the most stale sections
+        """
+        plan = []
+        for account in account_manager.get_accounts():
+            cache_key = self.manager._cache_key(account.name)
+            cached = self.manager.cache.get(cache_key, is_stale=self.manager._stale_sections)
+            stale = list(SECTION_RESULT_KEYS) if cached is None else self.manager._stale_sections(cached)
+            if stale:
+                plan.append((account.name, stale))
+
+        # Stable sort keeps the account-list order among equally stale accounts
+        plan.sort(key=lambda entry: len(entry[1]), reverse=True)
+        return plan
+
+    def estimate_cost(self, stale_sections: List[str]) -> float:
+        """Estimated provider spend to regenerate the given sections and the talk track."""
+        return len(stale_sections) * self.section_cost + self.talk_track_cost
+
+    def run(self, until: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Pre-warm the research cache.
+
+        Accounts are started in plan order until the budget is spent or the
+        stop time passes; accounts already running are allowed to finish.
+
+        Args:
+            until: Epoch time after which no new account is started
+
+        Returns:
+            Summary with counts of planned, refreshed, failed and skipped accounts and the estimated spend
+        """
+        summary = {"planned": 0, "refreshed": 0, "failed": 0, "skipped": 0, "spent": 0.0}
+
+        if not self.has_shared_cache():
+            print("❌ Research cache has no on-disk tier; web processes would never see pre-warmed research. "
+                  "Enable RESEARCH_CACHE_ENABLED and set RESEARCH_CACHE_DIR")
+            return summary
+
+        plan = self.plan()
+        summary["planned"] = len(plan)
+        print(f"🔥 Pre-warming research for {len(plan)} accounts")
+
+        running = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="prewarm") as executor:
+            for account_name, stale_sections in plan:
+                if until is not None and time.time() >= until:
+                    summary["skipped"] += 1
+                    continue
+
+                cost = self.estimate_cost(stale_sections)
+                if self.budget and summary["spent"] + cost > self.budget:
+                    summary["skipped"] += 1
+                    continue
+
+                if len(running) >= self.concurrency:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    self._count(done, summary)
+
+                summary["spent"] += cost
+                running.add(executor.submit(self._warm, account_name))
+
+            self._count(wait(running).done, summary)
+
+        print(f"✅ Pre-warmed {summary['refreshed']} accounts "
+              f"({summary['failed']} failed, {summary['skipped']} skipped, ~${summary['spent']:.2f})")
+        return summary
+
+    def _warm(self, account_name: str) -> bool:
+        """Regenerate research for one account; returns whether it was stored."""
+        try:
+            result = self.manager.generate_research(account_name)
+        except Exception as e:
+            print(f"Error pre-warming research for {account_name}: {str(e)}")
+            return False
+
+        return bool(result.get("success")) and not result.get("partial")
+
+    @staticmethod
+    def _count(done: set, summary: Dict[str, Any]) -> None:
+        """Add finished accounts to the summary."""
+        for future in done:
+            summary["refreshed" if future.result() else "failed"] += 1
+
+
+# Singleton instance for easy import
+research_prewarmer = ResearchPrewarmer()
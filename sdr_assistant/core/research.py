@@ -2,15 +2,39 @@
 Core functionality for research generation and management.
 Handles operations related to generating and storing research insights.
 """
-from typing import Dict, Any, Optional, Tuple
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from ..config.settings import settings
 from ..models.research import Research
 from ..models.account import Account
 from ..services.airtable_service import AirtableService
 from ..services.perplexity_service import PerplexityService
 from ..services.openai_service import OpenAIService
 from ..core.accounts import account_manager
+from ..core.account_index import normalize_account_name
+from ..core.research_cache import ResearchCache
+from ..core.job_queue import get_job_queue
+from ..models.job import Job
+from ..utils.deadline import Deadline
+from ..utils.exceptions import StreamInterruptedError
+from ..utils.singleflight import SingleFlight
+
+
+# Content used when a provider returns nothing for a section
+EMPTY_SECTION_TEMPLATES = {
+    "industry": "### Industry Insights for {account_name}\nIndustry trends and competitive landscape information would appear here.",
+    "company": "### Company Information for {account_name}\nCompany background, products, and strategic initiatives would appear here.",
+    "vision": "### Forward Thinking Vision for {account_name}\nFuture opportunities and strategic recommendations would appear here."
+}
+
+# Keys of each insight section in research results
+SECTION_RESULT_KEYS = {
+    "industry": "industryInsights",
+    "company": "companyInsights",
+    "vision": "visionInsights"
+}
 
 
 class ResearchManager:
@@ -21,13 +45,73 @@ class ResearchManager:
         self.airtable_service = AirtableService()
         self.perplexity_service = PerplexityService()
         self.openai_service = OpenAIService()
+        self.section_ttls = {
+            "industry": settings.RESEARCH_INDUSTRY_TTL,
+            "company": settings.RESEARCH_COMPANY_TTL,
+            "vision": settings.RESEARCH_VISION_TTL
+        }
+        # Entries are kept until their longest-lived section expires so stale sections can be refreshed in place
+        self.cache = ResearchCache(
+            ttl=max(settings.RESEARCH_CACHE_TTL, *self.section_ttls.values()),
+            max_bytes=settings.RESEARCH_CACHE_MAX_BYTES,
+            cache_dir=settings.RESEARCH_CACHE_DIR
+        ) if settings.RESEARCH_CACHE_ENABLED else None
+        self.in_flight = SingleFlight()
     
-    def generate_research(self, account_name: str) -> Dict[str, Any]:
+    def generate_research(self, account_name: str, force_refresh: bool = False,
+                          deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Generate comprehensive research for an account.
         
+        Results are served from the research cache when available. When some
+        cached sections are past their TTL, only those sections are regenerated
+        and the talk track is only regenerated if a section changed. Concurrent
+        requests for the same account share a single generation.
+        
+        With a deadline, every provider call times out at the deadline. If it
+        passes before generation completes, the sections that finished are
+        returned with "partial" set and the rest listed in "incompleteSections".
+        
+        Args:
+            account_name: Name of the account
+            force_refresh: Skip the cache and regenerate the research
+            deadline: Request deadline, if any
+            
+        Returns:
+            Dictionary containing research results
+        """
+        cache_key = self._cache_key(account_name) if self.cache else None
+        cached, previous = self._read_cache(cache_key, force_refresh)
+        if cached is not None:
+            return cached
+        
+        try:
+            result, _ = self.in_flight.do(
+                normalize_account_name(account_name),
+                lambda: self._generate_research(account_name, cache_key, previous, deadline, force_refresh),
+                timeout=deadline.cap(settings.RESEARCH_SINGLEFLIGHT_TIMEOUT) if deadline else settings.RESEARCH_SINGLEFLIGHT_TIMEOUT
+            )
+        except TimeoutError:
+            return {
+                "success": False,
+                "message": f"Timed out waiting for research generation for '{account_name}'"
+            }
+        
+        return dict(result)
+    
+    def _generate_research(self, account_name: str, cache_key: Optional[str],
+                           previous: Optional[Dict[str, Any]] = None,
+                           deadline: Optional[Deadline] = None,
+                           force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Generate research for an account by calling the providers.
+        
         Args:
             account_name: Name of the account
+            cache_key: Research cache key to store the result under, if caching is enabled
+            previous: Cached research with stale sections to refresh, if any
+            deadline: Request deadline, if any
+            force_refresh: Skip the cache when the name resolves to a different canonical account name
             
         Returns:
             Dictionary containing research results
@@ -41,35 +125,228 @@ class ResearchManager:
                 "message": f"Account '{account_name}' not found"
             }
         
+        canonical_name = self._canonical_name(account, account_name)
+        if canonical_name != account_name:
+            # Research is generated and cached under the canonical name so aliases share it
+            account_name = canonical_name
+            cache_key = self._cache_key(account_name) if self.cache else None
+            cached, previous = self._read_cache(cache_key, force_refresh)
+            if cached is not None:
+                return cached
+        
+        if previous is not None:
+            return self._refresh_research(account_name, cache_key, previous, deadline)
+        
         # Generate insights using Perplexity API
         try:
-            industry_insights, company_insights, vision_insights = self.perplexity_service.generate_insights(account_name)
-            
-            # Ensure we have data (fallback should already handle this, but just in case)
-            if not industry_insights:
-                industry_insights = f"### Industry Insights for {account_name}\nIndustry trends and competitive landscape information would appear here."
-            
-            if not company_insights:
-                company_insights = f"### Company Information for {account_name}\nCompany background, products, and strategic initiatives would appear here."
-                
-            if not vision_insights:
-                vision_insights = f"### Forward Thinking Vision for {account_name}\nFuture opportunities and strategic recommendations would appear here."   
+            sections = self.perplexity_service.generate_insights(account_name, deadline=deadline)
         except Exception as e:
             print(f"Error in generate_insights: {str(e)}")
             # Use fallback data if API fails completely
-            industry_insights = f"### Industry Insights for {account_name}\nIndustry trends and competitive landscape information would appear here."
-            company_insights = f"### Company Information for {account_name}\nCompany background, products, and strategic initiatives would appear here."
-            vision_insights = f"### Forward Thinking Vision for {account_name}\nFuture opportunities and strategic recommendations would appear here."
+            sections = None
+        
+        insights, degraded = self._complete_insights(account_name, sections)
+        
+        # Generate talk track using OpenAI API, unless the deadline has already passed
+        talk_track = None
+        if not (deadline and deadline.expired()):
+            talk_track = self.openai_service.generate_talk_track(account_name, insights, deadline=deadline)
+        
+        if deadline and deadline.expired() and (degraded or not talk_track):
+            return self._partial_research(insights, self._incomplete_sections(sections, talk_track), talk_track)
+        
+        return self._finish_research(account_name, cache_key, insights, talk_track, degraded)
+    
+    def _refresh_research(self, account_name: str, cache_key: Optional[str], previous: Dict[str, Any],
+                          deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Regenerate the stale sections of cached research.
+        
+        Args:
+            account_name: Name of the account
+            cache_key: Research cache key to store the result under, if caching is enabled
+            previous: Cached research with at least one stale section
+            deadline: Request deadline, if any
+            
+        Returns:
+            Dictionary containing research results
+        """
+        stale = self._stale_sections(previous)
+        
+        try:
+            refreshed = self.perplexity_service.generate_sections(account_name, stale, deadline=deadline)
+        except Exception as e:
+            print(f"Error in generate_sections: {str(e)}")
+            refreshed = {}
+        
+        insights, section_updated_at, changed = self._merge_sections(previous, refreshed)
+        
+        if changed:
+            talk_track = self.openai_service.generate_talk_track(account_name, insights, deadline=deadline)
+        else:
+            talk_track = previous["recommendedTalkTrack"]
+        
+        return self._finish_refresh(account_name, cache_key, previous, stale, refreshed, insights,
+                                    section_updated_at, talk_track, deadline)
+    
+    def _finish_refresh(self, account_name: str, cache_key: Optional[str], previous: Dict[str, Any],
+                        stale: List[str], refreshed: Dict[str, Optional[str]], insights: Dict[str, str],
+                        section_updated_at: Dict[str, float], talk_track: Optional[str],
+                        deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """
+        Build the result of a section refresh, marking it partial if the deadline cut it short.
+        
+        Sections that could not be refreshed in time keep their cached content. If the
+        talk track could not be regenerated in time, the cached talk track is returned
+        and nothing is cached, so the next request regenerates it.
+        """
+        if not (deadline and deadline.expired()):
+            return self._finish_research(account_name, cache_key, insights, talk_track, False, section_updated_at)
+        
+        incomplete = [section for section in stale if not refreshed.get(section)]
+        
+        if not talk_track:
+            return self._partial_research(insights, incomplete + ["talk_track"], previous["recommendedTalkTrack"])
+        
+        result = self._finish_research(account_name, cache_key, insights, talk_track, False, section_updated_at)
+        if incomplete:
+            result.update(partial=True, incompleteSections=incomplete)
+        return result
+    
+    def _incomplete_sections(self, sections: Optional[Tuple[Optional[str], Optional[str], Optional[str]]],
+                             talk_track: Optional[str]) -> List[str]:
+        """Names of the sections, and the talk track, that did not finish."""
+        incomplete = [
+            section for section, content in zip(SECTION_RESULT_KEYS, sections or (None, None, None))
+            if not content
+        ]
+        if not talk_track:
+            incomplete.append("talk_track")
+        return incomplete
+    
+    def _partial_research(self, insights: Dict[str, str], incomplete: List[str],
+                          talk_track: Optional[str]) -> Dict[str, Any]:
+        """
+        Build a result for research the deadline cut short. Partial results are never cached.
+        
+        Args:
+            insights: Completed insights dictionary, with placeholders for unfinished sections
+            incomplete: Names of the sections (and "talk_track") that did not finish
+            talk_track: Talk track to return, if any
+            
+        Returns:
+            Dictionary containing the research that finished
+        """
+        return {
+            "success": True,
+            "partial": True,
+            "incompleteSections": incomplete,
+            "industryInsights": insights["industry_insights"],
+            "companyInsights": insights["company_insights"],
+            "visionInsights": insights["vision_insights"],
+            "recommendedTalkTrack": talk_track,
+            "cached": False
+        }
+    
+    def _stale_sections(self, research: Dict[str, Any], now: Optional[float] = None) -> List[str]:
+        """
+        Find the sections of cached research that are past their TTL.
+        
+        Args:
+            research: Cached research result
+            now: Current time, in seconds since the epoch
+            
+        Returns:
+            Names of the stale sections, in SECTION_RESULT_KEYS order
+        """
+        now = time.time() if now is None else now
+        updated_at = research.get("sectionUpdatedAt") or {}
+        return [
+            section for section in SECTION_RESULT_KEYS
+            if now - updated_at.get(section, 0) >= self.section_ttls[section]
+        ]
+    
+    def _merge_sections(self, previous: Dict[str, Any],
+                        refreshed: Dict[str, Optional[str]]) -> Tuple[Dict[str, str], Dict[str, float], bool]:
+        """
+        Merge refreshed sections into cached research.
+        
+        Sections that failed to refresh keep their cached content and timestamp,
+        so they are retried on the next request.
+        
+        Args:
+            previous: Cached research result
+            refreshed: Newly generated content per section, None where generation failed
+            
+        Returns:
+            Tuple of (insights dictionary, section timestamps, whether any section content changed)
+        """
+        now = time.time()
+        section_updated_at = dict(previous.get("sectionUpdatedAt") or {})
+        insights = {}
+        changed = False
+        
+        for section, result_key in SECTION_RESULT_KEYS.items():
+            content = previous[result_key]
+            fresh = refreshed.get(section)
+            if fresh:
+                section_updated_at[section] = now
+                if fresh != content:
+                    content = fresh
+                    changed = True
+            insights[f"{section}_insights"] = content
+        
+        return insights, section_updated_at, changed
+    
+    def _complete_insights(self, account_name: str, sections: Optional[Tuple[Optional[str], Optional[str], Optional[str]]]) -> Tuple[Dict[str, str], bool]:
+        """
+        Fill in any insight sections the provider did not return.
+        
+        Args:
+            account_name: Name of the account
+            sections: Tuple of (industry, company, vision) insights, or None if generation failed
+            
+        Returns:
+            Tuple of (insights dictionary, whether any section had to be filled in)
+        """
+        industry_insights, company_insights, vision_insights = sections or (None, None, None)
+        
+        # Ensure we have data (fallback should already handle this, but just in case)
+        degraded = not (industry_insights and company_insights and vision_insights)
+        
+        if not industry_insights:
+            industry_insights = EMPTY_SECTION_TEMPLATES["industry"].format(account_name=account_name)
+        
+        if not company_insights:
+            company_insights = EMPTY_SECTION_TEMPLATES["company"].format(account_name=account_name)
+            
+        if not vision_insights:
+            vision_insights = EMPTY_SECTION_TEMPLATES["vision"].format(account_name=account_name)
         
-        # Generate talk track using OpenAI API
         insights = {
             "industry_insights": industry_insights,
             "company_insights": company_insights,
             "vision_insights": vision_insights
         }
+        return insights, degraded
+    
+    def _finish_research(self, account_name: str, cache_key: Optional[str], insights: Dict[str, str],
+                         talk_track: Optional[str], degraded: bool,
+                         section_updated_at: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Build the research result and cache it if it contains real provider output.
         
-        talk_track = self.openai_service.generate_talk_track(account_name, insights)
-        
+        Args:
+            account_name: Name of the account
+            cache_key: Research cache key, if caching is enabled
+            insights: Completed insights dictionary
+            talk_track: Generated talk track, or None if generation failed
+            degraded: Whether any insight section was filled in
+            section_updated_at: When each section was generated; defaults to now for every section
+            
+        Returns:
+            Dictionary containing research results
+        """
         if not talk_track:
             return {
                 "success": False,
@@ -77,13 +354,157 @@ class ResearchManager:
             }
         
         # Return the research results
-        return {
+        result = {
             "success": True,
-            "industryInsights": industry_insights,
-            "companyInsights": company_insights,
-            "visionInsights": vision_insights,
-            "recommendedTalkTrack": talk_track
+            "industryInsights": insights["industry_insights"],
+            "companyInsights": insights["company_insights"],
+            "visionInsights": insights["vision_insights"],
+            "recommendedTalkTrack": talk_track,
+            "sectionUpdatedAt": section_updated_at or dict.fromkeys(SECTION_RESULT_KEYS, time.time())
         }
+        
+        # Only cache real provider output, never placeholder or fallback content
+        if cache_key and not degraded and not self._is_fallback(account_name, insights, talk_track):
+            self.cache.set(cache_key, result)
+        
+        return dict(result, cached=False)
+    
+    def stream_research(self, account_name: str, force_refresh: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Generate research for an account as a stream of events.
+        
+        Insight sections are emitted as soon as the provider finishes each one,
+        followed by the talk track as it is generated token by token.
+        
+        Args:
+            account_name: Name of the account
+            force_refresh: Skip the cache and regenerate the research
+            
+        Yields:
+            Tuples of (event, payload) where event is one of "section",
+            "talk_track", "done" or "error". If the talk track stream breaks
+            off, "done" carries the fallback talk track and the result is not cached.
+        """
+        cache_key = self._cache_key(account_name) if self.cache else None
+        cached, _ = self._read_cache(cache_key, force_refresh)
+        if cached is not None:
+            yield from self._replay_research(cached)
+            return
+        
+        account = account_manager.get_account_by_name(account_name)
+        
+        if not account:
+            yield "error", {
+                "success": False,
+                "message": f"Account '{account_name}' not found"
+            }
+            return
+        
+        canonical_name = self._canonical_name(account, account_name)
+        if canonical_name != account_name:
+            account_name = canonical_name
+            cache_key = self._cache_key(account_name) if self.cache else None
+            cached, _ = self._read_cache(cache_key, force_refresh)
+            if cached is not None:
+                yield from self._replay_research(cached)
+                return
+        
+        sections = {}
+        degraded = False
+        for section, content in self.perplexity_service.stream_insights(account_name):
+            if not content:
+                degraded = True
+                content = EMPTY_SECTION_TEMPLATES[section].format(account_name=account_name)
+            sections[section] = content
+            yield "section", {"section": section, "content": content}
+        
+        insights, _ = self._complete_insights(
+            account_name, (sections.get("industry"), sections.get("company"), sections.get("vision"))
+        )
+        
+        talk_track_parts = []
+        try:
+            for delta in self.openai_service.stream_talk_track(account_name, insights):
+                talk_track_parts.append(delta)
+                yield "talk_track", {"delta": delta}
+            talk_track = "".join(talk_track_parts)
+        except StreamInterruptedError:
+            # The deltas sent so far are a partial talk track; finish with the fallback and never cache it
+            talk_track = self.openai_service._get_fallback_talk_track(account_name)
+            degraded = True
+        
+        result = self._finish_research(account_name, cache_key, insights, talk_track, degraded)
+        yield ("done" if result["success"] else "error"), result
+    
+    def _read_cache(self, cache_key: Optional[str],
+                    force_refresh: bool) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Look up research in the cache.
+        
+        Args:
+            cache_key: Research cache key, if caching is enabled
+            force_refresh: Skip the cache
+            
+        Returns:
+            Tuple of (fresh result to serve, cached result with stale sections to refresh)
+        """
+        if not cache_key or force_refresh:
+            return None, None
+        
+        cached = self.cache.get(cache_key, is_stale=self._stale_sections)
+        if cached is None:
+            return None, None
+        if self._stale_sections(cached):
+            return None, cached
+        return dict(cached, cached=True), None
+    
+    def _replay_research(self, research: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Emit cached research as stream_research events."""
+        for section, result_key in SECTION_RESULT_KEYS.items():
+            yield "section", {"section": section, "content": research[result_key]}
+        yield "talk_track", {"delta": research["recommendedTalkTrack"]}
+        yield "done", research
+    
+    @staticmethod
+    def _canonical_name(account: Any, account_name: str) -> str:
+        """Name research is generated under: the account's own name rather than the alias that found it."""
+        name = getattr(account, "name", None)
+        return name if isinstance(name, str) and name else account_name
+    
+    def _cache_key(self, account_name: str) -> str:
+        """Build the research cache key from the account name and the prompts/models in use."""
+        fingerprint = "|".join([
+            str(self.perplexity_service.get_prompt_fingerprint(account_name)),
+            str(self.openai_service.get_prompt_fingerprint(account_name))
+        ])
+        return ResearchCache.make_key(account_name, fingerprint)
+    
+    def _is_fallback(self, account_name: str, insights: Dict[str, Any], talk_track: str) -> bool:
+        """Check whether any part of the research came from placeholder or fallback content."""
+        placeholders = self.perplexity_service._get_placeholder_insights(account_name)
+        sections = (insights["industry_insights"], insights["company_insights"], insights["vision_insights"])
+        if any(section == placeholder for section, placeholder in zip(sections, placeholders)):
+            return True
+        return talk_track == self.openai_service._get_fallback_talk_track(account_name)
+    
+    def enqueue_research(self, account_name: str, force_refresh: bool = False) -> Job:
+        """
+        Queue research generation for a worker process.
+        
+        Requests for an account that is already queued or running share its job.
+        
+        Args:
+            account_name: Name of the account
+            force_refresh: Skip the cache when the worker generates the research
+            
+        Returns:
+            The queued Job
+        """
+        return get_job_queue().enqueue(
+            "research",
+            {"accountName": account_name, "forceRefresh": force_refresh},
+            dedupe_key=f"research:{normalize_account_name(account_name)}:{int(force_refresh)}"
+        )
     
     def save_research(self, research_data: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -96,7 +517,27 @@ class ResearchManager:
         Returns:
             Dictionary with success status and message
         """
-        research = Research(
+        return self.airtable_service.save_research(self._research_from_request(research_data, user_id))
+    
+    def save_research_batch(self, items: List[Dict[str, Any]], user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Save research for many accounts to Airtable with batch upserts.
+        
+        Args:
+            items: Dictionaries containing research data, as save_research takes them
+            user_id: ID of the user saving the research
+            
+        Returns:
+            Dictionary with success status, message and the number of records created and updated
+        """
+        return self.airtable_service.save_research_batch(
+            [self._research_from_request(item, user_id) for item in items]
+        )
+    
+    @staticmethod
+    def _research_from_request(research_data: Dict[str, Any], user_id: Optional[str]) -> Research:
+        """Build a Research from the camelCase request fields."""
+        return Research(
             account_id=research_data.get("accountId", ""),
             account_name=research_data.get("accountName", ""),
             industry_insights=research_data.get("industryInsights"),
@@ -105,8 +546,6 @@ class ResearchManager:
             recommended_talk_track=research_data.get("recommendedTalkTrack"),
             created_by=user_id
         )
-        
-        return self.airtable_service.save_research(research)
 
 
 # Singleton instance for easy import
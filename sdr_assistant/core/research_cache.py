@@ -0,0 +1,211 @@
+"""
+Content-addressed cache for generated research.
+Keeps recent research results in memory (LRU, bounded by bytes) with an optional on-disk tier.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, Tuple
+
+from ..core.account_index import normalize_account_name
+
+
+class ResearchCache:
+    """Thread-safe TTL cache for research results with LRU eviction bounded by bytes."""
+
+    def __init__(self, ttl: int, max_bytes: int, cache_dir: Optional[str] = None):
+        """
+        Initialize the research cache.
+
+        Args:
+            ttl: Time to live for entries, in seconds
+            max_bytes: Maximum total size of the in-memory tier, in bytes
+            cache_dir: Optional directory for the on-disk tier
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(account_name: str, fingerprint: str) -> str:
+        """
+        Build a cache key from an account name and a prompt/model fingerprint.
+
+        Args:
+            account_name: Name of the account
+            fingerprint: Fingerprint of the prompts and models used for generation
+
+        Returns:
+            Hex digest identifying the research content
+        """
+        material = f"{normalize_account_name(account_name)}|{fingerprint}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, is_stale: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a research result.
+
+        An in-memory entry that is_stale flags is checked against the on-disk
+        tier, and replaced if another process has since written a newer one.
+
+        Args:
+            key: Cache key from make_key
+            is_stale: Optional check that marks an entry as due for a refresh
+
+        Returns:
+            Cached research dictionary, or None if missing or expired
+        """
+        now = time.time()
+        memory = None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    if not (is_stale and self.cache_dir and is_stale(value)):
+                        self._hits += 1
+                        return value
+                    memory = expires_at, value
+                else:
+                    self._remove(key)
+
+        entry = self._read_disk(key)
+        if memory is not None:
+            # Every tier uses the same TTL, so the later expiry is the later write
+            if entry is None or entry[0] <= memory[0]:
+                with self._lock:
+                    self._hits += 1
+                return memory[1]
+
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                with self._lock:
+                    self._store(key, expires_at, value)
+                    self._hits += 1
+                return value
+            self._delete_disk(key)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a research result.
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable research dictionary
+        """
+        expires_at = time.time() + self.ttl
+
+        with self._lock:
+            self._store(key, expires_at, value)
+
+        self._write_disk(key, expires_at, value)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry from every tier."""
+        with self._lock:
+            self._remove(key)
+        self._delete_disk(key)
+
+    def clear(self) -> None:
+        """Remove every entry from the in-memory tier."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size of the in-memory tier."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "maxBytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "diskTier": bool(self.cache_dir)
+            }
+
+    def _store(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        """Insert an entry into the in-memory tier and evict LRU entries. Caller holds the lock."""
+        size = len(json.dumps(value).encode('utf-8'))
+
+        self._remove(key)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (expires_at, size, value)
+        self._size += size
+
+        while self._size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry from the in-memory tier. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def _disk_path(self, key: str) -> str:
+        """Path of the on-disk entry for a key."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Read an entry from the on-disk tier."""
+        if not self.cache_dir:
+            return None
+
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            return payload["expires_at"], payload["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading research cache entry {key}: {str(e)}")
+            return None
+
+    def _write_disk(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        """Write an entry to the on-disk tier atomically."""
+        if not self.cache_dir:
+            return
+
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"expires_at": expires_at, "value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing research cache entry {key}: {str(e)}")
+
+    def _delete_disk(self, key: str) -> None:
+        """Delete an entry from the on-disk tier."""
+        if not self.cache_dir:
+            return
+
+        try:
+            os.remove(self._disk_path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error deleting research cache entry {key}: {str(e)}")
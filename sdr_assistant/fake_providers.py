@@ -0,0 +1,623 @@
+"""
+Local stand-ins for the Perplexity, OpenAI and Airtable APIs.
+
+Each fake serves the endpoints the services call, including streamed chat
+completions and Airtable's offset pagination, with configurable latency,
+error rates and 429 injection. Point the services at them with PERPLEXITY_URL,
+OPENAI_URL and AIRTABLE_URL to load-test or profile without API credits.
+
+Run with:
+    python -m sdr_assistant.fake_providers --latency lognormal:2:0.5 --error-rate 0.02
+"""
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+# Share of a completion's latency spent before the first streamed token
+FIRST_TOKEN_SHARE = 0.25
+
+# Words per streamed chunk
+STREAM_CHUNK_WORDS = 4
+
+INDUSTRIES = ["Technology", "Financial Services", "Healthcare", "Retail", "Manufacturing", "Energy", "Media"]
+CITIES = ["San Francisco, CA", "New York, NY", "Austin, TX", "Boston, MA", "Seattle, WA", "Chicago, IL"]
+
+
+class LatencyModel:
+    """Distribution that response latencies are drawn from, in seconds."""
+
+    def __init__(self, distribution: str = "fixed", first: float = 0.0, second: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize the latency model.
+
+        Args:
+            distribution: "fixed" (first), "uniform" (first to second) or "lognormal" (median first, sigma second)
+            first: First parameter of the distribution, in seconds
+            second: Second parameter of the distribution
+            rng: Random generator, for reproducible runs
+        """
+        if distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution '{distribution}'")
+
+        self.distribution = distribution
+        self.first = first
+        self.second = second
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def parse(cls, spec: str, rng: Optional[random.Random] = None) -> "LatencyModel":
+        """
+        Parse a latency spec such as "fixed:0.2", "uniform:0.1:0.5" or "lognormal:1.5:0.4".
+
+        Args:
+            spec: Distribution name followed by its parameters, separated by colons
+            rng: Random generator, for reproducible runs
+
+        Returns:
+            LatencyModel instance
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        name, *params = spec.split(":")
+        values = [float(param) for param in params] + [0.0, 0.0]
+        return cls(name, values[0], values[1], rng)
+
+    def sample(self) -> float:
+        """Draw one latency, in seconds."""
+        if self.distribution == "uniform":
+            return self.rng.uniform(self.first, self.second)
+        if self.distribution == "lognormal":
+            return self.rng.lognormvariate(math.log(max(self.first, 1e-6)), self.second)
+        return self.first
+
+
+class FaultProfile:
+    """Latency and failure injection for one fake provider."""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, rpm: int = 0, retry_after: float = 1.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize the fault profile.
+
+        Args:
+            latency: Distribution of response latencies; no delay if omitted
+            error_rate: Share of requests answered with a 500 or 503
+            rate_limit_rate: Share of requests answered with a 429
+            rpm: Requests per minute served before returning 429; 0 disables the limit
+            retry_after: Retry-After sent with 429 responses, in seconds
+            rng: Random generator, for reproducible runs
+        """
+        self.rng = rng or random.Random()
+        self.latency = latency or LatencyModel(rng=self.rng)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rpm = rpm
+        self.retry_after = retry_after
+
+        self._recent: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def fault(self) -> Optional[int]:
+        """
+        Decide whether a request fails.
+
+        Returns:
+            HTTP status to fail the request with, or None to serve it
+        """
+        if self.rpm:
+            now = time.monotonic()
+            with self._lock:
+                while self._recent and now - self._recent[0] >= 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.rpm:
+                    return 429
+                self._recent.append(now)
+
+        roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return self.rng.choice((500, 503))
+        return None
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """Threaded HTTP server for one fake provider, with request counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], handler: type, profile: FaultProfile, **state: Any):
+        """
+        Initialize the server.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            handler: Request handler class for the provider
+            profile: Latency and failure injection
+            state: Provider-specific state available to the handler
+        """
+        super().__init__(address, handler)
+        self.profile = profile
+        self.state = state
+        self.counters = {"requests": 0, "errors": 0, "rateLimited": 0}
+        self._counter_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str) -> None:
+        """Increment a request counter."""
+        with self._counter_lock:
+            self.counters[name] += 1
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    """Shared request handling for the fake providers."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeProviderServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep load tests quiet."""
+
+    def _inject_fault(self) -> bool:
+        """Count the request and answer it with an injected failure if the profile says so."""
+        self.server.count("requests")
+        status = self.server.profile.fault()
+        if status is None:
+            return False
+
+        time.sleep(self.server.profile.latency.sample() * FIRST_TOKEN_SHARE)
+        if status == 429:
+            self.server.count("rateLimited")
+            self._send_json(429, {"error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}},
+                            {"Retry-After": f"{self.server.profile.retry_after:g}"})
+        else:
+            self.server.count("errors")
+            self._send_json(status, {"error": {"message": "Injected server error", "type": "server_error"}})
+        return True
+
+    def _read_json(self) -> Dict[str, Any]:
+        """Read the JSON request body."""
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(body or b"{}")
+        except ValueError:
+            return {}
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes) -> None:
+        """Write one chunk of a chunked response."""
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class _ChatCompletionHandler(_FakeHandler):
+    """Fake chat completions endpoint shared by Perplexity and OpenAI."""
+
+    def do_POST(self) -> None:
+        """Serve a chat completion, streamed or not."""
+        request = self._read_json()
+        if urlsplit(self.path).path != self.server.state["path"]:
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+
+        if self._inject_fault():
+            return
+
+        prompt = " ".join(str(message.get("content", "")) for message in request.get("messages", []))
+        content = self.server.state["generate"](prompt)
+        latency = self.server.profile.latency.sample()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = request.get("model", "fake-model")
+
+        if request.get("stream"):
+            self._stream(completion_id, model, content, latency)
+            return
+
+        time.sleep(latency)
+        prompt_tokens, completion_tokens = len(prompt.split()), len(content.split())
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    def _stream(self, completion_id: str, model: str, content: str, latency: float) -> None:
+        """Stream a completion as Server-Sent Events, spreading the latency over the chunks."""
+        words = re.findall(r"\S+\s*", content)
+        chunks = ["".join(words[i:i + STREAM_CHUNK_WORDS]) for i in range(0, len(words), STREAM_CHUNK_WORDS)]
+        gap = latency * (1 - FIRST_TOKEN_SHARE) / max(1, len(chunks))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            time.sleep(latency * FIRST_TOKEN_SHARE)
+            for index, chunk in enumerate(chunks):
+                if index:
+                    time.sleep(gap)
+                event = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}]
+                }
+                self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading, e.g. a hedged or cancelled request
+            self.close_connection = True
+
+
+class _AirtableHandler(_FakeHandler):
+    """Fake Airtable REST API over in-memory tables."""
+
+    def do_GET(self) -> None:
+        """List records with offset pagination, or get a single record."""
+        route = self._route()
+        if route is None or self._inject_fault():
+            return
+
+        table, record_id = route
+        self._sleep()
+
+        if record_id:
+            record = next((record for record in table if record["id"] == record_id), None)
+            if record is None:
+                self._send_json(404, {"error": {"type": "MODEL_ID_NOT_FOUND"}})
+            else:
+                self._send_json(200, record)
+            return
+
+        query = parse_qs(urlsplit(self.path).query)
+        with self.server.state["lock"]:
+            records = _filter_records(table, (query.get("filterByFormula") or [""])[0], self.server.state["modified"])
+        if query.get("fields[]"):
+            records = [dict(record, fields={name: value for name, value in record["fields"].items()
+                                            if name in query["fields[]"]}) for record in records]
+        if query.get("maxRecords"):
+            records = records[:int(query["maxRecords"][0])]
+
+        page_size = min(100, int((query.get("pageSize") or ["100"])[0]))
+        start = int((query.get("offset") or ["0"])[0])
+        payload: Dict[str, Any] = {"records": records[start:start + page_size]}
+        if start + page_size < len(records):
+            payload["offset"] = str(start + page_size)
+        self._send_json(200, payload)
+
+    def do_POST(self) -> None:
+        """Create one record, or several with a "records" list."""
+        request = self._read_json()
+        route = self._route()
+        if route is None or self._inject_fault():
+            return
+
+        table, _ = route
+        self._sleep()
+        created = []
+        for fields in [item.get("fields", {}) for item in request.get("records", [])] or [request.get("fields", {})]:
+            record = {"id": f"rec{uuid.uuid4().hex[:14]}", "createdTime": _now(), "fields": fields}
+            with self.server.state["lock"]:
+                table.append(record)
+                self.server.state["modified"][record["id"]] = record["createdTime"]
+            created.append(record)
+
+        self._send_json(200, {"records": created} if "records" in request else created[0])
+
+    def do_PATCH(self) -> None:
+        """Update the fields of a record, or upsert several with a "records" list and "performUpsert"."""
+        request = self._read_json()
+        route = self._route()
+        if route is None or self._inject_fault():
+            return
+
+        table, record_id = route
+        self._sleep()
+        if record_id is None:
+            self._send_json(200, self._upsert(table, request))
+            return
+
+        record = next((record for record in table if record["id"] == record_id), None)
+        if record is None:
+            self._send_json(404, {"error": {"type": "MODEL_ID_NOT_FOUND"}})
+            return
+
+        with self.server.state["lock"]:
+            record["fields"].update(request.get("fields", {}))
+            self.server.state["modified"][record_id] = _now()
+        self._send_json(200, record)
+
+    def do_DELETE(self) -> None:
+        """Delete a record."""
+        route = self._route()
+        if route is None or self._inject_fault():
+            return
+
+        table, record_id = route
+        self._sleep()
+        with self.server.state["lock"]:
+            record = next((record for record in table if record["id"] == record_id), None)
+            if record is not None:
+                table.remove(record)
+        if record is None:
+            self._send_json(404, {"error": {"type": "MODEL_ID_NOT_FOUND"}})
+        else:
+            self._send_json(200, {"id": record_id, "deleted": True})
+
+    def _upsert(self, table: List[Dict[str, Any]], request: Dict[str, Any]) -> Dict[str, Any]:
+        """Update records by ID or by the performUpsert merge fields, creating those that do not match."""
+        merge_on = (request.get("performUpsert") or {}).get("fieldsToMergeOn", [])
+        response: Dict[str, Any] = {"records": [], "createdRecords": [], "updatedRecords": []}
+
+        with self.server.state["lock"]:
+            for item in request.get("records", []):
+                fields = item.get("fields", {})
+                record = next((record for record in table if record["id"] == item.get("id") or (
+                    merge_on and "id" not in item
+                    and all(record["fields"].get(name) == fields.get(name) for name in merge_on)
+                )), None)
+                if record is None:
+                    record = {"id": f"rec{uuid.uuid4().hex[:14]}", "createdTime": _now(), "fields": dict(fields)}
+                    table.append(record)
+                    response["createdRecords"].append(record["id"])
+                else:
+                    record["fields"].update(fields)
+                    response["updatedRecords"].append(record["id"])
+                self.server.state["modified"][record["id"]] = _now()
+                response["records"].append(record)
+
+        if not merge_on:
+            del response["createdRecords"], response["updatedRecords"]
+        return response
+
+    def _route(self) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Resolve /v0/<base>/<table>[/<record>] to a table, sending a 404 if there is none."""
+        parts = [unquote(part) for part in urlsplit(self.path).path.split("/") if part]
+        if len(parts) in (3, 4) and parts[0] == "v0":
+            tables = self.server.state["tables"]
+            with self.server.state["lock"]:
+                table = tables.setdefault(parts[2], [])
+            return table, parts[3] if len(parts) == 4 else None
+
+        self._send_json(404, {"error": "NOT_FOUND"})
+        return None
+
+    def _sleep(self) -> None:
+        """Wait out the sampled latency."""
+        time.sleep(self.server.profile.latency.sample())
+
+
+def _filter_records(records: List[Dict[str, Any]], formula: str, modified: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Apply the formulas the services send; other formulas match everything.
+
+    Supports {Field}='value' and IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('<time>')), with
+    modification times looked up by record ID and defaulting to the creation time.
+    """
+    match = re.fullmatch(r"IS_AFTER\(LAST_MODIFIED_TIME\(\), DATETIME_PARSE\('(.+)'\)\)", formula.strip())
+    if match:
+        since = match.group(1)
+        return [record for record in records if modified.get(record["id"], record["createdTime"]) > since]
+
+    match = re.fullmatch(r"\{(.+)\}='(.*)'", formula.strip())
+    if not match:
+        return list(records)
+    field, value = match.groups()
+    return [record for record in records if str(record["fields"].get(field, "")) == value]
+
+
+def _now() -> str:
+    """Current UTC time in Airtable's format."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+def fake_accounts(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate Airtable account records.
+
+    Args:
+        count: Number of records
+        seed: Seed for the generated field values
+
+    Returns:
+        List of Airtable records in the shape the Companies table returns
+    """
+    rng = random.Random(seed)
+    records = []
+    for index in range(1, count + 1):
+        slug = f"account{index:05d}"
+        records.append({
+            "id": f"rec{index:014d}",
+            "createdTime": "2024-01-01T00:00:00.000Z",
+            "fields": {
+                "Name": f"Account {index:05d}",
+                "Industry": rng.choice(INDUSTRIES),
+                "HQ Location": rng.choice(CITIES),
+                "Employee Count": rng.randint(10, 50000),
+                "Revenue": f"${rng.randint(1, 900)}M",
+                "Website": f"https://www.{slug}.example.com",
+                "Description": f"Account {index:05d} is a generated account for load testing."
+            }
+        })
+    return records
+
+
+def fake_insights(prompt: str, words: int = 120) -> str:
+    """
+    Generate a Perplexity-style markdown answer.
+
+    A prompt asking for all three sections gets three "###" sections, so the
+    combined response splits like a real one; any other prompt gets one section.
+
+    Args:
+        prompt: Prompt text of the request
+        words: Approximate words per section
+
+    Returns:
+        Markdown content
+    """
+    titles = ["Industry Insights", "Company Information", "Forward-Thinking Vision"]
+    if "SECTION 1" not in prompt:
+        titles = titles[:1]
+
+    filler = " ".join(["Generated analysis for load testing."] * max(1, words // 5))
+    return "\n\n".join(f"### {title}\n{filler}" for title in titles)
+
+
+def fake_talk_track(prompt: str, words: int = 250) -> str:
+    """Generate an OpenAI-style talk track of roughly the given length."""
+    return "**Opening**\n" + " ".join(["Generated talk track sentence for load testing."] * max(1, words // 7))
+
+
+class FakeProviders:
+    """The three fake provider servers, running on background threads."""
+
+    def __init__(self, host: str = "127.0.0.1", perplexity: Optional[FaultProfile] = None,
+                 openai: Optional[FaultProfile] = None, airtable: Optional[FaultProfile] = None,
+                 accounts: int = 250, ports: Tuple[int, int, int] = (0, 0, 0)):
+        """
+        Create the servers without starting them.
+
+        Args:
+            host: Interface to listen on
+            perplexity: Fault profile for the Perplexity fake
+            openai: Fault profile for the OpenAI fake
+            airtable: Fault profile for the Airtable fake
+            accounts: Number of accounts in the fake Companies table
+            ports: Ports for the Perplexity, OpenAI and Airtable fakes; 0 picks a free port
+        """
+        self.perplexity = FakeProviderServer(
+            (host, ports[0]), _ChatCompletionHandler, perplexity or FaultProfile(),
+            path="/chat/completions", generate=fake_insights
+        )
+        self.openai = FakeProviderServer(
+            (host, ports[1]), _ChatCompletionHandler, openai or FaultProfile(),
+            path="/v1/chat/completions", generate=fake_talk_track
+        )
+        self.airtable = FakeProviderServer(
+            (host, ports[2]), _AirtableHandler, airtable or FaultProfile(),
+            tables={"Companies": fake_accounts(accounts), "Research": []}, modified={}, lock=threading.Lock()
+        )
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def servers(self) -> Dict[str, FakeProviderServer]:
+        """Servers by provider name."""
+        return {"perplexity": self.perplexity, "openai": self.openai, "airtable": self.airtable}
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables that point the services at the fakes."""
+        return {
+            "PERPLEXITY_URL": self.perplexity.url,
+            "OPENAI_URL": self.openai.url,
+            "AIRTABLE_URL": self.airtable.url,
+            "PERPLEXITY_API_KEY": "fake-perplexity-key",
+            "OPENAI_API_KEY": "fake-openai-key",
+            "AIRTABLE_API_KEY": "fake-airtable-key",
+            "AIRTABLE_BASE_ID": "appFakeBase",
+            "AIRTABLE_TABLE_NAME": "Companies"
+        }
+
+    def start(self) -> "FakeProviders":
+        """Serve every fake on a daemon thread."""
+        for name, server in self.servers.items():
+            thread = threading.Thread(target=server.serve_forever, args=(0.05,), name=f"fake-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        """Stop and close every fake."""
+        for server in self.servers.values():
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "FakeProviders":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Run the fake providers until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve fake Perplexity, OpenAI and Airtable APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--ports", type=int, nargs=3, default=[8101, 8102, 8103],
+                        metavar=("PERPLEXITY", "OPENAI", "AIRTABLE"))
+    parser.add_argument("--latency", default="lognormal:2:0.5",
+                        help="Completion latency: fixed:S, uniform:MIN:MAX or lognormal:MEDIAN:SIGMA (seconds)")
+    parser.add_argument("--airtable-latency", default="lognormal:0.15:0.3", help="Airtable latency, same format")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 5xx")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--rpm", type=int, default=0, help="Completion requests per minute before 429s; 0 disables")
+    parser.add_argument("--accounts", type=int, default=250, help="Accounts in the fake Companies table")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible latencies and faults")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    def profile(latency: str, rpm: int = 0) -> FaultProfile:
+        return FaultProfile(LatencyModel.parse(latency, rng), args.error_rate, args.rate_limit_rate, rpm, rng=rng)
+
+    providers = FakeProviders(
+        args.host,
+        perplexity=profile(args.latency, args.rpm),
+        openai=profile(args.latency, args.rpm),
+        airtable=profile(args.airtable_latency),
+        accounts=args.accounts,
+        ports=tuple(args.ports)
+    ).start()
+
+    for name, value in providers.environment().items():
+        print(f"export {name}={value}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        providers.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -57,13 +57,15 @@ class OpenAIServiceInterface(ServiceInterface):
     """Interface for OpenAI service implementations."""
     
     @abstractmethod
-    def generate_talk_track(self, account_name: str, insights: Dict[str, str]) -> Optional[str]:
+    def generate_talk_track(self, account_name: str, insights: Dict[str, str],
+                            deadline: Optional[Any] = None) -> Optional[str]:
         """
         Generate a sales talk track for an account using the OpenAI API.
         
         Args:
             account_name: Name of the account
             insights: Dictionary containing research insights
+            deadline: Optional request deadline
             
         Returns:
             Generated talk track, or None if generation fails
@@ -74,12 +76,51 @@ class PerplexityServiceInterface(ServiceInterface):
     """Interface for Perplexity service implementations."""
     
     @abstractmethod
-    def generate_insights(self, account_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    def generate_insights(self, account_name: str,
+                          deadline: Optional[Any] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Generate insights about a company using the Perplexity API.
         
         Args:
             account_name: Name of the account/company
+            deadline: Optional request deadline
+            
+        Returns:
+            Tuple of (industry_insights, company_insights, vision_insights)
+        """
+        pass
+
+class AsyncOpenAIServiceInterface(ServiceInterface):
+    """Interface for asynchronous OpenAI service implementations."""
+    
+    @abstractmethod
+    async def generate_talk_track(self, account_name: str, insights: Dict[str, str],
+                                  deadline: Optional[Any] = None) -> Optional[str]:
+        """
+        Generate a sales talk track for an account using the OpenAI API.
+        
+        Args:
+            account_name: Name of the account
+            insights: Dictionary containing research insights
+            deadline: Optional request deadline
+            
+        Returns:
+            Generated talk track, or None if generation fails
+        """
+        pass
+
+class AsyncPerplexityServiceInterface(ServiceInterface):
+    """Interface for asynchronous Perplexity service implementations."""
+    
+    @abstractmethod
+    async def generate_insights(self, account_name: str,
+                                deadline: Optional[Any] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Generate insights about a company using the Perplexity API.
+        
+        Args:
+            account_name: Name of the account/company
+            deadline: Optional request deadline
             
         Returns:
             Tuple of (industry_insights, company_insights, vision_insights)
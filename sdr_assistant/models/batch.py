@@ -0,0 +1,76 @@
+"""
+Data model for batch research jobs.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class BatchItem:
+    """Data model representing one account in a batch research job."""
+
+    account_name: Optional[str] = None
+    account_id: Optional[str] = None
+    status: str = "pending"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self):
+        """Convert the batch item to a dictionary representation."""
+        return {
+            'accountName': self.account_name,
+            'accountId': self.account_id,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'startedAt': self.started_at.isoformat() if self.started_at else None,
+            'finishedAt': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+@dataclass
+class BatchJob:
+    """Data model representing a batch research job."""
+
+    id: str
+    concurrency: int
+    items: List[BatchItem] = field(default_factory=list)
+    force_refresh: bool = False
+    created_by: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def status(self) -> str:
+        """Overall job status derived from the item statuses."""
+        statuses = {item.status for item in self.items}
+        if statuses <= {"completed", "failed"}:
+            return "completed"
+        if statuses == {"pending"}:
+            return "pending"
+        return "running"
+
+    def to_dict(self, include_results: bool = True):
+        """Convert the batch job to a dictionary representation."""
+        counts = {"pending": 0, "running": 0, "completed": 0, "failed": 0}
+        for item in self.items:
+            counts[item.status] = counts.get(item.status, 0) + 1
+
+        data = {
+            'jobId': self.id,
+            'status': self.status,
+            'concurrency': self.concurrency,
+            'total': len(self.items),
+            'counts': counts,
+            'createdAt': self.created_at.isoformat(),
+            'finishedAt': self.finished_at.isoformat() if self.finished_at else None,
+            'createdBy': self.created_by
+        }
+
+        if include_results:
+            data['items'] = [item.to_dict() for item in self.items]
+
+        return data
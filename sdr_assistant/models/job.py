@@ -0,0 +1,43 @@
+"""
+Data model for queued background jobs.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class Job:
+    """Data model representing a job in the durable job queue."""
+
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str = "queued"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    max_attempts: int = 3
+    worker_id: Optional[str] = None
+    created_at: Optional[float] = None
+    updated_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a terminal status."""
+        return self.status in ("completed", "failed")
+
+    def to_dict(self):
+        """Convert the job to a dictionary representation."""
+        return {
+            'jobId': self.id,
+            'kind': self.kind,
+            'payload': self.payload,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'attempts': self.attempts,
+            'maxAttempts': self.max_attempts,
+            'createdAt': datetime.fromtimestamp(self.created_at).isoformat() if self.created_at else None,
+            'updatedAt': datetime.fromtimestamp(self.updated_at).isoformat() if self.updated_at else None
+        }
@@ -0,0 +1,102 @@
+"""
+Off-peak research pre-warming scheduler.
+
+Once a day, between PREWARM_START_HOUR and PREWARM_END_HOUR local time,
+regenerates research that is missing or stale so morning requests are served
+from the research cache. The web processes see the warmed results through the
+on-disk tier, so RESEARCH_CACHE_DIR must be set; without it the scheduler exits.
+
+Run with:
+    python -m sdr_assistant.prewarm          # run every night
+    python -m sdr_assistant.prewarm --once   # run now, then exit
+"""
+import argparse
+import signal
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sdr_assistant.config.settings import settings
+
+
+def next_window(now: datetime, start_hour: int, end_hour: int) -> Tuple[datetime, datetime]:
+    """
+    Get the next pre-warming window.
+
+    Args:
+        now: Current local time
+        start_hour: Hour the window opens
+        end_hour: Hour the window closes; a smaller value than start_hour wraps past midnight
+
+    Returns:
+        Tuple of (start, end); start is now if the window is already open
+    """
+    start = now.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+    end = now.replace(hour=end_hour, minute=0, second=0, microsecond=0)
+    if end <= start:
+        end += timedelta(days=1)
+
+    # The window that opened yesterday may still be open
+    if start - timedelta(days=1) <= now < end - timedelta(days=1):
+        return now, end - timedelta(days=1)
+    if now >= end:
+        start += timedelta(days=1)
+        end += timedelta(days=1)
+    return max(start, now), end
+
+
+def run_schedule(stopping: threading.Event, once: bool = False, budget: Optional[float] = None,
+                 concurrency: Optional[int] = None) -> None:
+    """
+    Run pre-warming in each off-peak window until asked to stop.
+
+    Args:
+        stopping: Event set to stop waiting for the next window
+        once: Run immediately a single time instead of on the schedule
+        budget: Estimated provider spend allowed per run, in USD
+        concurrency: Number of accounts researched in parallel
+    """
+    from sdr_assistant.core.prewarm import ResearchPrewarmer
+
+    prewarmer = ResearchPrewarmer(concurrency=concurrency, budget=budget)
+    if not prewarmer.has_shared_cache():
+        raise SystemExit("❌ Pre-warming needs the shared on-disk research cache. "
+                         "Enable RESEARCH_CACHE_ENABLED and set RESEARCH_CACHE_DIR")
+
+    if once:
+        prewarmer.run()
+        return
+
+    while not stopping.is_set():
+        start, end = next_window(datetime.now(), settings.PREWARM_START_HOUR, settings.PREWARM_END_HOUR)
+        print(f"Next research pre-warm at {start.isoformat(timespec='minutes')}")
+        if stopping.wait(max(0.0, (start - datetime.now()).total_seconds())):
+            break
+        prewarmer.run(until=end.timestamp())
+        # Do not start again inside the window that just ran
+        stopping.wait(max(0.0, (end - datetime.now()).total_seconds()))
+
+
+def main() -> None:
+    """Run the pre-warming scheduler."""
+    parser = argparse.ArgumentParser(description="Pre-warm research for the account list during off-peak hours")
+    parser.add_argument("--once", action="store_true", help="Run now and exit instead of waiting for the window")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Estimated provider spend allowed per run, in USD")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Number of accounts researched in parallel")
+    args = parser.parse_args()
+
+    stopping = threading.Event()
+
+    def request_stop(signum, frame):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    run_schedule(stopping, once=args.once, budget=args.budget, concurrency=args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Sync process for the local Airtable read replica.
+
+Copies the Companies and Research tables into the SQLite replica at
+AIRTABLE_REPLICA_PATH, then every AIRTABLE_REPLICA_SYNC_INTERVAL seconds fetches
+only the records modified since the previous sync. Web processes with
+AIRTABLE_REPLICA_ENABLED read from the replica and write through to Airtable.
+
+Run with:
+    python -m sdr_assistant.replica_sync          # keep the replica current
+    python -m sdr_assistant.replica_sync --once   # sync once, then exit
+"""
+import argparse
+import signal
+import threading
+import time
+from typing import Optional
+
+from sdr_assistant.config.settings import settings
+
+
+def run_sync(stopping: threading.Event, once: bool = False, interval: Optional[float] = None) -> None:
+    """
+    Sync the replica until asked to stop.
+
+    Args:
+        stopping: Event set to stop syncing
+        once: Sync a single time instead of repeatedly
+        interval: Seconds between the start of consecutive syncs
+    """
+    from sdr_assistant.services.airtable_replica import get_replica
+    from sdr_assistant.services.airtable_service import AirtableService
+
+    service = AirtableService()
+    if not service.is_configured:
+        print("⚠️ Airtable is not configured; nothing to sync")
+        return
+
+    replica = get_replica()
+    interval = settings.AIRTABLE_REPLICA_SYNC_INTERVAL if interval is None else interval
+    print(f"Syncing Airtable replica at {replica.path}")
+
+    while not stopping.is_set():
+        started = time.monotonic()
+        try:
+            results = replica.sync_all(service, settings.ACCOUNTS_RECONCILE_INTERVAL)
+            changes = {table: result for table, result in results.items() if result["fetched"] or result["deleted"]}
+            if changes:
+                print(f"🔄 Replica synced: {changes}")
+        except Exception as e:
+            print(f"Error syncing Airtable replica: {str(e)}")
+
+        if once:
+            return
+        stopping.wait(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main() -> None:
+    """Run the replica sync process."""
+    parser = argparse.ArgumentParser(description="Keep the local SQLite replica of Airtable current")
+    parser.add_argument("--once", action="store_true", help="Sync once and exit")
+    parser.add_argument("--interval", type=float, default=None, help="Seconds between syncs")
+    args = parser.parse_args()
+
+    stopping = threading.Event()
+
+    def request_stop(signum, frame):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    run_sync(stopping, once=args.once, interval=args.interval)
+
+
+if __name__ == "__main__":
+    main()
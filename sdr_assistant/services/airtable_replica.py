@@ -0,0 +1,241 @@
+"""
+Local SQLite read replica of the Airtable Companies and Research tables.
+A sync process keeps it current; the app reads from it and writes through to Airtable.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config.settings import settings
+from ..models.account import Account
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    table_name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (table_name, id)
+);
+DROP INDEX IF EXISTS idx_records_name;
+DROP INDEX IF EXISTS idx_records_account_id;
+CREATE TABLE IF NOT EXISTS sync_state (
+    table_name TEXT PRIMARY KEY,
+    watermark TEXT,
+    reconciled_at REAL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+RESEARCH_TABLE = "Research"
+
+# Airtable has no ID-only listing, so deletion scans fetch one small field per table
+ID_SCAN_FIELDS = {RESEARCH_TABLE: "Account ID"}
+
+# Seconds each sync watermark is set back, so clock skew and in-flight edits are not missed
+DELTA_SYNC_OVERLAP = 60
+
+
+class AirtableReplica:
+    """SQLite mirror of Airtable tables, keyed by table and record ID."""
+
+    def __init__(self, path: str, accounts_table: str = "Companies"):
+        """
+        Initialize the replica.
+
+        Args:
+            path: Path of the SQLite database file
+            accounts_table: Name of the Airtable accounts table
+        """
+        self.path = path
+        self.accounts_table = accounts_table
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._accounts: Optional[List[Account]] = None
+        self._accounts_version = -1
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def get_accounts(self) -> Optional[List[Account]]:
+        """
+        Get every account in the replica.
+
+        The list is rebuilt only after a sync changed the table, so the same
+        list object is returned until then and callers must not modify it.
+
+        Returns:
+            List of Account objects, or None if the accounts table was never synced
+        """
+        version = self._version(self.accounts_table)
+        if version is None:
+            return None
+
+        with self._lock:
+            if version != self._accounts_version:
+                rows = self._connect().execute(
+                    "SELECT record FROM records WHERE table_name = ? ORDER BY rowid", (self.accounts_table,)
+                ).fetchall()
+                self._accounts = [Account.from_airtable(json.loads(row["record"])) for row in rows]
+                self._accounts_version = version
+            return self._accounts
+
+    def accounts_version(self) -> Optional[int]:
+        """Get the change counter of the accounts table, or None if it was never synced."""
+        return self._version(self.accounts_table)
+
+    def upsert(self, table_name: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace records, e.g. after a write to Airtable.
+
+        Args:
+            table_name: Airtable table the records belong to
+            records: Airtable records
+
+        Returns:
+            Number of records written
+        """
+        rows = [self._row(table_name, record) for record in records]
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._upsert_rows(conn, rows)
+            conn.execute("UPDATE sync_state SET version = version + 1 WHERE table_name = ?", (table_name,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def sync(self, service: Any, table_name: str, reconcile_interval: float) -> Dict[str, int]:
+        """
+        Bring one table up to date with Airtable.
+
+        The first sync copies the whole table. Later syncs fetch only records
+        modified since the previous one and, every reconcile_interval seconds,
+        the IDs of all records to remove deleted ones.
+
+        Args:
+            service: AirtableService used to fetch records
+            table_name: Airtable table to sync
+            reconcile_interval: Seconds between ID-only scans for deleted records
+
+        Returns:
+            Dictionary with the number of records fetched and deleted
+        """
+        conn = self._connect()
+        state = conn.execute(
+            "SELECT watermark, reconciled_at FROM sync_state WHERE table_name = ?", (table_name,)
+        ).fetchone()
+        watermark = state["watermark"] if state else None
+        reconcile = watermark is None or time.time() - (state["reconciled_at"] or 0) >= reconcile_interval
+
+        # The next watermark is taken before fetching, so edits made during the fetch are picked up next time
+        synced_at = datetime.now(timezone.utc) - timedelta(seconds=DELTA_SYNC_OVERLAP)
+
+        records = service.fetch_records(table_name, modified_since=watermark)
+        if watermark is None:
+            record_ids = {record["id"] for record in records}
+        elif reconcile:
+            scan_fields = [ID_SCAN_FIELDS.get(table_name, "Name")]
+            record_ids = {record["id"] for record in service.fetch_records(table_name, fields=scan_fields)}
+        else:
+            record_ids = None
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            changes = conn.total_changes
+            self._upsert_rows(conn, [self._row(table_name, record) for record in records])
+            deleted = self._delete_missing(conn, table_name, record_ids) if record_ids is not None else 0
+            changes = conn.total_changes - changes
+            conn.execute(
+                """
+                INSERT INTO sync_state (table_name, watermark, reconciled_at, version) VALUES (?, ?, ?, 1)
+                ON CONFLICT (table_name) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    reconciled_at = COALESCE(?, reconciled_at),
+                    version = version + (? > 0)
+                """,
+                (table_name, synced_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"), time.time(),
+                 time.time() if reconcile else None, changes)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return {"fetched": len(records), "deleted": deleted}
+
+    def sync_all(self, service: Any, reconcile_interval: float) -> Dict[str, Dict[str, int]]:
+        """Sync the accounts and research tables; see sync()."""
+        return {
+            table_name: self.sync(service, table_name, reconcile_interval)
+            for table_name in (self.accounts_table, RESEARCH_TABLE)
+        }
+
+    def _version(self, table_name: str) -> Optional[int]:
+        """Get the change counter of a table, or None if it was never synced."""
+        row = self._connect().execute(
+            "SELECT version FROM sync_state WHERE table_name = ?", (table_name,)
+        ).fetchone()
+        return row["version"] if row else None
+
+    @staticmethod
+    def _row(table_name: str, record: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Convert an Airtable record to a records row."""
+        return table_name, record["id"], json.dumps(record)
+
+    @staticmethod
+    def _upsert_rows(conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        """Insert or update rows, keeping the position of existing ones and skipping unchanged ones."""
+        conn.executemany(
+            """
+            INSERT INTO records (table_name, id, record) VALUES (?, ?, ?)
+            ON CONFLICT (table_name, id) DO UPDATE SET record = excluded.record
+            WHERE records.record IS NOT excluded.record
+            """,
+            rows
+        )
+
+    @staticmethod
+    def _delete_missing(conn: sqlite3.Connection, table_name: str, record_ids: set) -> int:
+        """Delete the rows of a table whose IDs are not in record_ids."""
+        stored = [row["id"] for row in conn.execute("SELECT id FROM records WHERE table_name = ?", (table_name,))]
+        missing = [(table_name, record_id) for record_id in stored if record_id not in record_ids]
+        conn.executemany("DELETE FROM records WHERE table_name = ? AND id = ?", missing)
+        return len(missing)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection to the replica database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+_replica: Optional[AirtableReplica] = None
+_replica_lock = threading.Lock()
+
+
+def get_replica() -> AirtableReplica:
+    """Get the shared replica, creating the database on first use."""
+    global _replica
+
+    with _replica_lock:
+        if _replica is None:
+            _replica = AirtableReplica(settings.AIRTABLE_REPLICA_PATH, settings.AIRTABLE_TABLE_NAME)
+        return _replica
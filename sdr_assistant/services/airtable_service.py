@@ -2,13 +2,23 @@
 Service for interacting with the Airtable API.
 Handles operations related to accounts and research data storage.
 """
-from pyairtable import Table
-from typing import List, Dict, Any, Optional
+from pyairtable import Api, Table
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Set, Tuple
 import json
+import threading
+import time
 
 from ..config.settings import settings
+from .airtable_replica import DELTA_SYNC_OVERLAP, RESEARCH_TABLE, AirtableReplica, get_replica
+from .http_client import AIRTABLE_URL, create_circuit_breaker, get_http_client, request_timeout
 from ..models.account import Account
 from ..models.research import Research
+from ..utils.singleflight import SingleFlight
+
+
+# Fails calls fast to the mock/error paths while Airtable is degraded
+airtable_circuit_breaker = create_circuit_breaker("Airtable")
 
 
 class AirtableService:
@@ -20,23 +30,353 @@ class AirtableService:
         self.base_id = settings.AIRTABLE_BASE_ID
         self.table_name = settings.AIRTABLE_TABLE_NAME
         self.is_configured = settings.is_airtable_configured()
+        self._api: Optional[Api] = None
+        
+        # Reads are served from the local replica once it has been synced
+        self.replica: Optional[AirtableReplica] = get_replica() if settings.AIRTABLE_REPLICA_ENABLED else None
+        
+        # Cached account list
+        self.accounts_ttl = settings.ACCOUNTS_CACHE_TTL
+        self.accounts_max_stale = settings.ACCOUNTS_CACHE_MAX_STALE
+        self._accounts: Optional[List[Account]] = None
+        self._accounts_fetched_at = 0.0
+        self._accounts_generation = 0
+        self._accounts_version = 0
+        self._last_fetched_accounts: Optional[List[Account]] = None
+        self._accounts_refreshing = False
+        self._accounts_lock = threading.Lock()
+        self._accounts_flight = SingleFlight()
+        
+        # ID and name projection for the account picker
+        self._account_names: Optional[List[Dict[str, str]]] = None
+        self._account_names_fetched_at = 0.0
+        self._names_source: Optional[List[Account]] = None
+        self._names_projection: List[Dict[str, str]] = []
+        
+        # Incremental sync state for the cached list
+        self.accounts_delta_sync = settings.ACCOUNTS_DELTA_SYNC
+        self.accounts_reconcile_interval = settings.ACCOUNTS_RECONCILE_INTERVAL
+        self._accounts_watermark: Optional[str] = None
+        self._accounts_reconciled_at = 0.0
+    
+    def _table(self, table_name: str) -> Table:
+        """
+        Get a table bound to the shared Airtable API client.
+        
+        The client reuses the pooled Airtable connections from the shared HTTP
+        client instead of opening a new session for every call.
+        """
+        if self._api is None:
+            api = Api(self.api_key, timeout=request_timeout(), endpoint_url=AIRTABLE_URL)
+            # pyairtable keeps the auth header on its own session, so share the connection pool only
+            api.session.mount(AIRTABLE_URL, get_http_client().get_adapter(AIRTABLE_URL))
+            self._api = api
+        
+        return self._api.table(self.base_id, table_name)
     
     def get_accounts(self) -> List[Account]:
-        """Retrieve accounts from Airtable."""
+        """
+        Retrieve accounts from Airtable.
+        
+        The list is cached for ACCOUNTS_CACHE_TTL seconds. After that, callers keep
+        getting the cached list while one background refresh fetches a new one, so
+        they never wait on Airtable. The list is only fetched inline when there is
+        none or it is more than ACCOUNTS_CACHE_MAX_STALE seconds past its TTL, and
+        concurrent callers share that fetch. With ACCOUNTS_DELTA_SYNC, refreshes
+        only fetch records modified since the last sync. The same list object is
+        returned until it changes, so callers must not modify it.
+        
+        Returns:
+            List of Account objects
+        """
         if not self.is_configured:
             return Account.create_mock_accounts()
         
+        if self.replica is not None:
+            accounts = self.replica.get_accounts()
+            if accounts is not None:
+                return accounts
+        
+        if self.accounts_ttl <= 0:
+            try:
+                accounts = self._fetch_accounts()
+            except Exception as e:
+                print(f"Error fetching accounts from Airtable: {str(e)}")
+                return Account.create_mock_accounts()
+            with self._accounts_lock:
+                # Keep serving the previous list, and its version, while the records are unchanged
+                if accounts != self._last_fetched_accounts:
+                    self._last_fetched_accounts = accounts
+                    self._accounts_version += 1
+                return self._last_fetched_accounts
+        
+        with self._accounts_lock:
+            accounts = self._accounts
+            age = time.monotonic() - self._accounts_fetched_at
+            if accounts is not None and age < self.accounts_ttl:
+                return accounts
+            if accounts is not None and age < self.accounts_ttl + self.accounts_max_stale:
+                self._start_accounts_refresh()
+                return accounts
+        
         try:
-            table = Table(self.api_key, self.base_id, self.table_name)
-            records = table.all()
-            
-            return [Account.from_airtable(record) for record in records]
+            accounts, _ = self._accounts_flight.do("accounts", self._load_accounts)
+            return accounts
         except Exception as e:
             print(f"Error fetching accounts from Airtable: {str(e)}")
-            return Account.create_mock_accounts()
+            # Serve the last known list, however old, rather than mock accounts
+            return accounts if accounts is not None else Account.create_mock_accounts()
+    
+    def accounts_version(self) -> Tuple[str, int]:
+        """
+        Get a version of the account list that get_accounts serves.
+        
+        The version changes whenever get_accounts may return different accounts,
+        so callers can key data derived from the list on it.
+        
+        Returns:
+            Tuple of the list's source and its change counter
+        """
+        if not self.is_configured:
+            return "mock", 0
+        
+        if self.replica is not None:
+            version = self.replica.accounts_version()
+            if version is not None:
+                return "replica", version
+        
+        with self._accounts_lock:
+            return "airtable", self._accounts_version
+    
+    def get_account_names(self) -> List[Dict[str, str]]:
+        """
+        Retrieve the ID and name of every account, for the account picker.
+        
+        The projection is derived from the cached account list when there is one.
+        Otherwise only the Name field is fetched from Airtable, and the result is
+        cached on its own for ACCOUNTS_CACHE_TTL seconds, so listing accounts never
+        pulls full records.
+        
+        Returns:
+            List of dictionaries with 'id' and 'name'; callers must not modify it
+        """
+        if not self.is_configured:
+            return self._project_names(Account.create_mock_accounts())
+        
+        accounts = self._cached_accounts()
+        if accounts is not None:
+            return self._project_names(accounts)
+        
+        with self._accounts_lock:
+            names = self._account_names
+            if names is not None and time.monotonic() - self._account_names_fetched_at < self.accounts_ttl:
+                return names
+        
+        try:
+            names, _ = self._accounts_flight.do("account-names", self._load_account_names)
+            return names
+        except Exception as e:
+            print(f"Error fetching account names from Airtable: {str(e)}")
+            return names if names is not None else self._project_names(Account.create_mock_accounts())
+    
+    def invalidate_accounts(self) -> None:
+        """Drop the cached account list so the next call fetches it from Airtable."""
+        with self._accounts_lock:
+            self._accounts = None
+            self._account_names = None
+            self._accounts_generation += 1
+            self._accounts_version += 1
+    
+    def refresh_accounts(self) -> List[Account]:
+        """
+        Drop the cached account list and fetch it again.
+        
+        Concurrent refreshes share one invalidation and fetch, so a burst of
+        refresh requests costs Airtable a single list fetch.
+        
+        Returns:
+            List of Account objects
+        """
+        def reload() -> List[Account]:
+            self.invalidate_accounts()
+            return self.get_accounts()
+        
+        accounts, _ = self._accounts_flight.do("refresh", reload)
+        return accounts
+    
+    def _cached_accounts(self) -> Optional[List[Account]]:
+        """Get the account list from the replica or the cache without fetching, or None if there is none."""
+        if self.replica is not None:
+            accounts = self.replica.get_accounts()
+            if accounts is not None:
+                return accounts
+        
+        with self._accounts_lock:
+            age = time.monotonic() - self._accounts_fetched_at
+            if self._accounts is not None and age < self.accounts_ttl + self.accounts_max_stale:
+                return self._accounts
+        return None
+    
+    def _project_names(self, accounts: List[Account]) -> List[Dict[str, str]]:
+        """Project accounts to their ID and name, reusing the projection while the list is unchanged."""
+        with self._accounts_lock:
+            if accounts is not self._names_source:
+                self._names_projection = [{"id": account.id, "name": account.name} for account in accounts]
+                self._names_source = accounts
+            return self._names_projection
+    
+    def _load_account_names(self) -> List[Dict[str, str]]:
+        """Fetch only the ID and name of every account and cache them, unless invalidated during the fetch."""
+        with self._accounts_lock:
+            generation = self._accounts_generation
+        
+        records = self.fetch_records(self.table_name, fields=["Name"])
+        names = [{"id": record["id"], "name": record.get("fields", {}).get("Name", "")} for record in records]
+        
+        with self._accounts_lock:
+            if generation == self._accounts_generation:
+                self._account_names = names
+                self._account_names_fetched_at = time.monotonic()
+        
+        return names
+    
+    def fetch_records(self, table_name: str, modified_since: Optional[str] = None,
+                      fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch records from an Airtable table.
+        
+        Args:
+            table_name: Name of the table
+            modified_since: ISO 8601 UTC time; only records modified after it are fetched
+            fields: Fields to return; all of them if omitted
+            
+        Returns:
+            List of Airtable records
+        """
+        table = self._table(table_name)
+        options: Dict[str, Any] = {}
+        if modified_since:
+            options["formula"] = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{modified_since}'))"
+        if fields:
+            options["fields"] = fields
+        
+        return airtable_circuit_breaker.call(lambda: table.all(**options))
+    
+    def _fetch_accounts(self, modified_since: Optional[str] = None) -> List[Account]:
+        """Fetch accounts from Airtable, optionally only those modified after an ISO 8601 UTC time."""
+        records = self.fetch_records(self.table_name, modified_since=modified_since)
+        
+        return [Account.from_airtable(record) for record in records]
+    
+    def _fetch_account_ids(self) -> Set[str]:
+        """Fetch the ID of every account, to find deleted ones."""
+        # Airtable has no ID-only listing; the name is the smallest field every account has
+        records = self.fetch_records(self.table_name, fields=["Name"])
+        
+        return {record["id"] for record in records}
+    
+    def _load_accounts(self) -> List[Account]:
+        """
+        Fetch the account list and cache it, unless it was invalidated during the fetch.
+        
+        With delta sync and a cached list, only records modified since the last
+        sync are fetched and merged in. Every ACCOUNTS_RECONCILE_INTERVAL seconds
+        the account IDs are fetched as well, to drop deleted accounts.
+        """
+        with self._accounts_lock:
+            generation = self._accounts_generation
+            accounts = self._accounts
+            watermark = self._accounts_watermark
+            reconcile = time.monotonic() - self._accounts_reconciled_at >= self.accounts_reconcile_interval
+        
+        # The next watermark is taken before fetching, so edits made during the fetch are picked up next time
+        synced_at = datetime.now(timezone.utc) - timedelta(seconds=DELTA_SYNC_OVERLAP)
+        
+        if self.accounts_delta_sync and accounts is not None and watermark is not None:
+            changed = self._fetch_accounts(modified_since=watermark)
+            account_ids = self._fetch_account_ids() if reconcile else None
+            accounts = self._merge_accounts(accounts, changed, account_ids)
+        else:
+            accounts = self._fetch_accounts()
+            reconcile = True
+        
+        with self._accounts_lock:
+            if generation == self._accounts_generation:
+                self._accounts = accounts
+                self._accounts_version += 1
+                self._accounts_fetched_at = time.monotonic()
+                self._accounts_watermark = synced_at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+                if reconcile:
+                    self._accounts_reconciled_at = self._accounts_fetched_at
+        
+        return accounts
+    
+    @staticmethod
+    def _merge_accounts(accounts: List[Account], changed: List[Account],
+                        account_ids: Optional[Set[str]] = None) -> List[Account]:
+        """
+        Merge changed accounts into the cached list.
+        
+        Args:
+            accounts: Cached account list
+            changed: Accounts created or modified since the last sync
+            account_ids: Every current account ID, to drop deleted accounts; None skips the check
+            
+        Returns:
+            The cached list itself if nothing changed, so the account index is kept, or a new list
+        """
+        if not changed and (account_ids is None or all(account.id in account_ids for account in accounts)):
+            return accounts
+        
+        merged = {account.id: account for account in accounts}
+        merged.update((account.id, account) for account in changed)
+        if account_ids is not None:
+            merged = {account_id: account for account_id, account in merged.items() if account_id in account_ids}
+        
+        return list(merged.values())
+    
+    def _start_accounts_refresh(self) -> None:
+        """Refresh the account list on a background thread, unless a refresh is running. Caller holds the lock."""
+        if self._accounts_refreshing:
+            return
+        self._accounts_refreshing = True
+        
+        def refresh():
+            try:
+                self._accounts_flight.do("accounts", self._load_accounts)
+            except Exception as e:
+                print(f"Error refreshing accounts from Airtable: {str(e)}")
+            finally:
+                with self._accounts_lock:
+                    self._accounts_refreshing = False
+        
+        threading.Thread(target=refresh, name="airtable-accounts-refresh", daemon=True).start()
     
     def save_research(self, research: Research) -> Dict[str, Any]:
         """Save research to Airtable."""
+        result = self.save_research_batch([research])
+        if not result["success"] or "created" not in result:
+            return result
+        
+        if result["updated"]:
+            return {"success": True, "message": "Research updated successfully"}
+        return {"success": True, "message": "Research saved successfully"}
+    
+    def save_research_batch(self, researches: List[Research]) -> Dict[str, Any]:
+        """
+        Save research for many accounts to Airtable.
+        
+        Records are upserted with Account ID as the merge key, 10 per request,
+        so there is no lookup before the write. Creation fields are left out of
+        the upsert, so existing records keep their creation time and author, and
+        are then set on the records Airtable reports as created.
+        
+        Args:
+            researches: Research to save; for an account listed twice, the last one wins
+            
+        Returns:
+            Dictionary with success status, message and the number of records created and updated
+        """
         if not self.is_configured:
             return {
                 "success": False,
@@ -44,48 +384,83 @@ class AirtableService:
             }
         
         try:
-            # Create a table instance for research data
-            research_table = Table(self.api_key, self.base_id, 'Research')
-            
-            # Check if research already exists for this account
-            existing_records = research_table.all(formula=f"{{Account ID}}='{research.account_id}'")
+            by_account = {research.account_id: research for research in researches}
+            saved_at = datetime.now()
+            for research in by_account.values():
+                research.updated_at = saved_at
+            records = [{"fields": self._research_fields(research)} for research in by_account.values()]
             
-            if existing_records:
-                # Update existing record
-                record_id = existing_records[0]['id']
-                research.updated_at = None  # Force update of timestamp in __post_init__
-                
-                data = {
-                    'Account ID': research.account_id,
-                    'Account Name': research.account_name,
-                    'Industry Insights': research.industry_insights,
-                    'Company Insights': research.company_insights,
-                    'Vision Insights': research.vision_insights,
-                    'Recommended Talk Track': research.recommended_talk_track,
-                    'Updated At': research.updated_at.isoformat()
-                }
-                
-                research_table.update(record_id, data)
-                return {"success": True, "message": "Research updated successfully"}
+            if records:
+                research_table = self._table(RESEARCH_TABLE)
+                result = airtable_circuit_breaker.call(
+                    lambda: research_table.batch_upsert(records, key_fields=["Account ID"])
+                )
+                self._set_creation_fields(research_table, result, by_account)
             else:
-                # Create new record
-                data = {
-                    'Account ID': research.account_id,
-                    'Account Name': research.account_name,
-                    'Industry Insights': research.industry_insights,
-                    'Company Insights': research.company_insights,
-                    'Vision Insights': research.vision_insights,
-                    'Recommended Talk Track': research.recommended_talk_track,
-                    'Created At': research.created_at.isoformat(),
-                    'Updated At': research.updated_at.isoformat()
-                }
-                
-                if research.created_by:
-                    data['Created By'] = research.created_by
-                
-                research_table.create(data)
-                return {"success": True, "message": "Research saved successfully"}
-                
+                result = {"records": [], "createdRecords": [], "updatedRecords": []}
+            
+            self._write_through(RESEARCH_TABLE, result["records"])
+            
+            return {
+                "success": True,
+                "message": f"Research saved for {len(result['records'])} accounts",
+                "created": len(result["createdRecords"]),
+                "updated": len(result["updatedRecords"])
+            }
+        
         except Exception as e:
             print(f"Error saving research to Airtable: {str(e)}")
             return {"success": False, "message": f"Error: {str(e)}"}
+    
+    @staticmethod
+    def _research_fields(research: Research) -> Dict[str, Any]:
+        """Airtable fields of a research record, without the creation fields."""
+        return {
+            'Account ID': research.account_id,
+            'Account Name': research.account_name,
+            'Industry Insights': research.industry_insights,
+            'Company Insights': research.company_insights,
+            'Vision Insights': research.vision_insights,
+            'Recommended Talk Track': research.recommended_talk_track,
+            'Updated At': research.updated_at.isoformat()
+        }
+    
+    def _set_creation_fields(self, research_table: Any, result: Dict[str, Any],
+                             by_account: Dict[str, Research]) -> None:
+        """
+        Set Created At and Created By on the records an upsert created, in one batch update.
+        
+        Args:
+            research_table: Research table the upsert was sent to
+            result: Response of the upsert; its records are replaced by the updated ones
+            by_account: Saved research by Account ID
+        """
+        created = set(result["createdRecords"])
+        updates = []
+        for record in result["records"]:
+            if record["id"] not in created:
+                continue
+            research = by_account[record["fields"]["Account ID"]]
+            fields = {'Created At': research.created_at.isoformat()}
+            if research.created_by:
+                fields['Created By'] = research.created_by
+            updates.append({"id": record["id"], "fields": fields})
+        
+        if not updates:
+            return
+        
+        updated = {
+            record["id"]: record
+            for record in airtable_circuit_breaker.call(lambda: research_table.batch_update(updates))
+        }
+        result["records"] = [updated.get(record["id"], record) for record in result["records"]]
+    
+    def _write_through(self, table_name: str, records: List[Dict[str, Any]]) -> None:
+        """Copy records just written to Airtable into the replica, so reads see them before the next sync."""
+        if self.replica is None:
+            return
+        try:
+            self.replica.upsert(table_name, records)
+        except Exception as e:
+            # The next sync picks the records up; the write to Airtable already succeeded
+            print(f"Error updating the Airtable replica: {str(e)}")
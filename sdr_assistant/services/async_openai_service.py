@@ -0,0 +1,99 @@
+"""
+Asynchronous service for interacting with the OpenAI API.
+Wraps an OpenAIService for its prompts and fallbacks, but never blocks the event loop.
+"""
+import httpx
+from typing import Dict, Optional
+
+from ..interfaces.service_interface import AsyncOpenAIServiceInterface
+from ..utils.deadline import Deadline
+from ..utils.exceptions import CircuitOpenError, DeadlineExceededError
+from ..utils.rate_limiter import estimate_request_tokens
+from .http_client import OPENAI_URL, async_post_with_deadline, async_request_timeout, is_server_error
+from .openai_service import OpenAIService, openai_circuit_breaker, openai_hedger, openai_rate_limiter
+
+
+class AsyncOpenAIService(AsyncOpenAIServiceInterface):
+    """Service for non-blocking OpenAI API interactions."""
+
+    def __init__(self, service: Optional[OpenAIService] = None):
+        """
+        Initialize the async OpenAI service.
+
+        Args:
+            service: Synchronous service that builds the prompts and requests and
+                provides the fallback talk track; only its transport-neutral helpers are used
+        """
+        self.service = service or OpenAIService()
+
+    def is_configured(self) -> bool:
+        """Check if an OpenAI API key is configured."""
+        return bool(self.service.api_key)
+
+    async def generate_talk_track(self, account_name: str, insights: Dict[str, str],
+                                  deadline: Optional[Deadline] = None) -> Optional[str]:
+        """
+        Generate a talk track using OpenAI based on research insights.
+
+        Args:
+            account_name: Name of the account/company
+            insights: Dictionary containing industry_insights, company_insights, and vision_insights
+            deadline: Request deadline the call must finish by, if any
+
+        Returns:
+            The generated talk track, the fallback talk track if the API fails,
+            or None if the deadline passed first
+        """
+        if not self.service._has_usable_api_key():
+            return self.service._get_fallback_talk_track(account_name)
+
+        headers, data = self.service._build_request(self.service._build_talk_track_prompt(account_name, insights))
+        tokens = estimate_request_tokens(data)
+
+        try:
+            async_request_timeout(deadline)
+            openai_circuit_breaker.raise_if_open()
+            response = await openai_hedger.call_async(
+                lambda: openai_rate_limiter.send_async(
+                    openai_circuit_breaker.wrap_async(
+                        lambda: async_post_with_deadline(
+                            f'{OPENAI_URL}/v1/chat/completions',
+                            deadline,
+                            headers=headers,
+                            json=data
+                        ),
+                        is_failure=is_server_error
+                    ),
+                    tokens=tokens,
+                    deadline=deadline
+                ),
+                is_failure=is_server_error
+            )
+
+            if response.status_code == 200:
+                response_data = response.json()
+                openai_rate_limiter.reconcile(tokens, response_data.get('usage', {}).get('total_tokens'))
+                talk_track = response_data['choices'][0]['message']['content']
+                print(f"✅ OpenAI API request successful: received {len(talk_track)} characters")
+                return talk_track
+
+            print(f"❌ OpenAI API Error: Status {response.status_code}")
+            print(f"Error details: {response.text}")
+            return self.service._get_fallback_talk_track(account_name)
+        except DeadlineExceededError as e:
+            print(f"⏱️ Skipping OpenAI API request: {str(e)}")
+            return None
+        except CircuitOpenError as e:
+            print(f"⚡ Skipping OpenAI API request: {str(e)}")
+            return self.service._get_fallback_talk_track(account_name)
+        except httpx.ConnectError as e:
+            print(f"❌ Connection Error: Could not connect to OpenAI API: {str(e)}")
+            return self.service._get_fallback_talk_track(account_name)
+        except httpx.TimeoutException as e:
+            print(f"❌ Timeout Error: OpenAI API request timed out: {str(e)}")
+            if deadline is not None and deadline.expired():
+                return None
+            return self.service._get_fallback_talk_track(account_name)
+        except Exception as e:
+            print(f"❌ Unexpected error making OpenAI API request: {str(e)}")
+            return self.service._get_fallback_talk_track(account_name)
@@ -0,0 +1,153 @@
+"""
+Asynchronous service for interacting with the Perplexity API.
+Wraps a PerplexityService for its prompts, parsing and fallbacks, but never blocks the event loop.
+"""
+import asyncio
+import httpx
+from typing import Dict, List, Optional, Tuple
+
+from ..interfaces.service_interface import AsyncPerplexityServiceInterface
+from ..utils.deadline import Deadline
+from ..utils.exceptions import CircuitOpenError, DeadlineExceededError
+from ..utils.rate_limiter import estimate_request_tokens
+from .http_client import PERPLEXITY_URL, async_post_with_deadline, async_request_timeout, is_server_error
+from .perplexity_service import (
+    PARALLEL_MODE, SECTION_NAMES, PerplexityService, perplexity_circuit_breaker, perplexity_hedger, perplexity_rate_limiter
+)
+
+
+class AsyncPerplexityService(AsyncPerplexityServiceInterface):
+    """Service for non-blocking Perplexity API interactions."""
+
+    def __init__(self, service: Optional[PerplexityService] = None):
+        """
+        Initialize the async Perplexity service.
+
+        Args:
+            service: Synchronous service that builds the prompts and requests and
+                parses the responses; only its transport-neutral helpers are used
+        """
+        self.service = service or PerplexityService()
+
+    def is_configured(self) -> bool:
+        """Check if a Perplexity API key is configured."""
+        return bool(self.service.api_key)
+
+    async def generate_insights(self, account_name: str,
+                                deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Generate insights about a company using the Perplexity API.
+        If API fails, returns placeholder data for demonstration purposes.
+
+        Args:
+            account_name: Name of the account/company
+            deadline: Request deadline; sections not finished by then are None
+
+        Returns:
+            Tuple of (industry_insights, company_insights, vision_insights)
+        """
+        if not self.service.api_key:
+            print("Perplexity API key not configured")
+            return self.service._get_placeholder_insights(account_name)
+
+        try:
+            if self.service.insights_mode == PARALLEL_MODE:
+                all_insights = await self._get_parallel_insights(account_name, deadline)
+            else:
+                all_insights = await self._get_combined_insights(account_name, deadline)
+
+            if not all_insights:
+                return self.service._get_placeholder_insights(account_name)
+
+            return all_insights
+        except Exception as e:
+            print(f"Error generating insights via API: {str(e)}")
+            return self.service._get_placeholder_insights(account_name)
+
+    async def generate_sections(self, account_name: str, sections: List[str],
+                                deadline: Optional[Deadline] = None) -> Dict[str, Optional[str]]:
+        """
+        Generate only the given insight sections, one API call per section.
+
+        Args:
+            account_name: Name of the account/company
+            sections: Names from SECTION_NAMES to generate
+            deadline: Request deadline; sections not finished by then are None
+
+        Returns:
+            Dictionary mapping each requested section to its content, or None if generation failed
+        """
+        if not sections or not self.service._has_usable_api_key():
+            return {section: None for section in sections}
+
+        prompts = dict(zip(SECTION_NAMES, self.service._build_section_prompts(account_name)))
+        results = await asyncio.gather(*(self._make_perplexity_request(prompts[section], deadline) for section in sections))
+        return dict(zip(sections, results))
+
+    async def _get_combined_insights(self, account_name: str,
+                                     deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Generate all insights for the account in a single API call."""
+        response = await self._make_perplexity_request(self.service._build_combined_prompt(account_name), deadline)
+
+        if not response:
+            return None, None, None
+
+        return self.service._split_combined_response(account_name, response)
+
+    async def _get_parallel_insights(self, account_name: str,
+                                     deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Generate each insights section with its own API call, running the calls concurrently."""
+        return tuple(await asyncio.gather(
+            *(self._make_perplexity_request(prompt, deadline) for prompt in self.service._build_section_prompts(account_name))
+        ))
+
+    async def _make_perplexity_request(self, prompt: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Make a request to the Perplexity API, timing out at the deadline if one is given."""
+        if not self.service._has_usable_api_key():
+            return None
+
+        headers, data = self.service._build_request(prompt)
+        tokens = estimate_request_tokens(data)
+
+        try:
+            async_request_timeout(deadline)
+            perplexity_circuit_breaker.raise_if_open()
+            response = await perplexity_hedger.call_async(
+                lambda: perplexity_rate_limiter.send_async(
+                    perplexity_circuit_breaker.wrap_async(
+                        lambda: async_post_with_deadline(
+                            f'{PERPLEXITY_URL}/chat/completions',
+                            deadline,
+                            headers=headers,
+                            json=data
+                        ),
+                        is_failure=is_server_error
+                    ),
+                    tokens=tokens,
+                    deadline=deadline
+                ),
+                is_failure=is_server_error
+            )
+
+            if response.status_code == 200:
+                response_data = response.json()
+                perplexity_rate_limiter.reconcile(tokens, response_data.get('usage', {}).get('total_tokens'))
+                insight_text = response_data['choices'][0]['message']['content']
+                print(f"✅ Perplexity API request successful: received {len(insight_text)} characters")
+                return insight_text
+
+            print(f"❌ Perplexity API Error: Status {response.status_code}")
+            print(f"Error details: {response.text}")
+            return None
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            print(f"⚡ Skipping Perplexity API request: {str(e)}")
+            return None
+        except httpx.ConnectError as e:
+            print(f"❌ Connection Error: Could not connect to Perplexity API: {str(e)}")
+            return None
+        except httpx.TimeoutException as e:
+            print(f"❌ Timeout Error: Perplexity API request timed out: {str(e)}")
+            return None
+        except Exception as e:
+            print(f"❌ Unexpected error making Perplexity API request: {str(e)}")
+            return None
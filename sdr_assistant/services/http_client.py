@@ -0,0 +1,345 @@
+"""
+Shared HTTP clients for outbound provider calls.
+Provides a pooled, thread-safe synchronous session used by the provider services
+and a single pooled asynchronous client used by the async service layer.
+"""
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from pyairtable.api.retrying import retry_strategy
+
+from ..config.settings import settings
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.deadline import Deadline
+from ..utils.exceptions import DeadlineExceededError
+from ..utils.hedging import Hedger
+
+
+PERPLEXITY_URL = settings.PERPLEXITY_URL
+OPENAI_URL = settings.OPENAI_URL
+AIRTABLE_URL = settings.AIRTABLE_URL
+
+_client: Optional[requests.Session] = None
+_client_lock = threading.Lock()
+
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Bytes read at a time when a response body is read against a deadline
+RESPONSE_CHUNK_SIZE = 8192
+
+
+def _provider_pools() -> Dict[str, int]:
+    """Keep-alive pool size for each provider host."""
+    return {
+        PERPLEXITY_URL: settings.PERPLEXITY_POOL_SIZE,
+        OPENAI_URL: settings.OPENAI_POOL_SIZE,
+        AIRTABLE_URL: settings.AIRTABLE_POOL_SIZE
+    }
+
+
+def get_http_client() -> requests.Session:
+    """
+    Get the shared synchronous HTTP client.
+
+    Every provider host gets its own keep-alive connection pool, so calls reuse
+    open TCP/TLS connections instead of handshaking on every request. The
+    session carries no per-call state (auth is passed per request), so it is
+    safe to share between threads.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            session = requests.Session()
+            for url, pool_size in _provider_pools().items():
+                session.mount(url, HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size,
+                    # Airtable rate limits at 5 requests/second; keep pyairtable's 429 retries
+                    max_retries=retry_strategy() if url == AIRTABLE_URL else 0
+                ))
+            session.mount("https://", HTTPAdapter(pool_maxsize=settings.HTTP_POOL_SIZE))
+            _client = session
+
+        return _client
+
+
+def create_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Create a circuit breaker for a provider using the configured thresholds.
+
+    Args:
+        name: Provider name
+
+    Returns:
+        CircuitBreaker instance
+    """
+    return CircuitBreaker(
+        name,
+        failure_rate_threshold=settings.CIRCUIT_FAILURE_RATE,
+        slow_call_seconds=settings.CIRCUIT_SLOW_CALL_SECONDS,
+        slow_call_rate_threshold=settings.CIRCUIT_SLOW_CALL_RATE,
+        window_size=settings.CIRCUIT_WINDOW_SIZE,
+        minimum_calls=settings.CIRCUIT_MINIMUM_CALLS,
+        open_seconds=settings.CIRCUIT_OPEN_SECONDS,
+        half_open_calls=settings.CIRCUIT_HALF_OPEN_CALLS
+    )
+
+
+def create_hedger(name: str, pool_size: int) -> Hedger:
+    """
+    Create a request hedger for a provider using the configured policy.
+
+    Args:
+        name: Provider name
+        pool_size: Keep-alive pool size of the provider, which bounds its hedging threads
+
+    Returns:
+        Hedger instance
+    """
+    return Hedger(
+        name,
+        enabled=settings.HEDGE_ENABLED,
+        percentile=settings.HEDGE_PERCENTILE,
+        min_delay=settings.HEDGE_MIN_DELAY,
+        max_extra_load=settings.HEDGE_MAX_EXTRA_LOAD,
+        window_size=settings.HEDGE_WINDOW_SIZE,
+        minimum_samples=settings.HEDGE_MINIMUM_SAMPLES,
+        max_workers=pool_size,
+        max_calls=settings.HEDGE_MAX_CONCURRENT_CALLS
+    )
+
+
+def request_timeout(deadline: Optional[Deadline] = None) -> Tuple[float, float]:
+    """
+    Get the (connect, read) timeout for a provider call.
+
+    Args:
+        deadline: Request deadline the call must finish by, if any
+
+    Returns:
+        The configured provider timeouts, capped to the time left before the deadline
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    connect, read = settings.PROVIDER_CONNECT_TIMEOUT, settings.PROVIDER_TIMEOUT
+    if deadline is None:
+        return connect, read
+
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded", {"budget": deadline.budget})
+
+    return min(connect, remaining), min(read, remaining)
+
+
+def async_request_timeout(deadline: Optional[Deadline] = None) -> httpx.Timeout:
+    """Version of request_timeout() for the async client."""
+    connect, read = request_timeout(deadline)
+    return httpx.Timeout(read, connect=connect)
+
+
+def post_with_deadline(url: str, deadline: Optional[Deadline] = None, **kwargs: Any) -> requests.Response:
+    """
+    Send a POST request to a provider that finishes by the deadline.
+
+    requests applies the read timeout to each socket read, so a response that
+    keeps trickling in could run past the deadline. With a deadline, the body
+    is streamed and the deadline is checked after every chunk. The connection is
+    closed and discarded as soon as it passes.
+
+    Args:
+        url: URL to post to
+        deadline: Request deadline the call must finish by, if any
+        **kwargs: Arguments passed to requests, e.g. headers and json
+
+    Returns:
+        The response, with its body read
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before the body is read
+    """
+    client = get_http_client()
+    if deadline is None:
+        return client.post(url, timeout=request_timeout(), **kwargs)
+
+    response = client.post(url, timeout=request_timeout(deadline), stream=True, **kwargs)
+    # read1 returns whatever one socket read yields (urllib3 2); read waits for the full chunk
+    read = getattr(response.raw, "read1", response.raw.read)
+    chunks = []
+    try:
+        while True:
+            chunk = read(RESPONSE_CHUNK_SIZE, decode_content=True)
+            if not chunk:
+                break
+            if deadline.expired():
+                raise DeadlineExceededError("Request deadline exceeded while reading the response",
+                                            {"budget": deadline.budget})
+            chunks.append(chunk)
+    except BaseException:
+        response.close()
+        raise
+
+    # Keep the body where requests stores it when it reads the body itself, so .json() and .text work
+    response._content = b"".join(chunks)
+    return response
+
+
+async def async_post_with_deadline(url: str, deadline: Optional[Deadline] = None, **kwargs: Any) -> httpx.Response:
+    """Version of post_with_deadline() for the async client, cancelling the request at the deadline."""
+    client = get_async_client()
+    if deadline is None:
+        return await client.post(url, timeout=async_request_timeout(), **kwargs)
+
+    try:
+        return await asyncio.wait_for(
+            client.post(url, timeout=async_request_timeout(deadline), **kwargs), deadline.remaining()
+        )
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError("Request deadline exceeded while reading the response",
+                                    {"budget": deadline.budget}) from None
+
+
+def is_server_error(response: Any) -> bool:
+    """
+    Whether a provider response signals the provider itself is failing (5xx).
+
+    A 429 only means the caller is over its budget; the rate limiter retries it,
+    and it must not trip the circuit breaker. Connection errors and timeouts are
+    raised, so the breaker counts them as failures on its own.
+    """
+    return response.status_code >= 500
+
+
+def warm_up(urls: Optional[List[str]] = None, timeout: float = 5.0) -> Dict[str, bool]:
+    """
+    Open a connection to each provider host ahead of the first real call.
+
+    Args:
+        urls: Base URLs to connect to; defaults to the configured providers
+        timeout: Connect/read timeout for each warm-up request, in seconds
+
+    Returns:
+        Dictionary mapping each URL to whether a connection was established
+    """
+    if urls is None:
+        urls = []
+        if settings.PERPLEXITY_API_KEY:
+            urls.append(PERPLEXITY_URL)
+        if settings.OPENAI_API_KEY:
+            urls.append(OPENAI_URL)
+        if settings.is_airtable_configured():
+            urls.append(AIRTABLE_URL)
+
+    client = get_http_client()
+    results = {}
+
+    for url in urls:
+        try:
+            # Any response means the connection (and TLS session) is now pooled
+            client.head(url, timeout=timeout)
+            results[url] = True
+        except requests.exceptions.RequestException as e:
+            print(f"Could not warm up connection to {url}: {str(e)}")
+            results[url] = False
+
+    return results
+
+
+def start_warm_up() -> threading.Thread:
+    """Warm up provider connections on a background thread so startup is not delayed."""
+    thread = threading.Thread(target=warm_up, name="http-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get connection pool utilisation for the shared synchronous client.
+
+    Returns:
+        Dictionary mapping each pooled host to its pool size, connections
+        currently checked out, idle keep-alive connections, connections opened
+        and requests sent
+    """
+    stats = {}
+
+    for adapter in get_http_client().adapters.values():
+        manager = getattr(adapter, "poolmanager", None)
+        if manager is None:
+            continue
+
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+
+            queue = pool.pool
+            max_size = queue.maxsize if queue is not None else 0
+            available = list(queue.queue) if queue is not None else []
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "maxSize": max_size,
+                "inUse": max_size - len(available),
+                "idle": sum(1 for conn in available if conn is not None),
+                "connectionsOpened": pool.num_connections,
+                "requests": pool.num_requests
+            }
+
+    return stats
+
+
+def _http2_enabled() -> bool:
+    """Whether HTTP/2 is requested and the optional h2 package is installed."""
+    if not settings.HTTP_CLIENT_HTTP2:
+        return False
+
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("HTTP_CLIENT_HTTP2 is set but the 'h2' package is not installed; using HTTP/1.1")
+        return False
+
+    return True
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared asynchronous HTTP client for the running event loop.
+
+    The client is created lazily and reused by every async service, so
+    connections are pooled and kept alive across requests.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            timeout=async_request_timeout(),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=100),
+            http2=_http2_enabled()
+        )
+        _async_client_loop = loop
+
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared asynchronous HTTP client, if one was created."""
+    global _async_client, _async_client_loop
+
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = None
+    _async_client_loop = None
@@ -5,9 +5,36 @@ Handles operations related to generating talk tracks and other content.
 import os
 import requests
 import json
-from typing import Dict, Any, Optional
+import hashlib
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 from ..config.settings import settings
+from ..utils.deadline import Deadline
+from ..utils.exceptions import CircuitOpenError, DeadlineExceededError, StreamInterruptedError
+from ..utils.rate_limiter import RateLimiter, estimate_request_tokens
+from .http_client import (
+    OPENAI_URL, create_circuit_breaker, create_hedger, get_http_client, is_server_error, post_with_deadline,
+    request_timeout
+)
+from .streaming import iter_chat_completion_deltas
+
+
+# Shared by every OpenAI client in the process, sync and async
+openai_rate_limiter = RateLimiter(
+    "OpenAI",
+    requests_per_minute=settings.OPENAI_RPM,
+    tokens_per_minute=settings.OPENAI_TPM,
+    max_wait=settings.RATE_LIMIT_MAX_WAIT,
+    max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+    backoff_base=settings.RATE_LIMIT_BACKOFF_BASE,
+    backoff_max=settings.RATE_LIMIT_BACKOFF_MAX
+)
+
+# Fails calls fast to the fallback talk track while OpenAI is degraded
+openai_circuit_breaker = create_circuit_breaker("OpenAI")
+
+# Duplicates unusually slow completions when hedging is enabled
+openai_hedger = create_hedger("OpenAI", settings.OPENAI_POOL_SIZE)
 
 
 class OpenAIService:
@@ -16,24 +43,200 @@ class OpenAIService:
     def __init__(self):
         """Initialize the OpenAI service."""
         self.api_key = settings.OPENAI_API_KEY
+        self.model = "gpt-3.5-turbo"
+        self.system_prompt = "You are an experienced SDR that creates personalized talk tracks. You MUST follow the exact structure requested by the user, including using the exact section titles (Hypothesis, Targeted Questions, Current State, Clear Next Steps) as specified. Do not use alternative headings like 'Hook' or anything else that was not specifically requested."
     
-    def generate_talk_track(self, account_name: str, insights: Dict[str, str]) -> Optional[str]:
+    def generate_talk_track(self, account_name: str, insights: Dict[str, str],
+                            deadline: Optional[Deadline] = None) -> Optional[str]:
         """
         Generate a talk track using OpenAI based on research insights.
         
         Args:
             account_name: Name of the account/company
             insights: Dictionary containing industry_insights, company_insights, and vision_insights
+            deadline: Request deadline the call must finish by, if any
+            
+        Returns:
+            The generated talk track, the fallback talk track if the API fails,
+            or None if the deadline passed first
+        """
+        # Construct the prompt for the talk track
+        talk_track_prompt = self._build_talk_track_prompt(account_name, insights)
+
+        if not self._has_usable_api_key():
+            return self._get_fallback_talk_track(account_name)
+
+        print(f"📤 Making OpenAI API request for talk track generation for {account_name}...")
+
+        headers, data = self._build_request(talk_track_prompt)
+        tokens = estimate_request_tokens(data)
+        
+        try:
+            request_timeout(deadline)
+            openai_circuit_breaker.raise_if_open()
+            print(f"📡 Connecting to OpenAI API...")
+            response = openai_hedger.call(
+                lambda: openai_rate_limiter.send(
+                    openai_circuit_breaker.wrap(
+                        lambda: post_with_deadline(
+                            f'{OPENAI_URL}/v1/chat/completions',
+                            deadline,
+                            headers=headers,
+                            json=data
+                        ),
+                        is_failure=is_server_error
+                    ),
+                    tokens=tokens,
+                    deadline=deadline
+                ),
+                is_failure=is_server_error
+            )
+            
+            if response.status_code == 200:
+                response_data = response.json()
+                openai_rate_limiter.reconcile(tokens, response_data.get('usage', {}).get('total_tokens'))
+                talk_track = response_data['choices'][0]['message']['content']
+                print(f"✅ OpenAI API request successful: received {len(talk_track)} characters")
+                return talk_track
+            else:
+                print(f"❌ OpenAI API Error: Status {response.status_code}")
+                print(f"Error details: {response.text}")
+                return self._get_fallback_talk_track(account_name)
+                
+        except DeadlineExceededError as e:
+            print(f"⏱️ Skipping OpenAI API request: {str(e)}")
+            return None
+        except CircuitOpenError as e:
+            print(f"⚡ Skipping OpenAI API request: {str(e)}")
+            return self._get_fallback_talk_track(account_name)
+        except requests.exceptions.ConnectionError as e:
+            print(f"❌ Connection Error: Could not connect to OpenAI API: {str(e)}")
+            return self._get_fallback_talk_track(account_name)
+        except requests.exceptions.Timeout as e:
+            print(f"❌ Timeout Error: OpenAI API request timed out: {str(e)}")
+            if deadline is not None and deadline.expired():
+                return None
+            return self._get_fallback_talk_track(account_name)
+        except Exception as e:
+            print(f"❌ Unexpected error making OpenAI API request: {str(e)}")
+            return self._get_fallback_talk_track(account_name)
+            
+    def stream_talk_track(self, account_name: str, insights: Dict[str, str]) -> Iterator[str]:
+        """
+        Stream a talk track token by token.
+        
+        If the API cannot be used or fails before producing any content, the
+        fallback talk track is yielded as a single chunk instead. If the stream
+        fails or ends early after content was yielded, StreamInterruptedError is
+        raised so the caller does not treat the partial talk track as complete.
+        
+        Args:
+            account_name: Name of the account/company
+            insights: Dictionary containing industry_insights, company_insights, and vision_insights
+            
+        Yields:
+            Fragments of the talk track in order
+            
+        Raises:
+            StreamInterruptedError: If the stream broke off after yielding content
+        """
+        if not self._has_usable_api_key():
+            yield self._get_fallback_talk_track(account_name)
+            return
+        
+        print(f"📤 Making streaming OpenAI API request for talk track generation for {account_name}...")
+        
+        headers, data = self._build_request(self._build_talk_track_prompt(account_name, insights), stream=True)
+        received = 0
+        
+        try:
+            openai_circuit_breaker.raise_if_open()
+            with openai_rate_limiter.send(
+                openai_circuit_breaker.wrap(
+                    lambda: get_http_client().post(
+                        f'{OPENAI_URL}/v1/chat/completions',
+                        headers=headers,
+                        json=data,
+                        stream=True,
+                        timeout=request_timeout()
+                    ),
+                    is_failure=is_server_error
+                ),
+                tokens=estimate_request_tokens(data)
+            ) as response:
+                if response.status_code != 200:
+                    print(f"❌ OpenAI API Error: Status {response.status_code}")
+                    print(f"Error details: {response.text}")
+                else:
+                    lines = response.iter_lines(decode_unicode=True)
+                    for delta in iter_chat_completion_deltas(lines, require_done=True):
+                        received += len(delta)
+                        yield delta
+        except Exception as e:
+            print(f"❌ Error streaming OpenAI API response: {str(e)}")
+            if received:
+                raise StreamInterruptedError(f"Talk track stream for {account_name} broke off: {str(e)}") from e
+        
+        if not received:
+            yield self._get_fallback_talk_track(account_name)
+            
+    def get_prompt_fingerprint(self, account_name: str) -> str:
+        """
+        Fingerprint the model and prompt template used to generate a talk track.
+        
+        The insights are left empty so the fingerprint only changes when the
+        template, system prompt or model changes.
+        
+        Args:
+            account_name: Name of the account/company
             
         Returns:
-            The generated talk track or None if there was an error
+            Hex digest of the model, system prompt and talk track prompt
         """
+        material = "\n".join([self.model, self.system_prompt, self._build_talk_track_prompt(account_name, {})])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def _has_usable_api_key(self) -> bool:
+        """Check that a real OpenAI API key is configured, warning if not."""
+        if not self.api_key:
+            print("⚠️ WARNING: OpenAI API key is not configured or is empty")
+            return False
+            
+        if self.api_key == "your_openai_api_key_here" or self.api_key == "placeholder_key" or self.api_key == "sk-...": 
+            print("⚠️ WARNING: Using placeholder OpenAI API key. Please update with a real key.")
+            return False
+        
+        return True
+    
+    def _build_request(self, prompt: str, stream: bool = False) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build the headers and JSON body for a chat completion request."""
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+        
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 1000
+        }
+        
+        if stream:
+            data["stream"] = True
+        
+        return headers, data
+    
+    def _build_talk_track_prompt(self, account_name: str, insights: Dict[str, str]) -> str:
+        """Build the talk track prompt from the research insights."""
         industry_insights = insights.get('industry_insights', '')
         company_insights = insights.get('company_insights', '')
         vision_insights = insights.get('vision_insights', '')
         
-        # Construct the prompt for the talk track
-        talk_track_prompt = f"""You are an experienced SDR at Codeium, an AI coding assistant company that helps developers write code faster and more accurately. 
+        return f"""You are an experienced SDR at Codeium, an AI coding assistant company that helps developers write code faster and more accurately. 
 
 I'm about to contact {account_name} and need a compelling, highly personalized talk track based on the following AI-generated research insights. CRUCIAL: Extract specific facts from these insights to create a tailored approach.
 
@@ -71,60 +274,7 @@ Create a talk track that does ALL of the following:
 Make every aspect of this talk track SPECIFIC to {account_name} - avoid generic statements that could apply to any company. Use actual facts about their technology, challenges, and business objectives from the research.
 
 Structure your response with clear sections, bullet points for key talking points, and bolded headers for better readability. Keep it under 250 words and ensure it flows naturally for a conversation."""
-
-        if not self.api_key:
-            print("⚠️ WARNING: OpenAI API key is not configured or is empty")
-            return self._get_fallback_talk_track(account_name)
-            
-        if self.api_key == "your_openai_api_key_here" or self.api_key == "placeholder_key" or self.api_key == "sk-...": 
-            print("⚠️ WARNING: Using placeholder OpenAI API key. Please update with a real key.")
-            return self._get_fallback_talk_track(account_name)
-
-        print(f"📤 Making OpenAI API request for talk track generation for {account_name}...")
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}'
-        }
-        
-        data = {
-            "model": "gpt-3.5-turbo",
-            "messages": [
-                {"role": "system", "content": "You are an experienced SDR that creates personalized talk tracks. You MUST follow the exact structure requested by the user, including using the exact section titles (Hypothesis, Targeted Questions, Current State, Clear Next Steps) as specified. Do not use alternative headings like 'Hook' or anything else that was not specifically requested."},
-                {"role": "user", "content": talk_track_prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1000
-        }
-        
-        try:
-            print(f"📡 Connecting to OpenAI API...")
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data
-            )
-            
-            if response.status_code == 200:
-                response_data = response.json()
-                talk_track = response_data['choices'][0]['message']['content']
-                print(f"✅ OpenAI API request successful: received {len(talk_track)} characters")
-                return talk_track
-            else:
-                print(f"❌ OpenAI API Error: Status {response.status_code}")
-                print(f"Error details: {response.text}")
-                return self._get_fallback_talk_track(account_name)
-                
-        except requests.exceptions.ConnectionError as e:
-            print(f"❌ Connection Error: Could not connect to OpenAI API: {str(e)}")
-            return self._get_fallback_talk_track(account_name)
-        except requests.exceptions.Timeout as e:
-            print(f"❌ Timeout Error: OpenAI API request timed out: {str(e)}")
-            return self._get_fallback_talk_track(account_name)
-        except Exception as e:
-            print(f"❌ Unexpected error making OpenAI API request: {str(e)}")
-            return self._get_fallback_talk_track(account_name)
-            
+    
     def _get_fallback_talk_track(self, account_name: str) -> str:
         """Generate a fallback talk track when API calls fail."""
         return f"""# Personalized Talk Track for {account_name}
@@ -4,9 +4,121 @@ Handles operations related to generating insights about companies and industries
 """
 import requests
 import json
-from typing import Dict, Any, Optional, List, Tuple
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
 from ..config.settings import settings
+from ..utils.deadline import Deadline
+from ..utils.exceptions import CircuitOpenError, DeadlineExceededError, PerplexityAPIError
+from ..utils.rate_limiter import RateLimiter, estimate_request_tokens
+from .http_client import (
+    PERPLEXITY_URL, create_circuit_breaker, create_hedger, get_http_client, is_server_error, post_with_deadline,
+    request_timeout
+)
+from .streaming import iter_chat_completion_deltas
+
+
+# Order of the sections in the combined insights response
+SECTION_NAMES = ("industry", "company", "vision")
+
+# Insights modes: one combined prompt, or one prompt per section run concurrently
+COMBINED_MODE = "combined"
+PARALLEL_MODE = "parallel"
+
+# Shared by every Perplexity client in the process, sync and async
+perplexity_rate_limiter = RateLimiter(
+    "Perplexity",
+    requests_per_minute=settings.PERPLEXITY_RPM,
+    tokens_per_minute=settings.PERPLEXITY_TPM,
+    max_wait=settings.RATE_LIMIT_MAX_WAIT,
+    max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+    backoff_base=settings.RATE_LIMIT_BACKOFF_BASE,
+    backoff_max=settings.RATE_LIMIT_BACKOFF_MAX
+)
+
+# Fails calls fast to the placeholder insights while Perplexity is degraded
+perplexity_circuit_breaker = create_circuit_breaker("Perplexity")
+
+# Duplicates unusually slow completions when hedging is enabled
+perplexity_hedger = create_hedger("Perplexity", settings.PERPLEXITY_POOL_SIZE)
+
+
+class SectionSplitter:
+    """
+    Incremental splitter for markdown insights.
+    
+    A new section starts at every line beginning with "## " or "### ". Text can be
+    fed in arbitrary chunks, and each section is returned as soon as the header
+    that follows it arrives.
+    """
+    
+    def __init__(self):
+        """Initialize an empty splitter."""
+        self._buffer = ""
+        self._current_section = ""
+    
+    def feed(self, text: str) -> List[str]:
+        """
+        Feed a chunk of the response.
+        
+        Args:
+            text: Next chunk of markdown text
+            
+        Returns:
+            Sections completed by this chunk
+        """
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split('\n')
+        
+        completed = []
+        for line in lines:
+            section = self._add_line(line)
+            if section is not None:
+                completed.append(section)
+        return completed
+    
+    def close(self) -> List[str]:
+        """
+        Flush the remaining text once the response is complete.
+        
+        Returns:
+            Sections completed by the end of the response
+        """
+        completed = []
+        section = self._add_line(self._buffer)
+        if section is not None:
+            completed.append(section)
+        self._buffer = ""
+        
+        if self._current_section:
+            completed.append(self._current_section.strip())
+            self._current_section = ""
+        return completed
+    
+    def _add_line(self, line: str) -> Optional[str]:
+        """Add a complete line, returning the section it closes, if any."""
+        closed = None
+        if line.startswith("## ") or line.startswith("### "):
+            if self._current_section:
+                closed = self._current_section.strip()
+                self._current_section = ""
+        self._current_section += line + "\n"
+        return closed
+
+
+def split_sections(response: str) -> List[str]:
+    """
+    Split a complete markdown response into sections at "## " and "### " headers.
+    
+    Args:
+        response: Full markdown response
+        
+    Returns:
+        List of stripped sections
+    """
+    splitter = SectionSplitter()
+    return splitter.feed(response) + splitter.close()
 
 
 class PerplexityService:
@@ -15,14 +127,19 @@ class PerplexityService:
     def __init__(self):
         """Initialize the Perplexity service."""
         self.api_key = settings.PERPLEXITY_API_KEY
+        self.model = "sonar"
+        self.system_prompt = "You are a helpful research assistant that provides accurate, concise, and well-structured information."
+        self.insights_mode = settings.PERPLEXITY_INSIGHTS_MODE
     
-    def generate_insights(self, account_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    def generate_insights(self, account_name: str,
+                          deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Generate insights about a company using the Perplexity API.
         If API fails, returns placeholder data for demonstration purposes.
         
         Args:
             account_name: Name of the account/company
+            deadline: Request deadline; sections not finished by then are None
             
         Returns:
             Tuple of (industry_insights, company_insights, vision_insights)
@@ -32,8 +149,11 @@ class PerplexityService:
             return self._get_placeholder_insights(account_name)
         
         try:
-            # Make a single API call to get all insights for better performance
-            all_insights = self._get_combined_insights(account_name)
+            if self.insights_mode == PARALLEL_MODE:
+                all_insights = self._get_parallel_insights(account_name, deadline)
+            else:
+                # Make a single API call to get all insights for better performance
+                all_insights = self._get_combined_insights(account_name, deadline)
             
             if not all_insights:
                 return self._get_placeholder_insights(account_name)
@@ -43,54 +163,122 @@ class PerplexityService:
             print(f"Error generating insights via API: {str(e)}")
             return self._get_placeholder_insights(account_name)
             
-    def _get_combined_insights(self, account_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Generate all insights for the account in a single API call for better performance."""
-        prompt = f"""Provide comprehensive research on {account_name} divided into exactly three separate sections. 
-        Format each section with a Markdown header.
+    def generate_sections(self, account_name: str, sections: List[str],
+                          deadline: Optional[Deadline] = None) -> Dict[str, Optional[str]]:
+        """
+        Generate only the given insight sections, one API call per section.
         
-        SECTION 1 - INDUSTRY INSIGHTS:
-        Analyze the industry in which {account_name} operates:
-        1. Recent industry trends and developments
-        2. Competitive landscape and market dynamics
-        3. Regulatory factors or challenges affecting the industry
+        Used to refresh individual sections of existing research. The calls run
+        concurrently and, unlike generate_insights, failures are not replaced
+        with placeholder content.
         
-        SECTION 2 - COMPANY INFORMATION:
-        Specific information about {account_name}:
-        1. Core products, services, and business model
-        2. Recent company news, initiatives, or strategic shifts
-        3. Key challenges and pain points they might be experiencing
+        Args:
+            account_name: Name of the account/company
+            sections: Names from SECTION_NAMES to generate
+            deadline: Request deadline; sections not finished by then are None
+            
+        Returns:
+            Dictionary mapping each requested section to its content, or None if generation failed
+        """
+        if not sections or not self._has_usable_api_key():
+            return {section: None for section in sections}
         
-        SECTION 3 - FORWARD-THINKING VISION:
-        Strategic recommendations for {account_name}:
-        1. Potential growth opportunities based on market trends
-        2. Technology adoption that could provide competitive advantages
-        3. How AI coding assistants could benefit their development processes
-        4. Future challenges they might face without modernizing their development tools
+        prompts = dict(zip(SECTION_NAMES, self._build_section_prompts(account_name)))
         
-        Format your response with three clearly labeled sections with markdown headers. Keep each section concise but informative.
+        with ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix="perplexity-section") as executor:
+            futures = {section: executor.submit(self._make_perplexity_request, prompts[section], deadline) for section in sections}
+            return {section: future.result() for section, future in futures.items()}
+    
+    def stream_insights(self, account_name: str) -> Iterator[Tuple[str, str]]:
+        """
+        Stream insights about a company section by section.
+        
+        Each section is yielded as soon as the markdown header that follows it
+        arrives. Sections the API does not produce, or that are missing because
+        the stream failed part way, are filled from the placeholder insights.
+        
+        Args:
+            account_name: Name of the account/company
+            
+        Yields:
+            Tuples of (section_name, section_text) in SECTION_NAMES order
+        """
+        placeholders = self._get_placeholder_insights(account_name)
+        emitted = 0
+        
+        try:
+            splitter = SectionSplitter()
+            for delta in self._stream_perplexity_request(self._build_combined_prompt(account_name)):
+                for section in splitter.feed(delta):
+                    if emitted < len(SECTION_NAMES):
+                        yield SECTION_NAMES[emitted], section
+                        emitted += 1
+            
+            for section in splitter.close():
+                if emitted < len(SECTION_NAMES):
+                    yield SECTION_NAMES[emitted], section
+                    emitted += 1
+        except Exception as e:
+            print(f"Error streaming insights via API: {str(e)}")
+        
+        for index in range(emitted, len(SECTION_NAMES)):
+            yield SECTION_NAMES[index], placeholders[index]
+            
+    def get_prompt_fingerprint(self, account_name: str) -> str:
         """
+        Fingerprint the model and prompt used to generate insights for an account.
+        
+        Any change to the prompt text or the model changes the fingerprint, which
+        lets cached research be invalidated automatically when prompts are edited.
+        
+        Args:
+            account_name: Name of the account/company
+            
+        Returns:
+            Hex digest of the model, system prompt and insights prompt(s)
+        """
+        if self.insights_mode == PARALLEL_MODE:
+            prompts = list(self._build_section_prompts(account_name))
+        else:
+            prompts = [self._build_combined_prompt(account_name)]
+        
+        material = "\n".join([self.model, self.system_prompt] + prompts)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def _get_combined_insights(self, account_name: str,
+                               deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Generate all insights for the account in a single API call for better performance."""
+        prompt = self._build_combined_prompt(account_name)
         
-        response = self._make_perplexity_request(prompt)
+        response = self._make_perplexity_request(prompt, deadline)
         
         if not response:
             return None, None, None
             
-        # Split the response into three sections
+        return self._split_combined_response(account_name, response)
+    
+    def _get_parallel_insights(self, account_name: str,
+                               deadline: Optional[Deadline] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Generate each insights section with its own API call, running the calls concurrently."""
+        fetchers = (self._get_industry_insights, self._get_company_insights, self._get_vision_insights)
+        
+        with ThreadPoolExecutor(max_workers=len(fetchers), thread_name_prefix="perplexity-section") as executor:
+            futures = [executor.submit(fetch, account_name, deadline) for fetch in fetchers]
+            return tuple(future.result() for future in futures)
+    
+    def _build_section_prompts(self, account_name: str) -> Tuple[str, str, str]:
+        """Prompts for each insights section, in SECTION_NAMES order."""
+        return (
+            self._build_industry_prompt(account_name),
+            self._build_company_prompt(account_name),
+            self._build_vision_prompt(account_name)
+        )
+    
+    def _split_combined_response(self, account_name: str, response: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Split a combined insights response into industry, company and vision sections."""
         try:
             # Look for markdown headers to split the content
-            sections = []
-            current_section = ""
-            lines = response.split('\n')
-            
-            for line in lines:
-                if line.startswith("## ") or line.startswith("### "):
-                    if current_section:
-                        sections.append(current_section.strip())
-                        current_section = ""
-                current_section += line + "\n"
-                
-            if current_section:
-                sections.append(current_section.strip())
+            sections = split_sections(response)
                 
             # Ensure we have exactly three sections
             if len(sections) == 3:
@@ -107,9 +295,40 @@ class PerplexityService:
             print(f"Error splitting insights: {str(e)}")
             return None, None, None
     
-    def _get_industry_insights(self, account_name: str) -> Optional[str]:
+    def _build_combined_prompt(self, account_name: str) -> str:
+        """Build the single prompt that requests all three insight sections."""
+        return f"""Provide comprehensive research on {account_name} divided into exactly three separate sections. 
+        Format each section with a Markdown header.
+        
+        SECTION 1 - INDUSTRY INSIGHTS:
+        Analyze the industry in which {account_name} operates:
+        1. Recent industry trends and developments
+        2. Competitive landscape and market dynamics
+        3. Regulatory factors or challenges affecting the industry
+        
+        SECTION 2 - COMPANY INFORMATION:
+        Specific information about {account_name}:
+        1. Core products, services, and business model
+        2. Recent company news, initiatives, or strategic shifts
+        3. Key challenges and pain points they might be experiencing
+        
+        SECTION 3 - FORWARD-THINKING VISION:
+        Strategic recommendations for {account_name}:
+        1. Potential growth opportunities based on market trends
+        2. Technology adoption that could provide competitive advantages
+        3. How AI coding assistants could benefit their development processes
+        4. Future challenges they might face without modernizing their development tools
+        
+        Format your response with three clearly labeled sections with markdown headers. Keep each section concise but informative.
+        """
+    
+    def _get_industry_insights(self, account_name: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """Generate industry insights for the account."""
-        prompt = f"""I need to prepare for a sales call with {account_name}. 
+        return self._make_perplexity_request(self._build_industry_prompt(account_name), deadline)
+    
+    def _build_industry_prompt(self, account_name: str) -> str:
+        """Prompt for the industry insights section."""
+        return f"""I need to prepare for a sales call with {account_name}. 
         Give me a detailed analysis of their industry, including:
         1. Key market trends and challenges in their industry
         2. Common technical challenges companies in this space face
@@ -120,12 +339,14 @@ class PerplexityService:
         Provide comprehensive insights I can use to show industry expertise.
         Include specific metrics and trends where possible.
         """
-        
-        return self._make_perplexity_request(prompt)
     
-    def _get_company_insights(self, account_name: str) -> Optional[str]:
+    def _get_company_insights(self, account_name: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """Generate company-specific insights for the account."""
-        prompt = f"""I need detailed information about {account_name} for a sales call.
+        return self._make_perplexity_request(self._build_company_prompt(account_name), deadline)
+    
+    def _build_company_prompt(self, account_name: str) -> str:
+        """Prompt for the company insights section."""
+        return f"""I need detailed information about {account_name} for a sales call.
         Provide me with:
         1. Their main products/services and target customers
         2. Recent company announcements, initiatives, or strategic shifts
@@ -136,12 +357,14 @@ class PerplexityService:
         Focus specifically on {account_name}, not general industry information.
         Include factual information that would be valuable for a sales conversation.
         """
-        
-        return self._make_perplexity_request(prompt)
     
-    def _get_vision_insights(self, account_name: str) -> Optional[str]:
+    def _get_vision_insights(self, account_name: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """Generate forward-thinking vision insights for the account."""
-        prompt = f"""Based on current trends and {account_name}'s position, give me a forward-thinking analysis of:
+        return self._make_perplexity_request(self._build_vision_prompt(account_name), deadline)
+    
+    def _build_vision_prompt(self, account_name: str) -> str:
+        """Prompt for the forward-thinking vision section."""
+        return f"""Based on current trends and {account_name}'s position, give me a forward-thinking analysis of:
         1. How AI and advanced developer tools could transform their business operations
         2. Potential opportunities for innovation in their development processes
         3. How they could gain competitive advantage through improved coding efficiency
@@ -150,44 +373,73 @@ class PerplexityService:
         Be specific to {account_name}'s situation and provide insights that demonstrate thought leadership.
         Focus on the transformative potential of AI coding assistants for their business.
         """
-        
-        return self._make_perplexity_request(prompt)
     
-    def _make_perplexity_request(self, prompt: str) -> Optional[str]:
-        """Make a request to the Perplexity API."""
+    def _has_usable_api_key(self) -> bool:
+        """Check that a real Perplexity API key is configured, warning if not."""
         if not self.api_key:
             print("⚠️ WARNING: Perplexity API key is not configured or is empty")
-            return None
+            return False
             
         if self.api_key == "your_perplexity_api_key_here" or self.api_key == "placeholder_key":
             print("⚠️ WARNING: Using placeholder Perplexity API key. Please update with a real key.")
-            return None
-            
-        print(f"📤 Making Perplexity API request with prompt: {prompt[:50]}...")
+            return False
         
+        return True
+    
+    def _build_request(self, prompt: str, stream: bool = False) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build the headers and JSON body for a chat completion request."""
         headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
         
         data = {
-            "model": "sonar",
+            "model": self.model,
             "messages": [
-                {"role": "system", "content": "You are a helpful research assistant that provides accurate, concise, and well-structured information."},
+                {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": prompt}
             ]
         }
         
+        if stream:
+            data["stream"] = True
+        
+        return headers, data
+    
+    def _make_perplexity_request(self, prompt: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Make a request to the Perplexity API, timing out at the deadline if one is given."""
+        if not self._has_usable_api_key():
+            return None
+            
+        print(f"📤 Making Perplexity API request with prompt: {prompt[:50]}...")
+        
+        headers, data = self._build_request(prompt)
+        tokens = estimate_request_tokens(data)
+        
         try:
+            request_timeout(deadline)
+            perplexity_circuit_breaker.raise_if_open()
             print(f"📡 Connecting to Perplexity API...")
-            response = requests.post(
-                'https://api.perplexity.ai/chat/completions',
-                headers=headers,
-                json=data
+            response = perplexity_hedger.call(
+                lambda: perplexity_rate_limiter.send(
+                    perplexity_circuit_breaker.wrap(
+                        lambda: post_with_deadline(
+                            f'{PERPLEXITY_URL}/chat/completions',
+                            deadline,
+                            headers=headers,
+                            json=data
+                        ),
+                        is_failure=is_server_error
+                    ),
+                    tokens=tokens,
+                    deadline=deadline
+                ),
+                is_failure=is_server_error
             )
             
             if response.status_code == 200:
                 response_data = response.json()
+                perplexity_rate_limiter.reconcile(tokens, response_data.get('usage', {}).get('total_tokens'))
                 insight_text = response_data['choices'][0]['message']['content']
                 print(f"✅ Perplexity API request successful: received {len(insight_text)} characters")
                 return insight_text
@@ -196,6 +448,9 @@ class PerplexityService:
                 print(f"Error details: {response.text}")
                 return None
                 
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            print(f"⚡ Skipping Perplexity API request: {str(e)}")
+            return None
         except requests.exceptions.ConnectionError as e:
             print(f"❌ Connection Error: Could not connect to Perplexity API: {str(e)}")
             return None
@@ -206,6 +461,45 @@ class PerplexityService:
             print(f"❌ Unexpected error making Perplexity API request: {str(e)}")
             return None
             
+    def _stream_perplexity_request(self, prompt: str) -> Iterator[str]:
+        """
+        Make a streaming request to the Perplexity API.
+        
+        Yields:
+            Content fragments as they arrive
+
+        Raises:
+            PerplexityAPIError: If the API key is unusable or the API returns an error status
+        """
+        if not self._has_usable_api_key():
+            raise PerplexityAPIError("Perplexity API key is not configured")
+        
+        print(f"📤 Making streaming Perplexity API request with prompt: {prompt[:50]}...")
+        
+        headers, data = self._build_request(prompt, stream=True)
+        perplexity_circuit_breaker.raise_if_open()
+        
+        with perplexity_rate_limiter.send(
+            perplexity_circuit_breaker.wrap(
+                lambda: get_http_client().post(
+                    f'{PERPLEXITY_URL}/chat/completions',
+                    headers=headers,
+                    json=data,
+                    stream=True,
+                    timeout=request_timeout()
+                ),
+                is_failure=is_server_error
+            ),
+            tokens=estimate_request_tokens(data)
+        ) as response:
+            if response.status_code != 200:
+                raise PerplexityAPIError(
+                    f"Perplexity API Error: Status {response.status_code}",
+                    {"status_code": response.status_code, "body": response.text}
+                )
+            
+            yield from iter_chat_completion_deltas(response.iter_lines(decode_unicode=True))
+            
     def _get_placeholder_insights(self, account_name: str) -> Tuple[str, str, str]:
         """Generate placeholder insights when API calls fail."""
         industry_insights = f"""### Industry Trends for {account_name}
@@ -0,0 +1,47 @@
+"""
+Helpers for consuming streamed chat completion responses.
+Perplexity and OpenAI both stream completions as Server-Sent Events with OpenAI-style deltas.
+"""
+import json
+from typing import Iterable, Iterator
+
+from ..utils.exceptions import StreamInterruptedError
+
+
+def iter_chat_completion_deltas(lines: Iterable[str], require_done: bool = False) -> Iterator[str]:
+    """
+    Extract content deltas from a streamed chat completion.
+
+    Args:
+        lines: Decoded lines of the SSE response body, e.g. response.iter_lines(decode_unicode=True)
+        require_done: Raise if the body ends without the [DONE] marker, i.e. the response was cut short
+
+    Yields:
+        Content fragments in the order they were received
+
+    Raises:
+        StreamInterruptedError: If require_done is set and the stream ended early
+    """
+    for line in lines:
+        if not line or not line.startswith("data:"):
+            continue
+
+        payload = line[len("data:"):].strip()
+        if payload == "[DONE]":
+            return
+
+        try:
+            chunk = json.loads(payload)
+        except ValueError:
+            continue
+
+        choices = chunk.get('choices') or []
+        if not choices:
+            continue
+
+        content = (choices[0].get('delta') or {}).get('content')
+        if content:
+            yield content
+
+    if require_done:
+        raise StreamInterruptedError("Stream ended before [DONE]")
@@ -7,6 +7,7 @@ import os
 import sys
 import json
 from typing import Dict, Any
+from unittest.mock import patch
 
 # Add the parent directory to the path so we can import from the sdr_assistant package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -20,6 +21,25 @@ def mock_env_variables(monkeypatch):
     monkeypatch.setenv("PERPLEXITY_API_KEY", "mock_perplexity_key")
     monkeypatch.setenv("JWT_SECRET_KEY", "mock_jwt_secret")
 
+@pytest.fixture
+def research_manager():
+    """Fixture to create a ResearchManager with mocked services and a fresh in-memory cache."""
+    from sdr_assistant.core.research import ResearchManager
+    from sdr_assistant.core.research_cache import ResearchCache
+
+    with patch('sdr_assistant.core.research.AirtableService'), \
+         patch('sdr_assistant.core.research.PerplexityService'), \
+         patch('sdr_assistant.core.research.OpenAIService'):
+        manager = ResearchManager()
+    manager.cache = ResearchCache(ttl=3000, max_bytes=1_000_000)
+    manager.perplexity_service.get_prompt_fingerprint.return_value = "perplexity-fingerprint"
+    manager.openai_service.get_prompt_fingerprint.return_value = "openai-fingerprint"
+    manager.perplexity_service.generate_insights.return_value = (
+        "Industry insights", "Company insights", "Vision insights"
+    )
+    manager.openai_service.generate_talk_track.return_value = "Talk track"
+    yield manager
+
 @pytest.fixture
 def sample_account_data() -> Dict[str, Any]:
     """Fixture to provide sample account data for testing."""
@@ -0,0 +1,62 @@
+"""
+Tests for account-name normalization and the alias index.
+"""
+from sdr_assistant.core.account_index import AccountIndex, normalize_account_name, normalize_domain
+from sdr_assistant.models.account import Account
+
+def test_normalize_account_name_strips_legal_suffixes():
+    """Test that case, punctuation and trailing legal suffixes are ignored."""
+    assert normalize_account_name("NVIDIA") == "nvidia"
+    assert normalize_account_name("Nvidia Corp.") == "nvidia"
+    assert normalize_account_name("  NVIDIA   Corporation, Inc. ") == "nvidia"
+    assert normalize_account_name("AT&T Inc") == "at and t"
+    assert normalize_account_name("Company") == "company"
+
+def test_normalize_domain():
+    """Test that websites and bare domains reduce to the same domain, and names are not domains."""
+    assert normalize_domain("https://www.nvidia.com/en-us/") == "nvidia.com"
+    assert normalize_domain("NVIDIA.com") == "nvidia.com"
+    assert normalize_domain("nvidia.com:443") == "nvidia.com"
+    assert normalize_domain("NVIDIA") is None
+    assert normalize_domain("Acme Co. Ltd") is None
+    assert normalize_domain(None) is None
+
+def test_lookup_resolves_aliases_to_canonical_account():
+    """Test that name variants and domains resolve to the account, and the first of duplicates wins."""
+    nvidia = Account(id="rec1", name="NVIDIA Corporation", website="https://www.nvidia.com")
+    duplicate = Account(id="rec2", name="Nvidia Corp", website="nvidia.com")
+    acme = Account(id="rec3", name="Acme", website="")
+    index = AccountIndex([nvidia, duplicate, acme])
+
+    assert index.lookup("nvidia") is nvidia
+    assert index.lookup("Nvidia Corp.") is nvidia
+    assert index.lookup("nvidia.com") is nvidia
+    assert index.lookup("http://nvidia.com/about") is nvidia
+    assert index.lookup("ACME, Inc.") is acme
+    assert index.lookup("Globex") is None
+
+def test_get_by_id():
+    """Test that accounts are found by record ID."""
+    accounts = Account.create_mock_accounts()
+    index = AccountIndex(accounts)
+
+    assert index.get_by_id("mock3") is accounts[2]
+    assert index.get_by_id("missing") is None
+
+def test_search_ranks_exact_then_prefix_then_word_then_fuzzy():
+    """Test typeahead ranking: exact alias, name prefix, word prefix, then trigram similarity for typos."""
+    index = AccountIndex([
+        Account(id="rec1", name="Financial Times"),
+        Account(id="rec2", name="Global Financial", website="globalfinancial.com"),
+        Account(id="rec3", name="Fin"),
+        Account(id="rec4", name="Acme")
+    ])
+
+    assert [account.id for account in index.search("fin")] == ["rec3", "rec1", "rec2"]
+    assert [account.id for account in index.search("glob")] == ["rec2"]
+    assert [account.id for account in index.search("globalfinancial.com")] == ["rec2"]
+    assert [account.id for account in index.search("finantial")] == ["rec1", "rec2"]
+    assert [account.id for account in index.search("global finacial")] == ["rec2"]
+    assert [account.id for account in index.search("acmee")] == ["rec4"]
+    assert index.search("fin", limit=1)[0].id == "rec3"
+    assert index.search("") == []
@@ -0,0 +1,151 @@
+"""
+Tests for account paging and the streamed account details route.
+"""
+import json
+import threading
+import pytest
+from flask import Flask
+from unittest.mock import patch
+from sdr_assistant.core import accounts as accounts_module
+from sdr_assistant.api.account_routes import accounts_bp, get_account_details, refresh_accounts
+from sdr_assistant.core.accounts import AccountManager, account_manager
+from sdr_assistant.core.auth import auth_manager
+from sdr_assistant.models.account import Account
+
+@pytest.fixture
+def accounts():
+    """Fixture to provide a list of 250 accounts."""
+    return [Account(id=f"rec{index:03d}", name=f"Account {index:03d}") for index in range(250)]
+
+@pytest.fixture
+def app(accounts):
+    """Fixture to create an app with the accounts blueprint, serving the account fixture."""
+    app = Flask(__name__)
+    app.register_blueprint(accounts_bp, url_prefix='/api')
+    with patch.object(account_manager, 'get_accounts', return_value=accounts):
+        yield app
+
+def get_details(app, query=""):
+    """Call the account details route and return its response."""
+    with app.test_request_context(f'/api/accounts/details{query}'):
+        response = app.make_response(get_account_details())
+        # Consume the stream inside the request context it depends on
+        response.data = response.get_data()
+    return response
+
+def test_pages_cover_every_account_once(accounts):
+    """Test that following cursors returns each account exactly once, in order."""
+    manager = AccountManager()
+    seen = []
+    cursor = None
+
+    with patch.object(manager, 'get_accounts', return_value=accounts):
+        while True:
+            page, cursor = manager.get_accounts_page(cursor, 100)
+            seen.extend(account.id for account in page)
+            if cursor is None:
+                break
+
+    assert seen == [account.id for account in accounts]
+
+def test_cursor_survives_deleted_and_inserted_accounts(accounts):
+    """Test that a page resumes after the cursor account, or at its old position if it was deleted."""
+    manager = AccountManager()
+
+    with patch.object(manager, 'get_accounts', return_value=accounts):
+        page, cursor = manager.get_accounts_page(None, 10)
+
+    changed = [Account(id="recNEW", name="New")] + accounts[:9] + accounts[10:]
+    with patch.object(manager, 'get_accounts', return_value=changed), \
+            patch.object(manager.airtable_service, 'accounts_version', return_value=("airtable", 1)):
+        resumed, _ = manager.get_accounts_page(cursor, 2)
+    assert [account.id for account in resumed] == ["rec010", "rec011"]
+
+    with pytest.raises(ValueError):
+        manager.get_accounts_page("not-a-cursor", 10)
+
+def test_details_streams_the_full_array(app, accounts):
+    """Test that the unpaged response is still a JSON array of every account."""
+    with app.test_request_context('/api/accounts/details'):
+        response = get_account_details()
+        assert response.is_streamed
+        body = response.get_data()
+
+    assert [account["id"] for account in json.loads(body)] == [account.id for account in accounts]
+
+def test_details_pages_and_ndjson(app):
+    """Test cursor paging as JSON and as NDJSON with the cursor in a header."""
+    first = get_details(app, '?limit=100').get_json()
+    assert len(first["accounts"]) == 100
+    second = get_details(app, f'?limit=200&cursor={first["nextCursor"]}').get_json()
+    assert second["accounts"][0]["id"] == "rec100"
+    assert second["nextCursor"] is None
+
+    response = get_details(app, '?limit=5&format=ndjson')
+    lines = response.get_data(as_text=True).splitlines()
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in lines] == [f"rec{index:03d}" for index in range(5)]
+    assert response.headers["X-Next-Cursor"]
+
+    assert get_details(app, '?cursor=bad').status_code == 400
+
+def test_index_is_rebuilt_only_when_the_list_version_changes(accounts):
+    """Test that fresh but unchanged lists, as in mock mode or with no cache TTL, reuse the index."""
+    manager = AccountManager()
+    manager.airtable_service.is_configured = False
+
+    with patch.object(accounts_module, 'AccountIndex', wraps=accounts_module.AccountIndex) as index:
+        for _ in range(3):
+            assert manager.get_account_by_id("mock1")
+        assert index.call_count == 1
+
+        manager.airtable_service.is_configured = True
+        manager.airtable_service.replica = None
+        manager.airtable_service.accounts_ttl = 0
+        with patch.object(manager.airtable_service, '_fetch_accounts', side_effect=lambda: list(accounts)):
+            for _ in range(5):
+                assert manager.get_account_by_id("rec001").name == "Account 001"
+        # The first fetch changes the version while the lookup runs, which costs one extra rebuild
+        assert index.call_count == 3
+
+        changed = accounts[:1]
+        with patch.object(manager.airtable_service, '_fetch_accounts', return_value=changed):
+            assert manager.get_account_by_id("rec001") is None
+            assert manager.get_account_by_id("rec000")
+        assert index.call_count == 5
+
+def test_concurrent_lookups_build_the_index_once(accounts):
+    """Test that callers racing on a new list version share a single rebuild."""
+    manager = AccountManager()
+    barrier = threading.Barrier(8)
+
+    def lookup():
+        barrier.wait()
+        manager.get_account_by_id("rec001")
+
+    with patch.object(manager, 'get_accounts', return_value=accounts), \
+            patch.object(accounts_module, 'AccountIndex', wraps=accounts_module.AccountIndex) as index:
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert index.call_count == 1
+
+def test_refresh_requires_a_signed_in_user(app, accounts):
+    """Test that anonymous refreshes are rejected without touching Airtable."""
+    token = auth_manager.generate_token("user1")
+
+    with patch.object(account_manager, 'refresh_accounts', return_value=accounts) as refresh:
+        for headers in ({}, {"Authorization": "Bearer not-a-token"}):
+            with app.test_request_context('/api/accounts/refresh', method='POST', headers=headers):
+                _, status = refresh_accounts()
+            assert status == 401
+        refresh.assert_not_called()
+
+        with app.test_request_context('/api/accounts/refresh', method='POST',
+                                      headers={"Authorization": f"Bearer {token}"}):
+            response = refresh_accounts()
+        assert response.get_json() == {"success": True, "count": 250}
+        refresh.assert_called_once_with()
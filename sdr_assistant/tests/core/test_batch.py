@@ -0,0 +1,81 @@
+"""
+Tests for batch research generation.
+"""
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from sdr_assistant.core.batch import BatchResearchManager
+
+@pytest.fixture
+def batch_manager():
+    """Fixture to create a BatchResearchManager with small limits for testing."""
+    manager = BatchResearchManager()
+    manager.default_concurrency = 2
+    manager.max_concurrency = 3
+    manager.max_accounts = 10
+    manager._slots = threading.BoundedSemaphore(manager.max_concurrency)
+    return manager
+
+def _wait_for(job, timeout=5.0):
+    """Wait until a batch job has finished."""
+    deadline = time.time() + timeout
+    while job.finished_at is None and time.time() < deadline:
+        time.sleep(0.01)
+    assert job.finished_at is not None
+
+@patch('sdr_assistant.core.batch.account_manager')
+@patch('sdr_assistant.core.batch.research_manager')
+def test_batch_runs_every_account(mock_research_manager, mock_account_manager, batch_manager):
+    """Test that every account in a batch gets research and per-account status."""
+    mock_research_manager.generate_research.side_effect = lambda name, force_refresh=False: (
+        {"success": True, "accountName": name} if name != "Missing" else {"success": False, "message": "Account 'Missing' not found"}
+    )
+    account = MagicMock()
+    account.name = "From ID"
+    mock_account_manager.get_account_by_id.side_effect = lambda account_id: account if account_id == "rec1" else None
+
+    job = batch_manager.submit(account_names=["Acme", "Missing"], account_ids=["rec1", "rec2"])
+    _wait_for(job)
+
+    statuses = {(item.account_name, item.account_id): item.status for item in job.items}
+    assert statuses == {
+        ("Acme", None): "completed",
+        ("Missing", None): "failed",
+        ("From ID", "rec1"): "completed",
+        (None, "rec2"): "failed"
+    }
+    assert job.to_dict()["status"] == "completed"
+    assert job.to_dict()["counts"]["failed"] == 2
+    assert batch_manager.get_job(job.id) is job
+
+@patch('sdr_assistant.core.batch.research_manager')
+def test_batch_respects_concurrency(mock_research_manager, batch_manager):
+    """Test that no more accounts run at once than the job's concurrency."""
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def generate(name, force_refresh=False):
+        with lock:
+            running.append(name)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(name)
+        return {"success": True}
+
+    mock_research_manager.generate_research.side_effect = generate
+
+    job = batch_manager.submit(account_names=[f"Account {i}" for i in range(8)], concurrency=2)
+    _wait_for(job)
+
+    assert job.concurrency == 2
+    assert max(peak) <= 2
+
+def test_batch_validation(batch_manager):
+    """Test that empty and oversized batches are rejected."""
+    with pytest.raises(ValueError):
+        batch_manager.submit()
+    with pytest.raises(ValueError):
+        batch_manager.submit(account_names=[f"Account {i}" for i in range(11)])
@@ -0,0 +1,98 @@
+"""
+Tests for the durable job queue.
+"""
+import time
+import pytest
+from sdr_assistant.core.job_queue import JobQueue
+
+@pytest.fixture
+def queue(tmp_path):
+    """Fixture to create a JobQueue in a temporary directory."""
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+def test_enqueue_claim_complete(queue):
+    """Test the normal lifecycle of a job."""
+    job = queue.enqueue("research", {"accountName": "Acme Corp"}, max_attempts=3)
+    assert job.status == "queued"
+
+    claimed = queue.claim("worker-1", lease_seconds=60)
+    assert claimed.id == job.id
+    assert claimed.status == "running"
+    assert claimed.attempts == 1
+    assert queue.claim("worker-2", lease_seconds=60) is None
+
+    assert queue.complete(job.id, "worker-1", {"success": True})
+
+    finished = queue.get(job.id)
+    assert finished.status == "completed"
+    assert finished.result == {"success": True}
+    assert finished.finished
+
+def test_enqueue_dedupes_pending_work(queue):
+    """Test that equivalent work shares a job until it finishes."""
+    first = queue.enqueue("research", {"accountName": "Acme Corp"}, dedupe_key="acme", max_attempts=3)
+    second = queue.enqueue("research", {"accountName": "ACME corp"}, dedupe_key="acme", max_attempts=3)
+    assert second.id == first.id
+
+    queue.claim("worker-1", lease_seconds=60)
+    queue.complete(first.id, "worker-1", {"success": True})
+
+    third = queue.enqueue("research", {"accountName": "Acme Corp"}, dedupe_key="acme", max_attempts=3)
+    assert third.id != first.id
+
+def test_failed_job_is_retried_until_attempts_run_out(queue):
+    """Test that failures requeue the job until max_attempts."""
+    job = queue.enqueue("research", {"accountName": "Acme Corp"}, max_attempts=2)
+
+    queue.claim("worker-1", lease_seconds=60)
+    queue.fail(job.id, "worker-1", "boom")
+    assert queue.get(job.id).status == "queued"
+
+    queue.claim("worker-1", lease_seconds=60)
+    queue.fail(job.id, "worker-1", "boom again")
+
+    failed = queue.get(job.id)
+    assert failed.status == "failed"
+    assert failed.error == "boom again"
+    assert queue.claim("worker-1", lease_seconds=60) is None
+
+def test_expired_lease_is_reclaimed(queue):
+    """Test that a job abandoned by a dead worker is picked up again."""
+    job = queue.enqueue("research", {"accountName": "Acme Corp"}, max_attempts=3)
+    queue.claim("worker-1", lease_seconds=0.01)
+    time.sleep(0.05)
+
+    reclaimed = queue.claim("worker-2", lease_seconds=60)
+    assert reclaimed.id == job.id
+    assert reclaimed.worker_id == "worker-2"
+    assert reclaimed.attempts == 2
+    assert not queue.heartbeat(job.id, "worker-1", 60)
+    assert queue.heartbeat(job.id, "worker-2", 60)
+
+def test_worker_with_expired_lease_cannot_finish_reclaimed_job(queue):
+    """Test that a worker whose job was reclaimed can neither complete nor fail it."""
+    job = queue.enqueue("research", {"accountName": "Acme Corp"}, max_attempts=3)
+    queue.claim("worker-1", lease_seconds=0.01)
+    time.sleep(0.05)
+    queue.claim("worker-2", lease_seconds=60)
+
+    assert not queue.complete(job.id, "worker-1", {"success": True, "stale": True})
+    assert not queue.fail(job.id, "worker-1", "late failure")
+    assert queue.get(job.id).status == "running"
+
+    assert queue.complete(job.id, "worker-2", {"success": True})
+    assert queue.get(job.id).result == {"success": True}
+    assert not queue.complete(job.id, "worker-2", {"success": True, "again": True})
+
+def test_purge_finished_keeps_recent_and_pending_jobs(queue):
+    """Test that only finished jobs older than the retention are deleted."""
+    done = queue.enqueue("research", {"accountName": "Acme Corp"}, max_attempts=1)
+    queue.claim("worker-1", lease_seconds=60)
+    queue.complete(done.id, "worker-1", {"success": True})
+    pending = queue.enqueue("research", {"accountName": "Globex"}, max_attempts=1)
+
+    assert queue.purge_finished(older_than=60) == 0
+    time.sleep(0.05)
+    assert queue.purge_finished(older_than=0.01) == 1
+    assert queue.get(done.id) is None
+    assert queue.get(pending.id).status == "queued"
@@ -0,0 +1,63 @@
+"""
+Tests for off-peak research pre-warming.
+"""
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sdr_assistant.core.prewarm import ResearchPrewarmer
+from sdr_assistant.core.research_cache import ResearchCache
+from sdr_assistant.models.account import Account
+from sdr_assistant.prewarm import next_window
+
+@pytest.fixture
+def research_manager(research_manager, tmp_path):
+    """Fixture to give the shared research manager a cache with an on-disk tier, as pre-warming requires."""
+    research_manager.cache = ResearchCache(ttl=3000, max_bytes=1_000_000, cache_dir=str(tmp_path))
+    return research_manager
+
+@pytest.fixture
+def accounts():
+    """Fixture to patch the account list seen by the pre-warmer and by research generation."""
+    names = ["Alpha", "Beta", "Gamma"]
+    with patch('sdr_assistant.core.prewarm.account_manager') as prewarm_accounts, \
+         patch('sdr_assistant.core.research.account_manager') as research_accounts:
+        prewarm_accounts.get_accounts.return_value = [Account(id=f"rec{i}", name=name) for i, name in enumerate(names)]
+        research_accounts.get_account_by_name.side_effect = lambda name: Account(id="rec", name=name)
+        yield names
+
+def test_run_warms_missing_research_and_skips_fresh(research_manager, accounts):
+    """Test that missing research is generated once and fresh research is left alone on the next run."""
+    research_manager.generate_research("Beta")
+    prewarmer = ResearchPrewarmer(research_manager, concurrency=2, budget=0)
+
+    assert [name for name, _ in prewarmer.plan()] == ["Alpha", "Gamma"]
+    assert prewarmer.run()["refreshed"] == 2
+    assert research_manager.generate_research("Alpha")["cached"] is True
+    assert prewarmer.plan() == []
+
+def test_run_stops_at_budget_and_window_end(research_manager, accounts):
+    """Test that no account is started once the estimated spend or the stop time would be exceeded."""
+    prewarmer = ResearchPrewarmer(research_manager, concurrency=1)
+    prewarmer.budget = 2 * prewarmer.estimate_cost(["industry", "company", "vision"])
+
+    summary = prewarmer.run()
+    assert summary["refreshed"] == 2
+    assert summary["skipped"] == 1
+    assert summary["spent"] <= prewarmer.budget
+
+    assert ResearchPrewarmer(research_manager, budget=0).run(until=time.time() - 1)["skipped"] == 1
+
+def test_next_window():
+    """Test that the next window starts now while it is open and otherwise at the next start hour."""
+    assert next_window(datetime(2024, 1, 1, 3), 2, 6) == (datetime(2024, 1, 1, 3), datetime(2024, 1, 1, 6))
+    assert next_window(datetime(2024, 1, 1, 7), 2, 6) == (datetime(2024, 1, 2, 2), datetime(2024, 1, 2, 6))
+    assert next_window(datetime(2024, 1, 2, 1), 22, 6) == (datetime(2024, 1, 2, 1), datetime(2024, 1, 2, 6))
+    assert next_window(datetime(2024, 1, 1, 7), 22, 6) == (datetime(2024, 1, 1, 22), datetime(2024, 1, 2, 6))
+
+def test_run_refuses_without_shared_cache(research_manager, accounts):
+    """Test that nothing is generated when results would stay in this process's memory."""
+    research_manager.cache = ResearchCache(ttl=3000, max_bytes=1_000_000)
+
+    assert ResearchPrewarmer(research_manager, budget=0).run()["refreshed"] == 0
+    research_manager.perplexity_service.generate_insights.assert_not_called()
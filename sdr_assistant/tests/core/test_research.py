@@ -1,9 +1,11 @@
 """
 Tests for the Research Manager core functionality.
 """
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 from sdr_assistant.core.research import ResearchManager
+from sdr_assistant.utils.deadline import Deadline
 
 @pytest.fixture
 def research_manager():
@@ -69,3 +71,24 @@ def test_generate_research_api_failure(mock_account_manager, research_manager):
     # Assert we still get a result with fallback data
     assert result["success"] == True
     assert "Test Company" in result["industry_insights"]
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_returns_partial_result_at_deadline(mock_account_manager, research_manager):
+    """Test that sections finished before the deadline are returned and the rest are flagged as incomplete."""
+    research_manager.cache = None
+    deadline = Deadline(0.05)
+
+    def slow_insights(account_name, deadline=None):
+        time.sleep(0.1)
+        return "Industry insights", None, None
+
+    research_manager.perplexity_service.generate_insights.side_effect = slow_insights
+
+    result = research_manager.generate_research("Test Company", deadline=deadline)
+
+    assert result["success"] is True
+    assert result["partial"] is True
+    assert result["incompleteSections"] == ["company", "vision", "talk_track"]
+    assert result["industryInsights"] == "Industry insights"
+    assert result["recommendedTalkTrack"] is None
+    research_manager.openai_service.generate_talk_track.assert_not_called()
@@ -0,0 +1,156 @@
+"""
+Tests for the research result cache.
+"""
+import pytest
+from unittest.mock import patch
+from sdr_assistant.core.research_cache import ResearchCache
+from sdr_assistant.models.account import Account
+
+@pytest.fixture
+def cache():
+    """Fixture to create an in-memory ResearchCache for testing."""
+    return ResearchCache(ttl=60, max_bytes=10_000)
+
+def test_make_key_normalizes_account_name():
+    """Test that keys ignore case and whitespace differences in the account name."""
+    assert ResearchCache.make_key("  Acme   Corp ", "fp") == ResearchCache.make_key("acme corp", "fp")
+    assert ResearchCache.make_key("Acme Corp", "fp") != ResearchCache.make_key("Acme Corp", "other")
+
+def test_get_returns_none_after_ttl(cache):
+    """Test that entries expire after the TTL."""
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1000.0):
+        cache.set("key", {"value": 1})
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1059.0):
+        assert cache.get("key") == {"value": 1}
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1061.0):
+        assert cache.get("key") is None
+
+def test_lru_eviction_is_bounded_by_bytes(cache):
+    """Test that the least recently used entries are evicted once the byte budget is exceeded."""
+    payload = "x" * 3000
+    cache.set("a", {"value": payload})
+    cache.set("b", {"value": payload})
+    cache.set("c", {"value": payload})
+    cache.get("a")
+    cache.set("d", {"value": payload})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    """Test that entries written to the disk tier are readable by a new cache instance."""
+    ResearchCache(ttl=60, max_bytes=10_000, cache_dir=str(tmp_path)).set("key", {"value": 1})
+
+    assert ResearchCache(ttl=60, max_bytes=10_000, cache_dir=str(tmp_path)).get("key") == {"value": 1}
+
+def test_stale_memory_entry_is_replaced_by_newer_disk_entry(tmp_path):
+    """Test that a process holding stale research picks up the fresher entry another process wrote to the shared disk tier."""
+    web = ResearchCache(ttl=60, max_bytes=10_000, cache_dir=str(tmp_path))
+    prewarm = ResearchCache(ttl=60, max_bytes=10_000, cache_dir=str(tmp_path))
+    is_stale = lambda value: value["version"] < 2
+
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1000.0):
+        web.set("key", {"version": 1})
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1010.0):
+        prewarm.set("key", {"version": 2})
+        assert web.get("key") == {"version": 1}
+        assert web.get("key", is_stale=is_stale) == {"version": 2}
+
+    # The newer entry now lives in memory, so the disk tier is not needed any more
+    prewarm.invalidate("key")
+    with patch('sdr_assistant.core.research_cache.time.time', return_value=1010.0):
+        assert web.get("key", is_stale=is_stale) == {"version": 2}
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_served_from_cache(mock_account_manager, research_manager):
+    """Test that a repeat lookup is answered from the cache without calling providers."""
+    first = research_manager.generate_research("Test Company")
+    second = research_manager.generate_research("test company")
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["recommendedTalkTrack"] == "Talk track"
+    assert research_manager.perplexity_service.generate_insights.call_count == 1
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_reused_across_aliases(mock_account_manager, research_manager):
+    """Test that research for an account's domain is served from the research cached under its name."""
+    mock_account_manager.get_account_by_name.return_value = Account(
+        id="rec1", name="Test Company", website="https://testcompany.com"
+    )
+
+    first = research_manager.generate_research("Test Company")
+    second = research_manager.generate_research("testcompany.com")
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert research_manager.perplexity_service.generate_insights.call_count == 1
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_force_refresh(mock_account_manager, research_manager):
+    """Test that force_refresh bypasses the cache."""
+    research_manager.generate_research("Test Company")
+    result = research_manager.generate_research("Test Company", force_refresh=True)
+
+    assert result["cached"] is False
+    assert research_manager.perplexity_service.generate_insights.call_count == 2
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_does_not_cache_fallback(mock_account_manager, research_manager):
+    """Test that fallback content is not cached."""
+    research_manager.perplexity_service.generate_insights.side_effect = Exception("API error")
+
+    research_manager.generate_research("Test Company")
+    research_manager.generate_research("Test Company")
+
+    assert research_manager.perplexity_service.generate_insights.call_count == 2
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_generate_research_refreshes_only_stale_sections(mock_account_manager, research_manager):
+    """Test that only sections past their TTL are regenerated, and the talk track only when a section changed."""
+    research_manager.section_ttls = {"industry": 3000, "company": 100, "vision": 1000}
+    research_manager.cache = ResearchCache(ttl=3000, max_bytes=1_000_000)
+    research_manager.perplexity_service.generate_sections.return_value = {"company": "Company news"}
+
+    with patch('sdr_assistant.core.research.time.time', return_value=1000.0):
+        research_manager.generate_research("Test Company")
+    with patch('sdr_assistant.core.research.time.time', return_value=1150.0):
+        refreshed = research_manager.generate_research("Test Company")
+
+    research_manager.perplexity_service.generate_sections.assert_called_once_with("Test Company", ["company"], deadline=None)
+    assert research_manager.perplexity_service.generate_insights.call_count == 1
+    assert research_manager.openai_service.generate_talk_track.call_count == 2
+    assert refreshed["companyInsights"] == "Company news"
+    assert refreshed["industryInsights"] == "Industry insights"
+    assert refreshed["sectionUpdatedAt"] == {"industry": 1000.0, "company": 1150.0, "vision": 1000.0}
+
+    research_manager.perplexity_service.generate_sections.return_value = {"company": "Company news"}
+    with patch('sdr_assistant.core.research.time.time', return_value=1300.0):
+        unchanged = research_manager.generate_research("Test Company")
+
+    assert research_manager.openai_service.generate_talk_track.call_count == 2
+    assert unchanged["sectionUpdatedAt"]["company"] == 1300.0
+    with patch('sdr_assistant.core.research.time.time', return_value=1350.0):
+        assert research_manager.generate_research("Test Company")["cached"] is True
+
+@patch('sdr_assistant.core.research.account_manager')
+def test_stream_research_does_not_cache_interrupted_talk_track(mock_account_manager, research_manager):
+    """Test that a talk track stream breaking off mid-way finishes with the fallback and is not cached."""
+    from sdr_assistant.utils.exceptions import StreamInterruptedError
+
+    def interrupted_stream(account_name, insights):
+        yield "**Hypothesis:** partial"
+        raise StreamInterruptedError("connection reset")
+
+    research_manager.perplexity_service.stream_insights.return_value = iter([
+        ("industry", "Industry insights"), ("company", "Company insights"), ("vision", "Vision insights")
+    ])
+    research_manager.openai_service.stream_talk_track.side_effect = interrupted_stream
+    research_manager.openai_service._get_fallback_talk_track.return_value = "Fallback talk track"
+
+    event, result = list(research_manager.stream_research("Test Company"))[-1]
+
+    assert event == "done"
+    assert result["recommendedTalkTrack"] == "Fallback talk track"
+    assert research_manager.cache.get(research_manager._cache_key("Test Company")) is None
@@ -0,0 +1,92 @@
+"""
+Tests for the local SQLite replica of Airtable.
+"""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from sdr_assistant.models.research import Research
+from sdr_assistant.services.airtable_replica import AirtableReplica
+from sdr_assistant.services.airtable_service import AirtableService
+
+def record(record_id, **fields):
+    """Build an Airtable record."""
+    return {"id": record_id, "createdTime": "2024-01-01T00:00:00.000Z", "fields": fields}
+
+def stored_record(replica, table_name, record_id):
+    """Read a record straight from the replica database."""
+    row = replica._connect().execute(
+        "SELECT record FROM records WHERE table_name = ? AND id = ?", (table_name, record_id)
+    ).fetchone()
+    return json.loads(row["record"]) if row else None
+
+class FakeAirtable:
+    """Stand-in for AirtableService.fetch_records over in-memory tables."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def fetch_records(self, table_name, modified_since=None, fields=None):
+        self.calls.append((table_name, modified_since, fields))
+        records = self.tables.get(table_name, [])
+        if modified_since:
+            records = [r for r in records if r.get("modified", "") > modified_since]
+        return [{"id": r["id"], "fields": r["fields"]} for r in records]
+
+@pytest.fixture
+def replica(tmp_path):
+    """Fixture to create a replica in a temporary directory."""
+    return AirtableReplica(str(tmp_path / "replica.sqlite3"))
+
+def test_first_sync_copies_tables_and_later_syncs_merge_changes(replica):
+    """Test the full copy, an unchanged delta sync, then a delta sync with an edit."""
+    airtable = FakeAirtable({
+        "Companies": [record("rec1", Name="Acme"), record("rec2", Name="Globex")],
+        "Research": [record("recR1", **{"Account ID": "rec1", "Account Name": "Acme"})]
+    })
+    assert replica.get_accounts() is None
+
+    replica.sync_all(airtable, reconcile_interval=600)
+    accounts = replica.get_accounts()
+    assert [account.name for account in accounts] == ["Acme", "Globex"]
+    assert stored_record(replica, "Research", "recR1")["fields"]["Account ID"] == "rec1"
+
+    assert replica.sync_all(airtable, reconcile_interval=600)["Companies"] == {"fetched": 0, "deleted": 0}
+    assert replica.get_accounts() is accounts
+    assert airtable.calls[-1][1] is not None
+
+    airtable.tables["Companies"][1] = dict(record("rec2", Name="Globex Corp"), modified="9999")
+    replica.sync_all(airtable, reconcile_interval=600)
+    assert [account.name for account in replica.get_accounts()] == ["Acme", "Globex Corp"]
+
+def test_reconciliation_removes_deleted_records(replica):
+    """Test that the ID-only scan drops records deleted in Airtable."""
+    airtable = FakeAirtable({"Companies": [record("rec1", Name="Acme"), record("rec2", Name="Globex")]})
+    replica.sync(airtable, "Companies", reconcile_interval=0)
+
+    airtable.tables["Companies"].pop(0)
+    assert replica.sync(airtable, "Companies", reconcile_interval=0) == {"fetched": 0, "deleted": 1}
+    assert airtable.calls[-1] == ("Companies", None, ["Name"])
+    assert [account.id for account in replica.get_accounts()] == ["rec2"]
+
+def test_save_research_writes_through_to_replica(replica):
+    """Test that saving research upserts without creation fields and copies the update into the replica."""
+    replica.sync(FakeAirtable({"Research": [record("recR1", **{"Account ID": "rec1"})]}), "Research", 600)
+
+    service = AirtableService()
+    service.is_configured = True
+    service.replica = replica
+    table = MagicMock()
+    table.batch_upsert.return_value = {
+        "records": [record("recR1", **{"Account ID": "rec1", "Account Name": "Acme Updated"})],
+        "createdRecords": [],
+        "updatedRecords": ["recR1"]
+    }
+
+    with patch.object(service, '_table', return_value=table):
+        result = service.save_research(Research(account_id="rec1", account_name="Acme Updated"))
+
+    assert result == {"success": True, "message": "Research updated successfully"}
+    assert "Created At" not in table.batch_upsert.call_args.args[0][0]["fields"]
+    table.batch_update.assert_not_called()
+    assert stored_record(replica, "Research", "recR1")["fields"]["Account Name"] == "Acme Updated"
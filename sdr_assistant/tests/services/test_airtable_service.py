@@ -0,0 +1,172 @@
+"""
+Tests for the Airtable service account cache.
+"""
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from sdr_assistant.models.account import Account
+from sdr_assistant.services.airtable_service import AirtableService
+
+@pytest.fixture
+def airtable_service():
+    """Fixture to create a configured AirtableService whose fetches are counted."""
+    service = AirtableService()
+    service.is_configured = True
+    service.accounts_ttl = 60
+    service.accounts_max_stale = 600
+    service.accounts_delta_sync = False
+    service.fetches = 0
+
+    def fetch():
+        service.fetches += 1
+        time.sleep(0.05)
+        return [f"account-{service.fetches}"]
+
+    with patch.object(service, '_fetch_accounts', side_effect=fetch):
+        yield service
+
+def test_concurrent_misses_share_one_fetch(airtable_service):
+    """Test that concurrent callers with an empty cache share a single Airtable fetch, then hit the cache."""
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(airtable_service.get_accounts())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["account-1"]] * 8
+    assert airtable_service.get_accounts() is results[0]
+    assert airtable_service.fetches == 1
+
+def test_expired_list_is_served_while_refreshing_in_background(airtable_service):
+    """Test that an expired list is returned immediately and replaced by a background refresh."""
+    airtable_service.get_accounts()
+    airtable_service._accounts_fetched_at -= 61
+
+    assert airtable_service.get_accounts() == ["account-1"]
+    time.sleep(0.2)
+    assert airtable_service.get_accounts() == ["account-2"]
+    assert airtable_service.fetches == 2
+
+def test_invalidate_forces_a_fetch(airtable_service):
+    """Test that invalidation makes the next call fetch the list again."""
+    airtable_service.get_accounts()
+    airtable_service.invalidate_accounts()
+
+    assert airtable_service.get_accounts() == ["account-2"]
+
+def test_concurrent_refreshes_share_one_fetch(airtable_service):
+    """Test that a burst of refreshes invalidates the cache once and fetches the list once."""
+    airtable_service.get_accounts()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(airtable_service.refresh_accounts())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["account-2"]] * 8
+    assert airtable_service.fetches == 2
+
+def test_fetch_failure_serves_last_known_list(airtable_service):
+    """Test that a failed inline fetch falls back to the last list rather than mock accounts."""
+    airtable_service.get_accounts()
+    airtable_service._accounts_fetched_at -= 10_000
+
+    with patch.object(airtable_service, '_fetch_accounts', side_effect=RuntimeError("Airtable down")):
+        assert airtable_service.get_accounts() == ["account-1"]
+
+def test_delta_sync_merges_changed_accounts():
+    """Test that a refresh fetches only modified records after the watermark and merges them in."""
+    service = AirtableService()
+    service.is_configured = True
+    service.accounts_delta_sync = True
+    service.accounts_reconcile_interval = 600
+    initial = [Account(id="rec1", name="Acme"), Account(id="rec2", name="Globex")]
+
+    with patch.object(service, '_fetch_accounts', return_value=initial) as fetch, \
+            patch.object(service, '_fetch_account_ids') as fetch_ids:
+        accounts = service._load_accounts()
+        assert fetch.call_args.kwargs == {}
+
+        fetch.return_value = []
+        assert service._load_accounts() is accounts
+        assert fetch.call_args.kwargs == {"modified_since": service._accounts_watermark}
+
+        fetch.return_value = [Account(id="rec2", name="Globex Corp"), Account(id="rec3", name="Initech")]
+        merged = service._load_accounts()
+
+    assert [account.name for account in merged] == ["Acme", "Globex Corp", "Initech"]
+    fetch_ids.assert_not_called()
+
+def test_reconciliation_drops_deleted_accounts():
+    """Test that the periodic ID-only scan removes accounts deleted in Airtable."""
+    service = AirtableService()
+    service.is_configured = True
+    service.accounts_delta_sync = True
+    service.accounts_reconcile_interval = 0
+    initial = [Account(id="rec1", name="Acme"), Account(id="rec2", name="Globex")]
+
+    with patch.object(service, '_fetch_accounts', side_effect=[initial, []]), \
+            patch.object(service, '_fetch_account_ids', return_value={"rec2"}):
+        service._load_accounts()
+        accounts = service._load_accounts()
+
+    assert [account.id for account in accounts] == ["rec2"]
+
+def test_account_names_fetch_only_the_name_field():
+    """Test that the picker projection requests only names and is cached on its own."""
+    service = AirtableService()
+    service.is_configured = True
+    service.accounts_ttl = 60
+    records = [{"id": "rec1", "fields": {"Name": "Acme"}}, {"id": "rec2", "fields": {"Name": "Globex"}}]
+
+    with patch.object(service, 'fetch_records', return_value=records) as fetch:
+        names = service.get_account_names()
+        assert service.get_account_names() is names
+
+    assert names == [{"id": "rec1", "name": "Acme"}, {"id": "rec2", "name": "Globex"}]
+    fetch.assert_called_once_with(service.table_name, fields=["Name"])
+
+def test_account_names_are_derived_from_the_cached_list(airtable_service):
+    """Test that a cached full list is projected without another Airtable call."""
+    airtable_service._fetch_accounts.side_effect = lambda: [Account(id="rec1", name="Acme", description="Long")]
+    airtable_service.get_accounts()
+
+    with patch.object(airtable_service, 'fetch_records') as fetch:
+        names = airtable_service.get_account_names()
+        assert airtable_service.get_account_names() is names
+
+    assert names == [{"id": "rec1", "name": "Acme"}]
+    fetch.assert_not_called()
+
+def test_research_batch_upserts_against_the_fake_airtable():
+    """Test that a bulk save upserts 10 records per call, and only created records get creation fields."""
+    from sdr_assistant.fake_providers import FakeProviders
+    from sdr_assistant.models.research import Research
+
+    with FakeProviders(accounts=0) as providers, \
+            patch('sdr_assistant.services.airtable_service.AIRTABLE_URL', providers.airtable.url):
+        service = AirtableService()
+        service.is_configured = True
+        service.api_key = "fake-airtable-key"
+        service.base_id = "appFakeBase"
+
+        first = service.save_research_batch([Research(account_id=f"rec{index}", account_name=f"Account {index}")
+                                             for index in range(25)])
+        requests_after_first = providers.airtable.counters["requests"]
+        created_at = {record["id"]: record["fields"]["Created At"]
+                      for record in providers.airtable.state["tables"]["Research"]}
+        second = service.save_research_batch([Research(account_id=f"rec{index}", account_name=f"Renamed {index}")
+                                              for index in range(20, 30)])
+        table = providers.airtable.state["tables"]["Research"]
+
+    assert (first["created"], first["updated"]) == (25, 0)
+    assert requests_after_first == 3 + 3
+    assert (second["created"], second["updated"]) == (5, 5)
+    assert providers.airtable.counters["requests"] == requests_after_first + 1 + 1
+    assert len(table) == 30
+    assert all("Created At" in record["fields"] for record in table)
+    assert all(record["fields"]["Created At"] == created_at[record["id"]]
+               for record in table if record["id"] in created_at)
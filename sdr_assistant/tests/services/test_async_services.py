@@ -0,0 +1,48 @@
+"""
+Tests for the async Perplexity and OpenAI services.
+"""
+import asyncio
+from unittest.mock import patch
+from sdr_assistant.fake_providers import FakeProviders
+from sdr_assistant.services.async_openai_service import AsyncOpenAIService
+from sdr_assistant.services.async_perplexity_service import AsyncPerplexityService
+from sdr_assistant.services.http_client import close_async_client
+from sdr_assistant.services.openai_service import OpenAIService
+from sdr_assistant.services.perplexity_service import PerplexityService
+
+def test_async_services_wrap_the_sync_services():
+    """Test that the async services expose no inherited sync methods that would return unawaited coroutines."""
+    perplexity = AsyncPerplexityService()
+    openai = AsyncOpenAIService()
+
+    assert not isinstance(perplexity, PerplexityService)
+    assert not isinstance(openai, OpenAIService)
+    assert not hasattr(perplexity, "_get_industry_insights")
+    assert not hasattr(openai, "stream_talk_track")
+
+def test_async_services_generate_against_the_fake_providers():
+    """Test parallel insights and a talk track end to end against the fake providers."""
+    perplexity = AsyncPerplexityService()
+    perplexity.service.api_key = "fake-perplexity-key"
+    perplexity.service.insights_mode = "parallel"
+    openai = AsyncOpenAIService()
+    openai.service.api_key = "fake-openai-key"
+
+    async def generate():
+        try:
+            insights = await perplexity.generate_insights("Acme Corp")
+            talk_track = await openai.generate_talk_track("Acme Corp", {
+                "industry_insights": insights[0], "company_insights": insights[1], "vision_insights": insights[2]
+            })
+            return insights, talk_track
+        finally:
+            await close_async_client()
+
+    with FakeProviders(accounts=0) as providers, \
+            patch('sdr_assistant.services.async_perplexity_service.PERPLEXITY_URL', providers.perplexity.url), \
+            patch('sdr_assistant.services.async_openai_service.OPENAI_URL', providers.openai.url):
+        insights, talk_track = asyncio.run(generate())
+
+    assert all(insights)
+    assert talk_track and talk_track != OpenAIService()._get_fallback_talk_track("Acme Corp")
+    assert providers.perplexity.counters["requests"] == 3
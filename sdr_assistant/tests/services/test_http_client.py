@@ -0,0 +1,140 @@
+"""
+Tests for the shared HTTP client.
+"""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from sdr_assistant.services.http_client import (
+    AIRTABLE_URL, OPENAI_URL, PERPLEXITY_URL, async_post_with_deadline, close_async_client, get_http_client,
+    get_pool_stats, post_with_deadline, request_timeout, warm_up
+)
+from sdr_assistant.config.settings import settings
+from sdr_assistant.utils.deadline import Deadline
+from sdr_assistant.utils.exceptions import DeadlineExceededError
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive HTTP handler."""
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+
+    def do_GET(self):
+        self.do_HEAD()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+class _DripHandler(BaseHTTPRequestHandler):
+    """Handler that sends its JSON body one byte every 50ms, so no single read times out."""
+    protocol_version = "HTTP/1.1"
+    body = b'{"ok": true}'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        try:
+            for index in range(len(self.body)):
+                self.wfile.write(self.body[index:index + 1])
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def _serve(handler):
+    """Run a local HTTP server with the given handler on a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.block_on_close = False
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+@pytest.fixture
+def drip_server():
+    """Fixture to run a local HTTP server that trickles its response body."""
+    server = _serve(_DripHandler)
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def local_server():
+    """Fixture to run a local HTTP server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    server.block_on_close = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def test_client_is_shared_with_per_host_pools():
+    """Test that one client is shared and each provider host has its own pool."""
+    client = get_http_client()
+    assert get_http_client() is client
+
+    adapters = {client.get_adapter(url) for url in (PERPLEXITY_URL, OPENAI_URL, AIRTABLE_URL)}
+    assert len(adapters) == 3
+
+def test_connections_are_reused(local_server):
+    """Test that sequential requests reuse one keep-alive connection and show up in pool stats."""
+    client = get_http_client()
+    for _ in range(3):
+        assert client.get(local_server, timeout=5).text == "ok"
+
+    stats = get_pool_stats()[local_server]
+    assert stats["connectionsOpened"] == 1
+    assert stats["requests"] == 3
+    assert stats["idle"] == 1
+    assert stats["inUse"] == 0
+
+def test_warm_up_reports_unreachable_hosts(local_server):
+    """Test that warm-up opens reachable hosts and reports failures without raising."""
+    results = warm_up([local_server, "http://127.0.0.1:1"], timeout=1)
+    assert results == {local_server: True, "http://127.0.0.1:1": False}
+
+def test_request_timeout_is_capped_by_deadline():
+    """Test that provider calls get the remaining deadline budget as their timeout, and fail once it has passed."""
+    assert request_timeout() == (settings.PROVIDER_CONNECT_TIMEOUT, settings.PROVIDER_TIMEOUT)
+
+    connect, read = request_timeout(Deadline(0.5))
+    assert 0 < read <= 0.5
+    assert connect <= read
+
+    with pytest.raises(DeadlineExceededError):
+        request_timeout(Deadline(0))
+
+def test_post_with_deadline_stops_a_trickling_response(drip_server):
+    """Test that a body arriving slower than the deadline is cut off at the deadline, though no single read times out."""
+    assert post_with_deadline(drip_server, json={}).json() == {"ok": True}
+    assert post_with_deadline(drip_server, Deadline(5), json={}).json() == {"ok": True}
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        post_with_deadline(drip_server, Deadline(0.2), json={})
+    assert time.monotonic() - started < 0.4
+
+def test_async_post_with_deadline_stops_a_trickling_response(drip_server):
+    """Test that the async client is cancelled at the deadline while the body is still arriving."""
+    async def post(deadline):
+        try:
+            return await async_post_with_deadline(drip_server, deadline, json={})
+        finally:
+            await close_async_client()
+
+    assert asyncio.run(post(Deadline(5))).json() == {"ok": True}
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(post(Deadline(0.2)))
+    assert time.monotonic() - started < 0.4
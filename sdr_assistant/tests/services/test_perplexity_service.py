@@ -1,9 +1,12 @@
 """
 Tests for the Perplexity service.
 """
+import time
 import pytest
 from unittest.mock import patch, MagicMock
-from sdr_assistant.services.perplexity_service import PerplexityService
+from sdr_assistant.services.perplexity_service import (
+    COMBINED_MODE, PARALLEL_MODE, PerplexityService, SectionSplitter, split_sections
+)
 
 @pytest.fixture
 def perplexity_service():
@@ -50,3 +53,75 @@ def test_generate_insights_api_error(mock_post, perplexity_service):
     assert company is not None
     assert vision is not None
     assert "Test Company" in industry
+
+def test_section_splitter_matches_batch_split():
+    """Test that feeding a response in small chunks yields the same sections as a one-shot split."""
+    response = "## Industry Insights\nTest industry content\n### Company Information\nTest company content\n## Forward-Thinking Vision\nTest vision content"
+    splitter = SectionSplitter()
+    sections = []
+    for start in range(0, len(response), 7):
+        sections.extend(splitter.feed(response[start:start + 7]))
+    sections.extend(splitter.close())
+
+    assert sections == split_sections(response)
+    assert sections[0] == "## Industry Insights\nTest industry content"
+    assert len(sections) == 3
+
+def test_stream_insights_emits_sections_as_headers_close(perplexity_service):
+    """Test that stream_insights yields each section once the next header arrives and fills gaps with placeholders."""
+    deltas = ["## Industry\nTrends", "\n## Company\nNews\n", "## Vis", "ion\nIdeas"]
+    with patch.object(perplexity_service, '_stream_perplexity_request', return_value=iter(deltas)):
+        sections = list(perplexity_service.stream_insights("Test Company"))
+
+    assert sections == [
+        ("industry", "## Industry\nTrends"),
+        ("company", "## Company\nNews"),
+        ("vision", "## Vision\nIdeas")
+    ]
+
+    with patch.object(perplexity_service, '_stream_perplexity_request', side_effect=Exception("API error")):
+        sections = list(perplexity_service.stream_insights("Test Company"))
+
+    assert [name for name, _ in sections] == ["industry", "company", "vision"]
+    assert "Test Company" in sections[0][1]
+
+def _timed_insights(service, delay_per_section):
+    """Run generate_insights with a fake request whose latency grows with the number of sections it writes."""
+    headers = ("## Industry Insights", "## Company Information", "## Forward-Thinking Vision")
+    section_prompts = service._build_section_prompts("Test Company")
+
+    def fake_request(prompt, deadline=None):
+        if prompt in section_prompts:
+            written = [headers[section_prompts.index(prompt)]]
+        else:
+            written = list(headers)
+        time.sleep(delay_per_section * len(written))
+        return "\n".join(f"{header}\nContent" for header in written)
+
+    service.api_key = "mock_perplexity_key"
+    with patch.object(service, '_make_perplexity_request', side_effect=fake_request):
+        started = time.perf_counter()
+        insights = service.generate_insights("Test Company")
+        return insights, time.perf_counter() - started
+
+def test_parallel_mode_merges_sections_faster_than_combined(perplexity_service):
+    """Test that parallel mode returns one section per prompt and beats the combined prompt's latency."""
+    perplexity_service.insights_mode = COMBINED_MODE
+    combined, combined_elapsed = _timed_insights(perplexity_service, 0.1)
+
+    perplexity_service.insights_mode = PARALLEL_MODE
+    parallel, parallel_elapsed = _timed_insights(perplexity_service, 0.1)
+
+    assert len(parallel) == 3
+    assert parallel[0].startswith("## Industry Insights")
+    assert parallel[1].startswith("## Company Information")
+    assert parallel[2].startswith("## Forward-Thinking Vision")
+    assert all(section is not None for section in combined)
+    assert parallel_elapsed < combined_elapsed * 0.6
+
+def test_parallel_mode_changes_cache_fingerprint(perplexity_service):
+    """Test that results generated in different insights modes are cached separately."""
+    perplexity_service.insights_mode = COMBINED_MODE
+    combined = perplexity_service.get_prompt_fingerprint("Test Company")
+    perplexity_service.insights_mode = PARALLEL_MODE
+    assert perplexity_service.get_prompt_fingerprint("Test Company") != combined
@@ -0,0 +1,18 @@
+"""
+Tests for the streamed chat completion helpers.
+"""
+import pytest
+from sdr_assistant.services.streaming import iter_chat_completion_deltas
+from sdr_assistant.utils.exceptions import StreamInterruptedError
+
+LINES = ['data: {"choices": [{"delta": {"content": "Hello"}}]}', '', 'data: {"choices": [{"delta": {"content": " world"}}]}']
+
+def test_deltas_stop_at_done():
+    """Test that content is collected up to the [DONE] marker."""
+    assert list(iter_chat_completion_deltas(LINES + ['data: [DONE]', 'data: ignored'], require_done=True)) == ["Hello", " world"]
+
+def test_missing_done_raises_when_required():
+    """Test that a stream cut off before [DONE] is reported only when required."""
+    assert list(iter_chat_completion_deltas(LINES)) == ["Hello", " world"]
+    with pytest.raises(StreamInterruptedError):
+        list(iter_chat_completion_deltas(LINES, require_done=True))
@@ -0,0 +1,86 @@
+"""
+Tests for the ASGI entry point.
+"""
+import asyncio
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+import uvicorn
+from unittest.mock import patch
+from sdr_assistant import asgi
+from sdr_assistant.core.job_queue import JobQueue
+
+@pytest.fixture
+def asgi_server():
+    """Fixture to serve the ASGI app with uvicorn on a free local port."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(asgi.app, host="127.0.0.1", port=port, lifespan="off", log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(5)
+
+def call_generate_research(body):
+    """Run the ASGI research handler on a JSON body and return (status, payload)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": json.dumps(body).encode("utf-8")}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi._generate_research(receive, send))
+    return messages[0]["status"], json.loads(messages[1]["body"])
+
+def test_generate_research_enqueues_when_queue_enabled(tmp_path):
+    """Test that with the durable queue on, the handler enqueues the job and returns 202 once the wait runs out."""
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+    with patch.object(asgi.settings, 'RESEARCH_QUEUE_ENABLED', True), \
+            patch.object(asgi.settings, 'RESEARCH_QUEUE_WAIT', 0.1), \
+            patch('sdr_assistant.asgi.get_job_queue', return_value=queue), \
+            patch('sdr_assistant.core.research.get_job_queue', return_value=queue), \
+            patch.object(asgi.async_research_manager, 'generate_research') as generate:
+        status, payload = call_generate_research({"accountName": "Acme Corp"})
+
+    assert status == 202
+    assert payload["status"] == "queued"
+    generate.assert_not_called()
+
+def test_generate_research_returns_the_finished_job_result(tmp_path):
+    """Test that a job finished within the wait is returned like an inline result."""
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+    job = queue.enqueue("research", {"accountName": "Acme Corp", "forceRefresh": False},
+                        dedupe_key="research:acme corp:0", max_attempts=1)
+    queue.claim("worker-1", lease_seconds=60)
+    queue.complete(job.id, "worker-1", {"success": True, "recommendedTalkTrack": "Talk track"})
+
+    with patch.object(asgi.settings, 'RESEARCH_QUEUE_ENABLED', True), \
+            patch('sdr_assistant.asgi.get_job_queue', return_value=queue), \
+            patch.object(asgi.research_manager, 'enqueue_research', return_value=job):
+        status, payload = call_generate_research({"accountName": "Acme Corp"})
+
+    assert status == 200
+    assert payload["recommendedTalkTrack"] == "Talk track"
+
+def test_flask_routes_serve_concurrent_keep_alive_requests(asgi_server):
+    """Test that Flask routes behind the ASGI app serve several keep-alive clients at once without errors."""
+    def client(_):
+        with requests.Session() as session:
+            return [session.get(f"{asgi_server}/api/", timeout=10).status_code for _ in range(25)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        statuses = [status for statuses in executor.map(client, range(4)) for status in statuses]
+
+    assert statuses == [200] * 100
@@ -0,0 +1,64 @@
+"""
+Tests for the local fake provider servers.
+"""
+import random
+import pytest
+import requests
+from unittest.mock import patch
+from sdr_assistant.fake_providers import FakeProviders, FaultProfile, LatencyModel
+from sdr_assistant.services.perplexity_service import PerplexityService
+
+@pytest.fixture
+def providers():
+    """Fixture to run the fake providers with no latency."""
+    with FakeProviders(accounts=150) as providers:
+        yield providers
+
+def test_airtable_fake_paginates_with_offset(providers):
+    """Test that the Airtable fake pages through records like the real API."""
+    url = f"{providers.airtable.url}/v0/appFakeBase/Companies"
+    first = requests.get(url).json()
+    second = requests.get(url, params={"offset": first["offset"]}).json()
+
+    assert len(first["records"]) == 100
+    assert len(second["records"]) == 50
+    assert "offset" not in second
+
+def test_perplexity_fake_streams_sections_to_the_service(providers):
+    """Test that the service streams all three sections from the Perplexity fake."""
+    service = PerplexityService()
+    service.api_key = "fake-perplexity-key"
+
+    with patch('sdr_assistant.services.perplexity_service.PERPLEXITY_URL', providers.perplexity.url):
+        sections = [section for section, _ in service.stream_insights("Account 00001")]
+
+    assert sections == ["industry", "company", "vision"]
+
+def test_fault_profile_injects_429_and_errors():
+    """Test that rate-limit and error injection follow the configured rates and RPM limit."""
+    rng = random.Random(7)
+    profile = FaultProfile(LatencyModel("fixed", 0.0), error_rate=0.2, rate_limit_rate=0.1, rng=rng)
+    faults = [profile.fault() for _ in range(2000)]
+
+    assert 0.07 < faults.count(429) / len(faults) < 0.13
+    assert 0.17 < sum(1 for fault in faults if fault in (500, 503)) / len(faults) < 0.23
+
+    limited = FaultProfile(rpm=2)
+    assert [limited.fault() for _ in range(3)] == [None, None, 429]
+
+def test_rate_limited_response_has_retry_after():
+    """Test that an injected 429 carries a Retry-After header."""
+    with FakeProviders(openai=FaultProfile(rate_limit_rate=1.0, retry_after=2)) as providers:
+        response = requests.post(f"{providers.openai.url}/v1/chat/completions", json={"messages": []})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    assert providers.openai.counters["rateLimited"] == 1
+
+def test_latency_model_parse():
+    """Test that latency specs parse into the matching distribution."""
+    assert LatencyModel.parse("fixed:0.25").sample() == 0.25
+    assert 0.1 <= LatencyModel.parse("uniform:0.1:0.2").sample() <= 0.2
+    assert LatencyModel.parse("lognormal:1:0.5").sample() > 0
+    with pytest.raises(ValueError):
+        LatencyModel.parse("normal:1")
@@ -0,0 +1,40 @@
+"""
+Tests for the HTTP load-test harness.
+"""
+from sdr_assistant.benchmarks.loadtest import compare, percentile, run_scenario, summarize
+from sdr_assistant.fake_providers import FakeProviders
+
+def test_percentile_and_summary():
+    """Test nearest-rank percentiles and the derived throughput and error rate."""
+    latencies = [index / 1000 for index in range(1, 101)]
+
+    assert percentile(latencies, 0.5) == 0.05
+    assert percentile(latencies, 0.99) == 0.099
+    assert percentile([], 0.95) == 0.0
+
+    summary = summarize(latencies, errors=5, elapsed=2.0)
+    assert summary["throughput"] == 50.0
+    assert summary["errorRate"] == 0.05
+    assert summary["latencyMs"]["p95"] == 95.0
+
+def test_run_scenario_counts_requests_and_errors():
+    """Test that a closed-loop run records every request and counts non-2xx responses as errors."""
+    with FakeProviders(accounts=10) as providers:
+        ok = run_scenario(providers.airtable.url, lambda rng, names: ("GET", "/v0/app/Companies", None),
+                          concurrency=2, duration=0.3)
+        missing = run_scenario(providers.airtable.url, lambda rng, names: ("GET", "/missing", None),
+                               concurrency=1, duration=0.1)
+
+    assert ok["requests"] > 0
+    assert ok["errors"] == 0
+    assert missing["errorRate"] == 1.0
+
+def test_compare_reports_changes():
+    """Test that comparing two results reports the change per shared scenario."""
+    before = {"scenarios": {"accounts": summarize([0.1] * 10, 0, 1.0)}}
+    after = {"scenarios": {"accounts": summarize([0.05] * 20, 0, 1.0), "login": summarize([0.2], 0, 1.0)}}
+
+    lines = compare(before, after)
+    assert len(lines) == 1
+    assert "+100.0%" in lines[0]
+    assert "-50.0%" in lines[0]
@@ -0,0 +1,31 @@
+"""
+Tests for the microbenchmark suite.
+"""
+from unittest.mock import patch
+from sdr_assistant.benchmarks.microbench import BENCHMARKS, compare, load_baselines, run, save_baselines
+
+@patch('sdr_assistant.benchmarks.microbench.RECORDS', 50)
+def test_every_benchmark_runs():
+    """Test that every registered benchmark sets up and runs."""
+    results = run(rounds=2)
+
+    assert set(results) == set(BENCHMARKS)
+    assert all(result["medianMs"] >= 0 for result in results.values())
+
+def test_compare_flags_regressions_over_threshold():
+    """Test that only medians slower than the baseline by more than the threshold are regressions."""
+    baselines = {"fast": {"medianMs": 10.0}, "slow": {"medianMs": 10.0}}
+    results = {"fast": {"medianMs": 11.0}, "slow": {"medianMs": 12.0}, "new": {"medianMs": 1.0}}
+
+    report = {entry["name"]: entry for entry in compare(results, baselines, threshold=0.15)}
+    assert not report["fast"]["regressed"]
+    assert report["slow"]["regressed"]
+    assert report["new"]["ratio"] is None and not report["new"]["regressed"]
+
+def test_save_baselines_keeps_other_benchmarks(tmp_path):
+    """Test that saving a subset of results keeps the stored baselines of the rest."""
+    path = str(tmp_path / "baselines.json")
+    save_baselines({"a": {"medianMs": 1.0}}, path)
+    save_baselines({"b": {"medianMs": 2.0}}, path)
+
+    assert set(load_baselines(path)["benchmarks"]) == {"a", "b"}
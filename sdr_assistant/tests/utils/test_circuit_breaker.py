@@ -0,0 +1,83 @@
+"""
+Tests for the provider circuit breaker.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from sdr_assistant.services.http_client import is_server_error
+from sdr_assistant.utils.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from sdr_assistant.utils.exceptions import CircuitOpenError
+
+@pytest.fixture
+def breaker():
+    """Fixture to create a CircuitBreaker with a small window for testing."""
+    return CircuitBreaker("test", failure_rate_threshold=0.5, slow_call_seconds=1.0, slow_call_rate_threshold=0.5,
+                          window_size=4, minimum_calls=4, open_seconds=30, half_open_calls=2)
+
+def _fail():
+    raise ConnectionError("provider down")
+
+def test_opens_on_error_rate_and_fails_fast(breaker):
+    """Test that the circuit opens once the failure rate is reached and then rejects calls."""
+    breaker.call(lambda: "ok")
+    breaker.call(lambda: "ok")
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+    with pytest.raises(CircuitOpenError):
+        breaker.raise_if_open()
+    assert breaker.stats()["rejected"] == 2
+
+def test_result_check_and_slow_calls_count(breaker):
+    """Test that failed results and slow calls are counted against the provider."""
+    breaker.call(lambda: 503, is_failure=lambda status: status >= 500)
+    with patch('sdr_assistant.utils.circuit_breaker.time.monotonic', side_effect=[0, 0, 5, 5]):
+        breaker.call(lambda: 200)
+    assert breaker.state == CLOSED
+
+    stats = breaker.stats()
+    assert stats["failureRate"] == 0.5
+    assert stats["slowCallRate"] == 0.5
+
+def test_rate_limited_responses_do_not_open_the_circuit(breaker):
+    """Test that 429s from a healthy provider are not counted as failures, while 5xx responses are."""
+    for status in (429, 429, 429, 200):
+        breaker.call(lambda: MagicMock(status_code=status), is_failure=is_server_error)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["failureRate"] == 0
+
+    for _ in range(2):
+        breaker.call(lambda: MagicMock(status_code=503), is_failure=is_server_error)
+    assert breaker.state == OPEN
+
+def test_half_open_probes_close_or_reopen(breaker):
+    """Test that probes after the open period close the circuit, or reopen it on failure."""
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+    assert breaker.state == OPEN
+
+    breaker.open_seconds = 0
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.stats()["calls"] == 0
+
+    breaker.call(lambda: "ok")
+    breaker.call(lambda: "ok")
+    assert breaker.state == CLOSED
+
+def test_half_open_limits_concurrent_probes(breaker):
+    """Test that only half_open_calls probes run at once."""
+    breaker.open_seconds = 0
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
@@ -0,0 +1,124 @@
+"""
+Tests for hedged provider requests.
+"""
+import asyncio
+import threading
+import time
+import pytest
+from sdr_assistant.utils.hedging import Hedger
+
+@pytest.fixture
+def hedger():
+    """Fixture to create a Hedger that hedges after a short, fixed delay."""
+    hedger = Hedger("test", enabled=True, percentile=0.9, min_delay=0.05, max_extra_load=0.5,
+                    window_size=10, minimum_samples=4)
+    for _ in range(4):
+        hedger.call(lambda: None)
+    return hedger
+
+def test_no_hedging_until_enough_samples():
+    """Test that calls are not hedged while disabled or before the latency window has filled."""
+    assert Hedger("test", enabled=False).hedge_delay() is None
+
+    hedger = Hedger("test", enabled=True, min_delay=0.05, minimum_samples=4)
+    for _ in range(3):
+        hedger.record(0.5)
+    assert hedger.hedge_delay() is None
+    hedger.record(0.5)
+    assert hedger.hedge_delay() == 0.5
+
+def test_slow_call_is_hedged_and_first_response_wins(hedger):
+    """Test that a duplicate is sent once the primary is slower than the hedge delay, and the faster one wins."""
+    release = threading.Event()
+    attempts = []
+
+    def fn():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            release.wait(2)
+            return "primary"
+        return "hedge"
+
+    started = time.monotonic()
+    assert hedger.call(fn) == "hedge"
+    assert time.monotonic() - started < 1
+    release.set()
+
+    stats = hedger.stats()
+    assert stats["hedges"] == 1
+    assert stats["hedgeWins"] == 1
+
+def test_primary_does_not_queue_for_hedge_workers():
+    """Test that calls run at once while every hedge worker is busy, and are not hedged for the time spent waiting."""
+    hedger = Hedger("test", enabled=True, min_delay=0.05, max_extra_load=0.5, minimum_samples=4, max_workers=1)
+    for _ in range(4):
+        hedger.record(0.05)
+    release = threading.Event()
+    hedger._get_executor().submit(release.wait, 2)
+
+    started = time.monotonic()
+    assert [hedger.call(lambda: "ok") for _ in range(3)] == ["ok"] * 3
+    assert time.monotonic() - started < 1
+    assert hedger.stats()["hedges"] == 0
+    release.set()
+
+def test_queue_time_for_a_primary_thread_does_not_trigger_a_hedge():
+    """Test that primaries are bounded by max_calls and the hedge delay starts when a primary starts running."""
+    hedger = Hedger("test", enabled=True, min_delay=0.05, max_extra_load=0.5, minimum_samples=4, max_calls=1)
+    for _ in range(4):
+        hedger.record(0.05)
+    release = threading.Event()
+    hedger._get_executor(primary=True).submit(release.wait, 2)
+    threading.Timer(0.2, release.set).start()
+
+    assert hedger.call(lambda: "ok") == "ok"
+    assert hedger.stats()["hedges"] == 0
+    assert hedger._primary_executor._max_workers == 1
+
+def test_failed_hedge_waits_for_primary(hedger):
+    """Test that a failing attempt does not win over a slower successful one."""
+    attempts = []
+
+    def fn():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            time.sleep(0.2)
+            return 200
+        return 503
+
+    assert hedger.call(fn, is_failure=lambda status: status >= 500) == 200
+    assert hedger.stats()["hedgeWins"] == 0
+
+def test_extra_load_is_capped(hedger):
+    """Test that no more hedges are sent than the extra-load cap allows."""
+    hedger.max_extra_load = 0.25
+
+    for _ in range(3):
+        hedger.call(lambda: time.sleep(0.08))
+
+    stats = hedger.stats()
+    assert stats["hedges"] == 1
+    assert stats["extraLoad"] <= 0.25
+
+def test_async_hedge_cancels_loser(hedger):
+    """Test that the losing attempt of an async hedged call is cancelled."""
+    cancelled = []
+
+    async def fn():
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(2)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+            return "primary"
+        return "hedge"
+
+    async def run():
+        result = await hedger.call_async(fn)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "hedge"
+    assert cancelled == [True]
@@ -0,0 +1,98 @@
+"""
+Tests for the provider rate limiter.
+"""
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import patch, MagicMock
+from sdr_assistant.utils.deadline import Deadline
+from sdr_assistant.utils.exceptions import DeadlineExceededError, RateLimitError
+from sdr_assistant.utils.rate_limiter import RateLimiter, estimate_request_tokens, retry_after_seconds
+
+def _response(status_code, headers=None):
+    """Build a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+def test_requests_queue_once_budget_is_spent():
+    """Test that callers beyond the request budget are told to wait in turn."""
+    limiter = RateLimiter("test", requests_per_minute=2, max_wait=100)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(30, abs=0.5)
+    assert limiter.reserve() == pytest.approx(60, abs=0.5)
+
+def test_token_budget_and_max_wait():
+    """Test that token budget is enforced and long waits fail fast."""
+    limiter = RateLimiter("test", requests_per_minute=0, tokens_per_minute=1000, max_wait=10)
+
+    assert limiter.reserve(tokens=800) == 0
+    with pytest.raises(RateLimitError):
+        limiter.reserve(tokens=600)
+
+    # Actual usage was lower than estimated, so budget is returned
+    limiter.reconcile(800, 300)
+    assert limiter.reserve(tokens=600) == 0
+
+@patch('sdr_assistant.utils.rate_limiter.time.sleep')
+def test_send_retries_after_retry_after(mock_sleep):
+    """Test that a 429 pauses the limiter for Retry-After and the request is retried."""
+    limiter = RateLimiter("test", requests_per_minute=600, max_retries=3, backoff_base=0.1)
+    send = MagicMock(side_effect=[_response(429, {"Retry-After": "2"}), _response(200)])
+
+    response = limiter.send(send)
+
+    assert response.status_code == 200
+    assert send.call_count == 2
+    slept = sum(call.args[0] for call in mock_sleep.call_args_list)
+    assert 2 <= slept <= 2.2
+
+@patch('sdr_assistant.utils.rate_limiter.time.sleep')
+def test_send_returns_last_429_when_retries_run_out(mock_sleep):
+    """Test that persistent 429s are returned to the caller after max_retries."""
+    limiter = RateLimiter("test", requests_per_minute=0, max_retries=2, backoff_base=0.01, backoff_max=0.02)
+    send = MagicMock(return_value=_response(429))
+
+    response = limiter.send(send)
+
+    assert response.status_code == 429
+    assert send.call_count == 3
+
+def test_queueing_past_the_deadline_fails_without_reserving():
+    """Test that a caller whose wait would outlast its deadline fails at once and takes no budget."""
+    limiter = RateLimiter("test", requests_per_minute=2, max_wait=100)
+    limiter.reserve()
+    limiter.reserve()
+
+    with pytest.raises(DeadlineExceededError):
+        limiter.reserve(deadline=Deadline(5))
+    assert limiter.reserve() == pytest.approx(30, abs=0.5)
+
+@patch('sdr_assistant.utils.rate_limiter.time.sleep')
+def test_send_stops_retrying_when_backoff_outlasts_the_deadline(mock_sleep):
+    """Test that a Retry-After longer than the remaining deadline raises instead of sleeping."""
+    limiter = RateLimiter("test", requests_per_minute=600, max_retries=3, backoff_base=0.1)
+    send = MagicMock(return_value=_response(429, {"Retry-After": "30"}))
+
+    with pytest.raises(DeadlineExceededError):
+        limiter.send(send, deadline=Deadline(5))
+
+    assert send.call_count == 1
+    mock_sleep.assert_not_called()
+
+def test_retry_after_parsing():
+    """Test that Retry-After accepts seconds and HTTP dates."""
+    assert retry_after_seconds({"Retry-After": "5"}) == 5
+    assert retry_after_seconds({}) is None
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert retry_after_seconds({"Retry-After": format_datetime(later, usegmt=True)}) == pytest.approx(30, abs=2)
+
+def test_estimate_request_tokens():
+    """Test that the estimate covers the prompt and the completion budget."""
+    data = {"messages": [{"role": "user", "content": "x" * 400}], "max_tokens": 100}
+    assert estimate_request_tokens(data) == 200
@@ -0,0 +1,72 @@
+"""
+Tests for single-flight call coalescing.
+"""
+import threading
+import time
+import pytest
+from sdr_assistant.utils.singleflight import SingleFlight
+
+def _run_concurrently(count, target):
+    """Start count threads running target and wait for them to finish."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrent_callers_share_one_execution():
+    """Test that concurrent callers with the same key run the work once."""
+    group = SingleFlight()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return "result"
+
+    _run_concurrently(5, lambda: results.append(group.do("acme", work)))
+
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["result"] * 5
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert group.in_flight() == 0
+
+def test_error_propagates_to_followers():
+    """Test that every waiting caller receives the leader's exception."""
+    group = SingleFlight()
+    errors = []
+
+    def work():
+        time.sleep(0.1)
+        raise ValueError("provider failed")
+
+    def call():
+        try:
+            group.do("acme", work)
+        except ValueError as e:
+            errors.append(e)
+
+    _run_concurrently(3, call)
+
+    assert len(errors) == 3
+    assert all(str(e) == "provider failed" for e in errors)
+
+def test_follower_timeout():
+    """Test that a follower gives up after the timeout while the leader keeps running."""
+    group = SingleFlight()
+    started = threading.Event()
+
+    def work():
+        started.set()
+        time.sleep(0.3)
+        return "result"
+
+    leader = threading.Thread(target=lambda: group.do("acme", work))
+    leader.start()
+    started.wait()
+
+    with pytest.raises(TimeoutError):
+        group.do("acme", work, timeout=0.05)
+
+    leader.join()
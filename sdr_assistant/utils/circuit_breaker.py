@@ -0,0 +1,223 @@
+"""
+Circuit breaker for calls to external providers.
+Trips on a high error rate or slow-call rate so callers fail fast to their fallback
+paths while a provider is degraded, and probes with a few requests before closing again.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from ..utils.exceptions import CircuitOpenError
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker over a sliding window of recent calls."""
+
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5, slow_call_seconds: float = 30.0,
+                 slow_call_rate_threshold: float = 0.8, window_size: int = 20, minimum_calls: int = 10,
+                 open_seconds: float = 30.0, half_open_calls: int = 2):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Provider name, used in errors and stats
+            failure_rate_threshold: Share of failed calls in the window that opens the circuit
+            slow_call_seconds: Calls taking longer than this count as slow
+            slow_call_rate_threshold: Share of slow calls in the window that opens the circuit
+            window_size: Number of recent calls the rates are computed over
+            minimum_calls: Calls needed in the window before the circuit can open
+            open_seconds: How long the circuit stays open before probing
+            half_open_calls: Successful probes needed to close the circuit again
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+
+        self._state = CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def raise_if_open(self) -> None:
+        """
+        Fail fast while the circuit is open, without taking a probe slot.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._current_state(time.monotonic()) == OPEN:
+                self._rejected += 1
+                raise self._open_error()
+
+    def before_call(self) -> None:
+        """
+        Register the start of a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe slot taken
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+
+            if state == OPEN or (state == HALF_OPEN and self._probes_in_flight >= self.half_open_calls):
+                self._rejected += 1
+                raise self._open_error()
+
+            if state == HALF_OPEN:
+                self._probes_in_flight += 1
+
+    def after_call(self, duration: float, failed: bool) -> None:
+        """
+        Record the outcome of a call started with before_call.
+
+        Args:
+            duration: How long the call took, in seconds
+            failed: Whether the call failed
+        """
+        slow = duration > self.slow_call_seconds
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    self._trip()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_calls:
+                        print(f"🟢 {self.name} circuit closed")
+                        self._state = CLOSED
+                        self._window.clear()
+                return
+
+            if self._state == OPEN:
+                # A call that started before the circuit opened
+                return
+
+            self._window.append((failed, slow))
+            if len(self._window) >= self.minimum_calls:
+                failures = sum(1 for outcome in self._window if outcome[0]) / len(self._window)
+                slow_calls = sum(1 for outcome in self._window if outcome[1]) / len(self._window)
+                if failures >= self.failure_rate_threshold or slow_calls >= self.slow_call_rate_threshold:
+                    self._trip()
+
+    def cancel_call(self) -> None:
+        """Release a call started with before_call that was cancelled before it finished."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def call(self, fn: Callable[[], Any], is_failure: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Run a call through the breaker.
+
+        Args:
+            fn: Function making the call
+            is_failure: Optional check that marks a returned result as failed
+
+        Returns:
+            The result of fn
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = fn()
+        except Exception:
+            self.after_call(time.monotonic() - start, failed=True)
+            raise
+        self.after_call(time.monotonic() - start, failed=bool(is_failure and is_failure(result)))
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]],
+                         is_failure: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Asynchronous version of call()."""
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.cancel_call()
+            raise
+        except Exception:
+            self.after_call(time.monotonic() - start, failed=True)
+            raise
+        self.after_call(time.monotonic() - start, failed=bool(is_failure and is_failure(result)))
+        return result
+
+    def wrap(self, fn: Callable[[], Any], is_failure: Optional[Callable[[Any], bool]] = None) -> Callable[[], Any]:
+        """Return a function that runs fn through the breaker each time it is called."""
+        return lambda: self.call(fn, is_failure)
+
+    def wrap_async(self, fn: Callable[[], Awaitable[Any]],
+                   is_failure: Optional[Callable[[Any], bool]] = None) -> Callable[[], Awaitable[Any]]:
+        """Return a coroutine function that runs fn through the breaker each time it is called."""
+        return lambda: self.call_async(fn, is_failure)
+
+    def reset(self) -> None:
+        """Close the circuit and forget recent calls."""
+        with self._lock:
+            self._state = CLOSED
+            self._window.clear()
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the breaker state and the failure and slow-call rates of the window."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            calls = len(self._window)
+            return {
+                "state": state,
+                "calls": calls,
+                "failureRate": sum(1 for outcome in self._window if outcome[0]) / calls if calls else 0.0,
+                "slowCallRate": sum(1 for outcome in self._window if outcome[1]) / calls if calls else 0.0,
+                "rejected": self._rejected,
+                "retryIn": max(0.0, self._opened_at + self.open_seconds - now) if state == OPEN else 0.0
+            }
+
+    def _current_state(self, now: float) -> str:
+        """Move an open circuit to half-open once its open period has passed. Caller holds the lock."""
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        return self._state
+
+    def _trip(self) -> None:
+        """Open the circuit. Caller holds the lock."""
+        if self._state != OPEN:
+            print(f"🔴 {self.name} circuit opened")
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._window.clear()
+
+    def _open_error(self) -> CircuitOpenError:
+        """Error raised to callers while the circuit is open."""
+        return CircuitOpenError(
+            f"{self.name} circuit is open",
+            {"provider": self.name, "state": self._state}
+        )
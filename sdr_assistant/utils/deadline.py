@@ -0,0 +1,46 @@
+"""
+Request deadlines for interactive research generation.
+A deadline is set once at the route and passed down to every provider call, which
+uses the remaining budget as its timeout.
+"""
+import time
+from typing import Optional
+
+
+class Deadline:
+    """A point in time by which a request must finish."""
+
+    def __init__(self, seconds: float):
+        """
+        Initialize the deadline.
+
+        Args:
+            seconds: Budget from now, in seconds
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def cap(self, seconds: float) -> float:
+        """Limit a wait or timeout to the remaining budget."""
+        return min(seconds, self.remaining())
+
+
+def from_budget(seconds: Optional[float]) -> Optional[Deadline]:
+    """
+    Create a deadline from a configured budget.
+
+    Args:
+        seconds: Budget in seconds; None or 0 means no deadline
+
+    Returns:
+        Deadline instance, or None if there is no budget
+    """
+    return Deadline(seconds) if seconds else None
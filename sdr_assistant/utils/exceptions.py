@@ -28,6 +28,22 @@ class PerplexityAPIError(APIError):
     """Exception raised for Perplexity API errors."""
     pass
 
+class RateLimitError(APIError):
+    """Exception raised when a call would wait longer than allowed for provider rate budget."""
+    pass
+
+class CircuitOpenError(APIError):
+    """Exception raised when a provider call is rejected because its circuit breaker is open."""
+    pass
+
+class DeadlineExceededError(APIError):
+    """Exception raised when a provider call would start after the request deadline has passed."""
+    pass
+
+class StreamInterruptedError(APIError):
+    """Exception raised when a streamed provider response fails or ends before it is complete."""
+    pass
+
 # Authentication errors
 class AuthError(SDRAssistantError):
     """Base class for authentication-related errors."""
@@ -0,0 +1,247 @@
+"""
+Hedged requests for calls to external providers.
+When a call is slower than a percentile of recent latency, a duplicate is sent and
+the first successful response wins, trading a capped amount of extra load for a
+tighter latency tail.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+
+class Hedger:
+    """Thread-safe hedging policy for one provider, driven by a sliding window of recent latencies."""
+
+    def __init__(self, name: str, enabled: bool = False, percentile: float = 0.95, min_delay: float = 1.0,
+                 max_extra_load: float = 0.05, window_size: int = 200, minimum_samples: int = 20,
+                 max_workers: int = 32, max_calls: int = 128):
+        """
+        Initialize the hedger.
+
+        Args:
+            name: Provider name, used in logs and stats
+            enabled: Whether calls are hedged at all
+            percentile: Latency percentile (0-1) after which a duplicate is sent
+            min_delay: Shortest wait before hedging, in seconds
+            max_extra_load: Most hedges allowed as a share of recent calls
+            window_size: Number of recent calls latency and load are computed over
+            minimum_samples: Latency samples needed before any call is hedged
+            max_workers: Threads available to the duplicates of synchronous calls
+            max_calls: Threads available to the primary attempts of synchronous calls
+        """
+        self.name = name
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.minimum_samples = minimum_samples
+        self.max_workers = max_workers
+        self.max_calls = max_calls
+
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._hedged: Deque[bool] = deque(maxlen=window_size)
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._primary_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Get how long a call may run before it is hedged.
+
+        Returns:
+            Delay in seconds, or None if hedging is disabled or there are too few samples
+        """
+        with self._lock:
+            if not self.enabled or len(self._latencies) < self.minimum_samples:
+                return None
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+            return max(self.min_delay, ordered[index])
+
+    def record(self, duration: float) -> None:
+        """Record the latency of a completed call attempt."""
+        with self._lock:
+            self._latencies.append(duration)
+
+    def call(self, fn: Callable[[], Any], is_failure: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Run a call, sending a duplicate if it is slower than the hedge delay.
+
+        Once hedging is active, the primary attempt runs on a pool of max_calls
+        threads and the hedge delay is measured from when it starts running.
+        A running synchronous attempt cannot be interrupted: the one that loses
+        keeps its pooled connection and the rate-limit budget it reserved until
+        the provider answers, and only then is its response closed.
+
+        Args:
+            fn: Function making the call; must be safe to run twice
+            is_failure: Optional check that marks a returned result as failed, so the other attempt is awaited
+
+        Returns:
+            The first successful result, or the primary's result if both attempts fail
+        """
+        delay = self.hedge_delay()
+        if delay is None:
+            self._track(False)
+            return self._timed(fn)
+
+        primary, started = self._start(fn)
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            self._track(False)
+            return primary.result()
+        if not self._take_hedge():
+            return primary.result()
+
+        hedge = self._get_executor().submit(self._timed, fn)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and self._succeeded(future, is_failure):
+                    self._finish(future is hedge, list(pending))
+                    return future.result()
+
+        return primary.result()
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]],
+                         is_failure: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Asynchronous version of call(). The losing attempt is cancelled."""
+        delay = self.hedge_delay()
+        if delay is None:
+            self._track(False)
+            return await self._timed_async(fn)
+
+        primary = asyncio.ensure_future(self._timed_async(fn))
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done:
+            self._track(False)
+            return primary.result()
+        if not self._take_hedge():
+            return await primary
+
+        hedge = asyncio.ensure_future(self._timed_async(fn))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary, hedge):
+                    if task in done and self._succeeded(task, is_failure):
+                        self._finish(task is hedge, list(pending))
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current hedge delay and how many calls were hedged."""
+        delay = self.hedge_delay()
+        with self._lock:
+            calls = len(self._hedged)
+            return {
+                "enabled": self.enabled,
+                "hedgeDelay": delay,
+                "samples": len(self._latencies),
+                "extraLoad": sum(self._hedged) / calls if calls else 0.0,
+                "hedges": self._hedges,
+                "hedgeWins": self._hedge_wins
+            }
+
+    def _timed(self, fn: Callable[[], Any]) -> Any:
+        """Run fn and record its latency if it completes."""
+        start = time.monotonic()
+        result = fn()
+        self.record(time.monotonic() - start)
+        return result
+
+    def _start(self, fn: Callable[[], Any]) -> Tuple[Future, threading.Event]:
+        """
+        Submit the primary attempt of a call to the primary pool.
+
+        Primaries never queue behind hedges, which have a pool of their own.
+
+        Returns:
+            The attempt's future, and an event set once it starts running
+        """
+        started = threading.Event()
+
+        def run() -> Any:
+            started.set()
+            return self._timed(fn)
+
+        return self._get_executor(primary=True).submit(run), started
+
+    async def _timed_async(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn and record its latency if it completes."""
+        start = time.monotonic()
+        result = await fn()
+        self.record(time.monotonic() - start)
+        return result
+
+    def _track(self, hedged: bool) -> None:
+        """Count a call in the extra-load window."""
+        with self._lock:
+            self._hedged.append(hedged)
+
+    def _take_hedge(self) -> bool:
+        """Count a slow call and decide whether it may be hedged within the extra-load cap."""
+        with self._lock:
+            allowed = sum(self._hedged) + 1 <= self.max_extra_load * (len(self._hedged) + 1)
+            self._hedged.append(allowed)
+            if allowed:
+                self._hedges += 1
+                print(f"🔀 Hedging slow {self.name} request")
+            return allowed
+
+    def _finish(self, hedge_won: bool, losers: list) -> None:
+        """Record the winner and discard the losing attempts."""
+        with self._lock:
+            if hedge_won:
+                self._hedge_wins += 1
+
+        for loser in losers:
+            if not loser.cancel() and isinstance(loser, Future):
+                # A running thread cannot be stopped; release its response when it finishes
+                loser.add_done_callback(_close_result)
+
+    def _get_executor(self, primary: bool = False) -> ThreadPoolExecutor:
+        """Thread pool for the primary attempts or the duplicates of synchronous calls, created on first use."""
+        with self._lock:
+            if primary:
+                if self._primary_executor is None:
+                    self._primary_executor = ThreadPoolExecutor(
+                        max_workers=self.max_calls,
+                        thread_name_prefix=f"hedge-{self.name.lower()}-primary"
+                    )
+                return self._primary_executor
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"hedge-{self.name.lower()}"
+                )
+            return self._executor
+
+    @staticmethod
+    def _succeeded(future: Any, is_failure: Optional[Callable[[Any], bool]]) -> bool:
+        """Whether a finished attempt produced a usable result."""
+        if future.cancelled() or future.exception() is not None:
+            return False
+        return not (is_failure and is_failure(future.result()))
+
+
+def _close_result(future: Future) -> None:
+    """Close the response of an abandoned attempt, if it has one."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if callable(close):
+        close()
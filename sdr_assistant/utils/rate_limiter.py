@@ -0,0 +1,247 @@
+"""
+Token-bucket rate limiting for outbound provider calls.
+Callers queue for request and token budget instead of failing, and 429 responses
+are retried after Retry-After or a jittered exponential backoff.
+"""
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+from ..utils.deadline import Deadline
+from ..utils.exceptions import DeadlineExceededError, RateLimitError
+
+
+# Completion budget assumed when a request does not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 1000
+
+
+class _Bucket:
+    """A per-minute budget that refills continuously. Not thread-safe on its own."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until `amount` is available, given earlier reservations."""
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+
+class RateLimiter:
+    """Thread-safe requests-per-minute and tokens-per-minute limiter for one provider."""
+
+    def __init__(self, name: str, requests_per_minute: float, tokens_per_minute: float = 0,
+                 max_wait: float = 10.0, max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 10.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            name: Provider name, used in errors and stats
+            requests_per_minute: Request budget; 0 disables request limiting
+            tokens_per_minute: Token budget; 0 disables token limiting
+            max_wait: Longest a caller may queue for budget, in seconds
+            max_retries: Retries after a 429 before it is returned to the caller
+            backoff_base: Base delay of the exponential backoff, in seconds
+            backoff_max: Maximum backoff delay, in seconds
+        """
+        self.name = name
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0, deadline: Optional[Deadline] = None) -> float:
+        """
+        Reserve budget for one request.
+
+        Budget is taken immediately, so concurrent callers queue behind each
+        other in the order they reserved. Nothing is reserved if the caller
+        could not send before its deadline.
+
+        Args:
+            tokens: Estimated tokens the request will use
+            deadline: Request deadline the call must finish by, if any
+
+        Returns:
+            Seconds the caller must wait before sending
+
+        Raises:
+            DeadlineExceededError: If the wait would outlast the deadline
+            RateLimitError: If the wait would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_for(amount))
+
+            if deadline is not None and wait >= deadline.remaining():
+                raise DeadlineExceededError(
+                    f"{self.name} rate limit: request would wait {wait:.1f}s, past the request deadline",
+                    {"provider": self.name, "wait": wait, "budget": deadline.budget}
+                )
+
+            if wait > self.max_wait:
+                raise RateLimitError(
+                    f"{self.name} rate limit: request would wait {wait:.1f}s",
+                    {"provider": self.name, "wait": wait}
+                )
+
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= min(tokens, self._tokens.capacity)
+
+            return wait
+
+    def acquire(self, tokens: int = 0, deadline: Optional[Deadline] = None) -> None:
+        """Block until the request may be sent; see reserve()."""
+        wait = self.reserve(tokens, deadline)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 0, deadline: Optional[Deadline] = None) -> None:
+        """Wait, without blocking the event loop, until the request may be sent; see reserve()."""
+        wait = self.reserve(tokens, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def send(self, send: Callable[[], Any], tokens: int = 0, deadline: Optional[Deadline] = None) -> Any:
+        """
+        Send a request within budget, retrying 429 responses.
+
+        Args:
+            send: Function that sends the request and returns the response
+            tokens: Estimated tokens the request will use
+            deadline: Request deadline the call must finish by, if any
+
+        Returns:
+            The first non-429 response, or the last 429 once retries run out
+
+        Raises:
+            DeadlineExceededError: If queueing or a 429 backoff would outlast the deadline
+            RateLimitError: If the request would queue longer than max_wait
+        """
+        attempt = 0
+        while True:
+            self.acquire(tokens, deadline)
+            response = send()
+
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            response.close()
+            self._back_off(response, attempt)
+            attempt += 1
+
+    async def send_async(self, send: Callable[[], Awaitable[Any]], tokens: int = 0,
+                         deadline: Optional[Deadline] = None) -> Any:
+        """Asynchronous version of send() for httpx responses."""
+        attempt = 0
+        while True:
+            await self.acquire_async(tokens, deadline)
+            response = await send()
+
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            await response.aclose()
+            self._back_off(response, attempt)
+            attempt += 1
+
+    def _back_off(self, response: Any, attempt: int) -> None:
+        """Pause every caller after a 429, for Retry-After or a jittered backoff."""
+        retry_after = retry_after_seconds(response.headers)
+        if retry_after is None:
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+        else:
+            # Spread retries so callers released together do not collide again
+            delay = retry_after + random.uniform(0, self.backoff_base)
+
+        print(f"⏳ {self.name} rate limited (429); retrying in {delay:.1f}s")
+        self.pause(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds`, e.g. after the provider returned 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct the token budget once the real usage of a request is known."""
+        if self._tokens is None or actual_tokens is None:
+            return
+
+        with self._lock:
+            self._tokens.refill(time.monotonic())
+            reserved = min(estimated_tokens, self._tokens.capacity)
+            self._tokens.level = min(self._tokens.capacity, self._tokens.level + reserved - actual_tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the remaining budget of each bucket."""
+        with self._lock:
+            now = time.monotonic()
+            data = {"pausedFor": max(0.0, self._paused_until - now)}
+            for key, bucket in (("requests", self._requests), ("tokens", self._tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    data[key] = {"perMinute": bucket.capacity, "available": bucket.level}
+            return data
+
+
+def estimate_request_tokens(data: Mapping[str, Any]) -> int:
+    """
+    Estimate the tokens a chat completion request will use.
+
+    Uses roughly four characters per prompt token plus the completion budget.
+    """
+    prompt_chars = sum(len(message.get("content", "")) for message in data.get("messages", []))
+    return prompt_chars // 4 + int(data.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,77 @@
+"""
+Single-flight call coalescing for the SDR Assistant application.
+Concurrent callers asking for the same key share one execution of the work.
+"""
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    """An in-flight call that followers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single execution."""
+
+    def __init__(self):
+        """Initialize an empty group of in-flight calls."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        The first caller executes fn; callers arriving while it runs wait for
+        its outcome. If fn raises, every waiting caller receives the same exception.
+
+        Args:
+            key: Key identifying the work
+            fn: Zero-argument callable performing the work
+            timeout: Maximum time in seconds a follower waits for the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True for followers
+
+        Raises:
+            TimeoutError: If a follower waits longer than timeout
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.followers += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out after {timeout}s waiting for in-flight call '{key}'")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being executed."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,144 @@
+"""
+Research worker processes for the durable job queue.
+
+Each process claims research jobs from the SQLite queue, runs
+ResearchManager.generate_research and stores the result, so generation is
+isolated from the web tier and survives web deploys and crashes.
+
+Run with:
+    python -m sdr_assistant.worker --processes 4
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from sdr_assistant.config.settings import settings
+from sdr_assistant.core.job_queue import get_job_queue
+from sdr_assistant.models.job import Job
+
+
+RESEARCH_JOB = "research"
+
+# Seconds between deletions of finished jobs older than RESEARCH_QUEUE_RETENTION
+PURGE_INTERVAL = 3600
+
+
+def run_research_job(job: Job) -> Dict[str, Any]:
+    """Run a research generation job."""
+    from sdr_assistant.core.research import research_manager
+
+    return research_manager.generate_research(
+        job.payload["accountName"],
+        force_refresh=job.payload.get("forceRefresh", False)
+    )
+
+
+# Handlers for each job kind
+JOB_HANDLERS: Dict[str, Callable[[Job], Dict[str, Any]]] = {
+    RESEARCH_JOB: run_research_job
+}
+
+
+def run_worker(worker_id: str, poll_interval: float, lease_seconds: float) -> None:
+    """
+    Claim and run jobs until asked to stop.
+
+    Args:
+        worker_id: Identifier recorded on claimed jobs
+        poll_interval: Seconds to sleep when the queue is empty
+        lease_seconds: Lease length; renewed by a heartbeat while a job runs
+    """
+    queue = get_job_queue()
+    stopping = threading.Event()
+
+    def request_stop(signum, frame):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    print(f"Worker {worker_id} started")
+    purged_at = 0.0
+
+    while not stopping.is_set():
+        job = queue.claim(worker_id, lease_seconds)
+        if job is None:
+            if time.monotonic() - purged_at >= PURGE_INTERVAL:
+                purged_at = time.monotonic()
+                purged = queue.purge_finished(settings.RESEARCH_QUEUE_RETENTION)
+                if purged:
+                    print(f"🧹 Deleted {purged} finished jobs")
+            stopping.wait(poll_interval)
+            continue
+
+        handler = JOB_HANDLERS.get(job.kind)
+        if handler is None:
+            queue.fail(job.id, worker_id, f"Unknown job kind '{job.kind}'")
+            continue
+
+        finished = threading.Event()
+
+        def heartbeat():
+            while not finished.wait(lease_seconds / 3):
+                queue.heartbeat(job.id, worker_id, lease_seconds)
+
+        heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+        heartbeat_thread.start()
+
+        try:
+            owned = queue.complete(job.id, worker_id, handler(job))
+        except Exception as e:
+            print(f"Error running job {job.id}: {str(e)}")
+            owned = queue.fail(job.id, worker_id, str(e))
+        finally:
+            finished.set()
+            heartbeat_thread.join()
+
+        if not owned:
+            print(f"⚠️ Lease on job {job.id} expired and it was reclaimed; discarded this worker's outcome")
+
+    print(f"Worker {worker_id} stopped")
+
+
+def main() -> None:
+    """Start a pool of worker processes and wait for them to exit."""
+    parser = argparse.ArgumentParser(description="Run research worker processes")
+    parser.add_argument("--processes", type=int, default=settings.RESEARCH_WORKER_PROCESSES,
+                        help="Number of worker processes")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="Seconds to wait when the queue is empty")
+    parser.add_argument("--lease", type=float, default=settings.RESEARCH_QUEUE_LEASE,
+                        help="Seconds a claimed job stays leased without a heartbeat")
+    args = parser.parse_args()
+
+    host = socket.gethostname()
+    processes = []
+    for index in range(args.processes):
+        worker_id = f"{host}-{os.getpid()}-{index}"
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(worker_id, args.poll_interval, args.lease),
+            name=f"research-worker-{index}"
+        )
+        process.start()
+        processes.append(process)
+
+    def forward_stop(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, forward_stop)
+    signal.signal(signal.SIGINT, forward_stop)
+
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()